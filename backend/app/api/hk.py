@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+import json
+from fastapi import APIRouter, HTTPException, Query, Depends, Header, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from app.api.auth import get_current_user
@@ -11,6 +13,7 @@ from app.models.theme_models import (
     ThemesResponse,
 )
 from app.models.plan_models import PlanCreateRequest
+from app.models.search_models import BatchSearchRequest, PlaceBatchRequest
 from app.models.route_models import (
     RouteRequest,
     RouteResponse,
@@ -35,15 +38,48 @@ wishlist_service = WishlistService()
 
 @router.get("/refresh-section/")
 async def refresh_section(
+    request: Request,
     section_type: str = Query(..., description="섹션 타입"),
     limit: int = Query(6, description="제한 개수")
 ):
-    """섹션 데이터 새로고침"""
+    """섹션 데이터 새로고침 (결과가 같으면 304, ETag는 본문 해시)"""
+    from app.core.http_cache import SECTION_CACHE_CONTROL, conditional_json
     from app.services.tour_service import TourService
     tour_service = TourService()
     try:
         result = await tour_service.refresh_section(section_type, limit)
-        return result
+        return conditional_json(request, result, cache_control=SECTION_CACHE_CONTROL)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/home")
+async def get_home_feed(
+    request: Request,
+    variant: Optional[int] = Query(None, ge=0, description="섹션 변형 번호 (없으면 랜덤, 응답의 variant를 다시 보내면 같은 구성)"),
+):
+    """
+    홈 피드 (모든 섹션을 미리 만들어 둔 스냅샷에서 응답).
+    - sections: section_type → refresh-section과 같은 형식 ({section_type, places, count, ...})
+    - ETag는 변형 번호 + 섹션 내용 해시 기준 (스냅샷을 만들 때 계산, 워커/재시작과 무관)
+    """
+    import asyncio
+    from app.core.http_cache import HOME_CACHE_CONTROL, conditional_json
+    from app.services.home_feed_service import home_feed_builder
+
+    try:
+        snapshot = home_feed_builder.snapshot or await asyncio.to_thread(home_feed_builder.wait_ready)
+        if not snapshot:
+            raise HTTPException(status_code=503, detail="홈 피드를 준비 중입니다")
+        feed = home_feed_builder.pick(snapshot, variant)
+        return conditional_json(
+            request,
+            feed,
+            cache_control=HOME_CACHE_CONTROL,
+            etag=snapshot.etags.get(feed["variant"]),
+            last_modified=snapshot.built_at,
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -53,7 +89,8 @@ async def search_places(
     page: int = Query(1, description="페이지 번호"),
     limit: int = Query(10, description="페이지당 개수"),
     region: Optional[str] = Query(None, description="시도 (예: 서울, 경기)"),
-    district: Optional[str] = Query(None, description="구/군 (예: 강남구, 수원시)")
+    district: Optional[str] = Query(None, description="구/군 (예: 강남구, 수원시)"),
+    category: Optional[str] = Query(None, description="카테고리 (로컬 검색 필터)"),
 ):
     """장소 검색"""
     from app.services.place_service import PlaceService
@@ -68,7 +105,8 @@ async def search_places(
             page, 
             limit, 
             region, 
-            district
+            district,
+            category,
         )
         return result
     except HTTPException:
@@ -77,6 +115,111 @@ async def search_places(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/search/cursor")
+async def search_places_paged(
+    keyword: Optional[str] = Query(None, description="검색 키워드"),
+    limit: int = Query(10, ge=1, le=50, description="페이지당 개수"),
+    region: Optional[str] = Query(None, description="시도 (예: 서울, 경기)"),
+    district: Optional[str] = Query(None, description="구/군 (예: 강남구, 수원시)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+):
+    """
+    커서 기반 장소 검색
+    - 병합/지역 필터/중복 제거 후에도 limit개를 채울 때까지 provider 다음 페이지를 조회
+    - 다음 페이지는 next_cursor로 요청 (같은 검색 조건 필요)
+    """
+    from app.services.place_service import PlaceService
+    place_service = PlaceService()
+    try:
+        if not keyword and not region and not district:
+            raise HTTPException(status_code=400, detail="검색 키워드 또는 지역을 입력해주세요.")
+
+        return await place_service.search_places_paged(
+            keyword or "",
+            limit,
+            region,
+            district,
+            cursor,
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search/stream")
+async def search_places_stream(
+    keyword: Optional[str] = Query(None, description="검색 키워드"),
+    page: int = Query(1, description="페이지 번호"),
+    limit: int = Query(10, description="페이지당 개수"),
+    region: Optional[str] = Query(None, description="시도 (예: 서울, 경기)"),
+    district: Optional[str] = Query(None, description="구/군 (예: 강남구, 수원시)"),
+    category: Optional[str] = Query(None, description="카테고리 (로컬 검색 필터)"),
+):
+    """
+    장소 검색 (Server-Sent Events)
+    - event: results / data: {stage, places, total, final, ...}
+    - stage: local/cached(즉시 최종) → kakao 또는 tour(먼저 끝난 provider) → merged(최종)
+    - places[].key는 단계가 바뀌어도 유지되는 ID (클라이언트 목록 갱신용)
+    """
+    from app.services.place_service import PlaceService
+    place_service = PlaceService()
+    if not keyword and not region and not district:
+        raise HTTPException(status_code=400, detail="검색 키워드 또는 지역을 입력해주세요.")
+
+    async def event_stream():
+        try:
+            async for event in place_service.search_places_stream(
+                keyword or "", page, limit, region, district, category
+            ):
+                yield f"event: results\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)}, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/search/batch")
+async def search_places_batch(request: BatchSearchRequest):
+    """
+    여러 키워드/지역 검색을 한 번에 처리
+    - 같은 조건은 한 번만 검색, 로컬 인덱스/캐시로 처리되지 않는 검색만 외부 API로 동시 호출
+    - results는 입력 순서대로 반환 (각 항목의 key = 요청 key 또는 입력 위치)
+    """
+    from app.services.place_service import PlaceService
+    place_service = PlaceService()
+    try:
+        return await place_service.search_places_batch(
+            [q.model_dump() for q in request.queries]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search/suggest")
+async def suggest_search(
+    q: str = Query(..., description="입력 중인 검색어 (초성 입력 지원, 예: ㄱㄹㅈㅇ)"),
+    limit: int = Query(10, ge=1, le=20, description="최대 개수"),
+):
+    """검색어 자동완성 (장소명 + 인기 검색어)"""
+    from app.services.suggest_service import suggest_index
+    try:
+        return {
+            "query": q,
+            "suggestions": suggest_index.suggest(q, limit),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/places/viewport")
 async def search_places_in_viewport(
     sw_lat: float = Query(..., description="남서쪽 위도"),
@@ -86,11 +229,14 @@ async def search_places_in_viewport(
     category: Optional[str] = Query(None, description="카테고리 (food/cafe/spot 등)"),
     limit: int = Query(50, description="최대 개수"),
     include_external: bool = Query(False, description="외부 API(Tour/Kakao)로 결과 보강 여부"),
+    cluster: bool = Query(False, description="클러스터 응답 여부 (낮은 줌에서 사용)"),
+    zoom: Optional[int] = Query(None, ge=0, le=22, description="지도 줌 레벨 (없으면 뷰포트 폭으로 추정)"),
 ):
     """
     지도 뷰포트(위경도 박스) 기준 장소 검색.
     - 기본적으로 MongoDB places 컬렉션에서만 조회 (DB 우선).
-    - include_external=True 일 때, 결과가 부족하면 Tour/Kakao 기반 search_places 결과를 재사용하여 보강.
+    - include_external=True 일 때, 결과가 부족하면 뷰포트 범위 Kakao 카테고리 검색(rect) / TourAPI 위치 기반 목록으로 보강.
+    - cluster=True 일 때, clusters(중심 좌표/개수/대표 장소) + places(단독 장소)로 응답 (최대 200개 셀)
     """
     from app.services.place_service import PlaceService
 
@@ -104,6 +250,8 @@ async def search_places_in_viewport(
             category=category,
             limit=limit,
             include_external=include_external,
+            cluster=cluster,
+            zoom=zoom,
         )
         return result
     except HTTPException:
@@ -111,18 +259,118 @@ async def search_places_in_viewport(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.post("/places/batch")
+async def get_places_batch(request: PlaceBatchRequest):
+    """
+    여러 장소 상세를 한 번에 조회 (플랜/위시리스트/테마 페이지)
+    - ids: place_id 또는 place_ref (최대 100개), fields: 반환할 필드 (선택)
+    - places: 요청 ID → 장소 (못 찾으면 null), missing: 못 찾은 ID 목록
+    """
+    from app.services.place_service import PlaceService
+    place_service = PlaceService()
+    try:
+        return await place_service.get_places_batch(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/places/tiles/{z}/{x}/{y}.mvt")
+async def get_place_tile(z: int, x: int, y: int):
+    """
+    장소 핀 벡터 타일 (Mapbox Vector Tile, 레이어 "places").
+    - 피처 속성: place_id / category / rating / has_thumbnail
+    - 상세 정보는 /place/{place_id}로 조회
+    """
+    from app.core.mvt import tile_in_range
+    from app.services.place_tile_service import MVT_CACHE_CONTROL, MVT_MAX_ZOOM, place_tile_service
+
+    if not tile_in_range(z, x, y, max_zoom=MVT_MAX_ZOOM):
+        raise HTTPException(status_code=400, detail="잘못된 타일 좌표입니다")
+    try:
+        content = place_tile_service.get_tile(z, x, y)
+        return Response(
+            content=content,
+            media_type="application/vnd.mapbox-vector-tile",
+            headers={"Cache-Control": MVT_CACHE_CONTROL},
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/images/{token}")
+async def get_place_image(
+    token: str,
+    w: Optional[int] = Query(None, ge=1, le=4096, description="요청 너비 (160/320/640/1280 중 같거나 큰 값으로 맞춤)"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    장소 이미지 프록시 (Google Places 사진 / TourAPI 이미지 → 표준 너비 WebP).
+    - 장소 응답의 image / imageUrl / google_photos[].url이 이 경로를 가리킴
+    - 같은 토큰+너비의 이미지는 바뀌지 않으므로 장기 캐시 + ETag(If-None-Match 시 304)
+    """
+    import asyncio
+    from app.services.image_proxy_service import IMAGE_CACHE_CONTROL, image_proxy_service
+
+    etag = image_proxy_service.etag_for(token, w)
+    if not etag:
+        raise HTTPException(status_code=400, detail="잘못된 이미지 토큰입니다")
+    headers = {"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL}
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+    try:
+        image = await asyncio.to_thread(image_proxy_service.get_image, token, w)
+        return Response(content=image.data, media_type=image.media_type, headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/place/{place_id}")
-async def get_place_detail(place_id: str):
-    """장소 상세 정보"""
+async def get_place_detail(place_id: str, request: Request):
+    """
+    장소 상세 정보 (place_id 또는 place_ref, 예: "tour:126508" / "kakao:8217321").
+    - ETag(본문 해시) / If-None-Match 일치 시 304
+    """
+    from app.core.http_cache import PLACE_CACHE_CONTROL, conditional_json
     from app.services.place_service import PlaceService
     place_service = PlaceService()
     try:
         result = await place_service.get_place_detail(place_id)
         if not result:
             raise HTTPException(status_code=404, detail="Place not found")
+        return conditional_json(request, result, cache_control=PLACE_CACHE_CONTROL)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/place/{place_id}/nearby")
+async def get_nearby_places(
+    place_id: str,
+    k: int = Query(10, ge=1, le=30, description="최대 개수"),
+    category: Optional[str] = Query(None, description="카테고리 (food/cafe/spot/stay/shopping)"),
+    ranked: bool = Query(True, description="평점/리뷰 반영 재정렬 여부 (False면 거리순)"),
+):
+    """
+    상세 페이지 주변 장소 (DB + 공간 인덱스만 사용, 외부 API 호출 없음).
+    - 각 장소에 distance_m(기준 장소로부터 거리) 포함
+    """
+    from app.services.place_service import PlaceService
+
+    place_service = PlaceService()
+    try:
+        result = await place_service.get_nearby_places(place_id, k=k, category=category, ranked=ranked)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Place not found")
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -235,15 +483,26 @@ async def remove_from_wishlist(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/plan/{plan_id}")
-async def get_plan(plan_id: str):
-    """여행 계획 조회"""
+async def get_plan(plan_id: str, request: Request):
+    """
+    여행 계획 조회.
+    - ETag / Last-Modified는 플랜의 updated_at(없으면 created_at) 기준, 일치하면 본문 없이 304
+    """
+    from app.core.http_cache import PLAN_CACHE_CONTROL, conditional_json, latest, version_etag
     from app.services.tour_service import TourService
     tour_service = TourService()
     try:
         result = await tour_service.get_plan(plan_id)
         if not result:
             raise HTTPException(status_code=404, detail="Plan not found")
-        return result
+        last_modified = latest(result.get("updated_at"), result.get("created_at"))
+        return conditional_json(
+            request,
+            result,
+            cache_control=PLAN_CACHE_CONTROL,
+            etag=version_etag("plan", result["_id"], last_modified.isoformat()) if last_modified else None,
+            last_modified=last_modified,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -281,13 +540,17 @@ async def delete_plan(plan_id: str):
 
 @router.get("/plans")
 async def get_user_plans(
-    page: int = Query(1, description="페이지 번호"),
+    page: int = Query(1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     limit: int = Query(10, description="페이지당 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    view: str = Query("full", description="full: 전체 문서 / summary: 목록용 요약 (items 대신 items_count)"),
+    include_total: bool = Query(True, description="전체 개수(total) 포함 여부 (cursor 요청은 첫 페이지에서 센 값)"),
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     """
     현재 로그인한 사용자의 여행 계획 목록
     (토큰에서 user_id를 추출하여 사용)
+    - cursor 기반 페이지네이션 지원 (응답의 next_cursor를 다음 요청에 전달)
     """
     from app.services.tour_service import TourService
     tour_service = TourService()
@@ -297,10 +560,19 @@ async def get_user_plans(
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid user")
 
-        result = await tour_service.get_user_plans(user_id, page, limit)
+        result = await tour_service.get_user_plans(
+            user_id,
+            page,
+            limit,
+            cursor=cursor,
+            view=view,
+            include_total=include_total,
+        )
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -331,19 +603,28 @@ async def create_theme(
 
 
 @router.get("/themes", response_model=ThemesResponse)
-async def get_themes():
-    """테마 목록 조회"""
+async def get_themes(request: Request):
+    """테마 목록 조회 (ETag: 본문 해시, 일치하면 304)"""
+    from app.core.http_cache import THEME_CACHE_CONTROL, conditional_json
     try:
-        return await theme_service.get_themes()
+        themes = await theme_service.get_themes()
+        return conditional_json(request, themes, cache_control=THEME_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/themes/{theme_id}", response_model=ThemeResponse)
-async def get_theme(theme_id: str):
-    """특정 테마 조회"""
+async def get_theme(theme_id: str, request: Request):
+    """특정 테마 조회 (ETag: 본문 해시, Last-Modified: 수정/생성 시각)"""
+    from app.core.http_cache import THEME_CACHE_CONTROL, conditional_json, latest
     try:
-        return await theme_service.get_theme(theme_id)
+        theme = await theme_service.get_theme(theme_id)
+        return conditional_json(
+            request,
+            theme,
+            cache_control=THEME_CACHE_CONTROL,
+            last_modified=latest(theme.updated_at, theme.created_at),
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -26,16 +26,20 @@ class KakaoAPI:
         page: int = 1, 
         limit: int = 10,
         region: Optional[str] = None,
-        district: Optional[str] = None
+        district: Optional[str] = None,
+        rect: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """키워드 기반 장소 검색 (지역 필터링 지원)"""
+        """
+        키워드 기반 장소 검색 (지역 필터링 지원)
+        - rect: 검색 범위 사각형 "min_x,min_y,max_x,max_y" (있으면 범위 밖 결과는 Kakao에서 제외)
+        """
         headers = self._get_headers()
         
-        # 쿼리 구성: 키워드 + 지역
+        # 쿼리 구성: 키워드 + 지역 (rect로 범위를 제한하면 시도명은 키워드가 없을 때만 사용)
         query_parts = []
         if keyword:
             query_parts.append(keyword)
-        if region:
+        if region and not (rect and keyword):
             query_parts.append(region)
         if district:
             query_parts.append(district)
@@ -45,11 +49,38 @@ class KakaoAPI:
             "page": page,
             "size": limit
         }
+        if rect:
+            params["rect"] = rect
         
         response = self.client.get(f"{self.base_url}/local/search/keyword.json", params=params, headers=headers)
         response.raise_for_status()
         return response.json()
     
+    def search_category(
+        self,
+        category_group_code: str,
+        rect: Optional[str] = None,
+        page: int = 1,
+        limit: int = 15,
+    ) -> Dict[str, Any]:
+        """
+        카테고리 그룹 코드 기반 장소 검색 (FD6 음식점, CE7 카페, AT4 관광명소, AD5 숙박 등)
+        - rect: 검색 범위 사각형 "min_x,min_y,max_x,max_y" (범위 안의 결과만 반환)
+        """
+        headers = self._get_headers()
+
+        params = {
+            "category_group_code": category_group_code,
+            "page": page,
+            "size": limit,
+        }
+        if rect:
+            params["rect"] = rect
+
+        response = self.client.get(f"{self.base_url}/local/search/category.json", params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
     def search_accommodation_near(
         self,
         lat: float,
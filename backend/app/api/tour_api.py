@@ -18,9 +18,14 @@ class TourAPI:
         limit: int = 10,
         region: Optional[str] = None,
         district: Optional[str] = None,
-        contentTypeId: Optional[str] = None
+        contentTypeId: Optional[str] = None,
+        sigunguCode: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """장소 검색 (지역 필터링 및 카테고리 필터링 지원)"""
+        """
+        장소 검색 (지역 필터링 및 카테고리 필터링 지원)
+        - region: TourAPI areaCode (지역명이 아닌 코드, 예: "1"=서울)
+        - sigunguCode: 구군 코드 (region과 함께 사용)
+        """
         if not self.api_key:
             raise ValueError("TourAPI key not configured")
         
@@ -45,14 +50,19 @@ class TourAPI:
             # KorService2에서는 areaBasedList2 또는 areaBasedList 사용
             endpoint = f"{self.base_url}/areaBasedList2"
         elif keyword:
-            # 키워드가 있으면 키워드 검색
+            # 키워드가 있으면 키워드 검색 (지역 코드가 있으면 TourAPI에서 바로 필터링)
             params["keyword"] = keyword
+            if region:
+                params["areaCode"] = region
             endpoint = f"{self.base_url}/searchKeyword2"
         else:
-            # 키워드도 없고 contentTypeId도 없으면 기본 검색 (서울 지역 전체)
-            params["areaCode"] = "1"  # 기본값: 서울
+            # 키워드도 없고 contentTypeId도 없으면 지역 기반 목록 (기본값: 서울 지역 전체)
+            params["areaCode"] = region if region else "1"
             endpoint = f"{self.base_url}/areaBasedList2"
         
+        if sigunguCode and params.get("areaCode"):
+            params["sigunguCode"] = sigunguCode
+        
         # 디버깅: 실제 호출되는 URL 로깅
         import logging
         logger = logging.getLogger(__name__)
@@ -81,6 +91,41 @@ class TourAPI:
             response_text = response.text[:500]
             raise ValueError(f"TourAPI Response is not JSON. Content: {response_text}")
     
+    def search_location(
+        self,
+        lat: float,
+        lng: float,
+        radius: int = 5000,
+        page: int = 1,
+        limit: int = 20,
+        contentTypeId: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        좌표 주변 장소 목록 (locationBasedList2, 가까운 순)
+        - radius: 검색 반경 (미터, 최대 20000)
+        """
+        if not self.api_key:
+            raise ValueError("TourAPI key not configured")
+
+        params = {
+            "serviceKey": self.api_key,
+            "pageNo": page,
+            "numOfRows": limit,
+            "MobileOS": "ETC",
+            "MobileApp": "Jiobi",
+            "_type": "json",
+            "mapX": lng,
+            "mapY": lat,
+            "radius": min(int(radius), 20000),
+            "arrange": "E",  # 거리순
+        }
+        if contentTypeId:
+            params["contentTypeId"] = contentTypeId
+
+        response = self.client.get(f"{self.base_url}/locationBasedList2", params=params)
+        response.raise_for_status()
+        return response.json()
+
     def get_area_code(self, area_code: Optional[str] = None) -> Dict[str, Any]:
         """지역 코드 조회"""
         if not self.api_key:
@@ -88,6 +133,7 @@ class TourAPI:
         
         params = {
             "serviceKey": self.api_key,
+            "numOfRows": 100,  # 시도별 구군 전체 (기본값 10개)
             "MobileOS": "ETC",
             "MobileApp": "Jiobi",
             "_type": "json"
@@ -101,68 +147,58 @@ class TourAPI:
         response.raise_for_status()
         return response.json()
     
-    def get_place_detail(self, content_id: str) -> Dict[str, Any]:
-        """장소 상세 정보 조회 (contentid 기준)"""
+    def _detail_params(self, content_id: str) -> Dict[str, Any]:
         if not self.api_key:
             raise ValueError("TourAPI key not configured")
-        
-        params = {
+        return {
             "serviceKey": self.api_key,
             "contentId": content_id,
             "MobileOS": "ETC",
             "MobileApp": "Jiobi",
             "_type": "json"
         }
-        
-        # 상세 정보 조회 (기본 정보) - KorService2에서는 detailCommon2 사용
-        detail_response = self.client.get(f"{self.base_url}/detailCommon2", params=params)
-        detail_response.raise_for_status()
-        detail_data = detail_response.json()
-        
-        # 소개 정보 조회 (추가 정보) - KorService2에서는 detailIntro2 사용
-        intro_params = params.copy()
-        intro_params.pop("contentId", None)
-        intro_params["contentId"] = content_id
-        intro_params["contentTypeId"] = detail_data.get("response", {}).get("body", {}).get("items", {}).get("item", [{}])[0].get("contenttypeid", "")
-        
+
+    def get_detail_common(self, content_id: str) -> Dict[str, Any]:
+        """공통 정보 조회 (detailCommon2, contenttypeid 포함)"""
+        response = self.client.get(f"{self.base_url}/detailCommon2", params=self._detail_params(content_id))
+        response.raise_for_status()
+        return response.json()
+
+    def get_detail_intro(self, content_id: str, content_type_id: str) -> Dict[str, Any]:
+        """소개 정보 조회 (detailIntro2, contentTypeId 필수)"""
+        params = self._detail_params(content_id)
+        params["contentTypeId"] = content_type_id
+        response = self.client.get(f"{self.base_url}/detailIntro2", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def get_place_detail(self, content_id: str) -> Dict[str, Any]:
+        """장소 상세 정보 조회 (contentid 기준, 공통 정보 → 소개 정보 순서로 조회 후 병합)"""
+        import logging
+        logger = logging.getLogger(__name__)
+
+        detail_data = self.get_detail_common(content_id)
+        detail_item = (detail_data.get("response", {}).get("body", {}).get("items", {}) or {}).get("item", [{}])
+        detail_item = (detail_item[0] if isinstance(detail_item, list) and detail_item else detail_item) or {}
+
         try:
-            intro_response = self.client.get(f"{self.base_url}/detailIntro2", params=intro_params)
-            intro_response.raise_for_status()
-            intro_data = intro_response.json()
-            
-            # 두 결과 병합
-            detail_item = detail_data.get("response", {}).get("body", {}).get("items", {}).get("item", [{}])[0]
-            intro_item = intro_data.get("response", {}).get("body", {}).get("items", {}).get("item", [{}])[0]
-            
-            # 병합된 데이터 반환 (detail_item을 기준으로 intro_item의 필드 추가)
-            merged_item = {**detail_item, **intro_item}
-            
-            # 디버깅: 병합된 데이터 로깅 (더 자세한 정보)
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"TourAPI 상세 정보 병합: contentid={merged_item.get('contentid')}, title={merged_item.get('title')}")
-            logger.info(f"  - tel: {merged_item.get('tel')}")
-            logger.info(f"  - homepage: {merged_item.get('homepage')}")
-            logger.info(f"  - usetime: {merged_item.get('usetime')}")
-            logger.info(f"  - restdate: {merged_item.get('restdate')}")
-            logger.info(f"  - parking: {merged_item.get('parking')}")
-            logger.info(f"  - infocenter: {merged_item.get('infocenter')}")
-            logger.info(f"  - firstmenu: {merged_item.get('firstmenu')}")
-            logger.info(f"  - overview: {bool(merged_item.get('overview'))}")
-            
-            return {
-                "response": {
-                    "body": {
-                        "items": {
-                            "item": [merged_item]
-                        }
-                    }
-                }
-            }
+            intro_data = self.get_detail_intro(content_id, detail_item.get("contenttypeid", ""))
+            intro_item = (intro_data.get("response", {}).get("body", {}).get("items", {}) or {}).get("item", [{}])
+            intro_item = (intro_item[0] if isinstance(intro_item, list) and intro_item else intro_item) or {}
         except Exception as e:
             # 소개 정보 조회 실패 시 기본 정보만 반환
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"detailIntro2 조회 실패: {str(e)}, 기본 정보만 반환")
             return detail_data
 
+        # 병합된 데이터 반환 (detail_item을 기준으로 intro_item의 필드 추가)
+        merged_item = {**detail_item, **intro_item}
+        logger.info(f"TourAPI 상세 정보 병합: contentid={merged_item.get('contentid')}, title={merged_item.get('title')}")
+        return {
+            "response": {
+                "body": {
+                    "items": {
+                        "item": [merged_item]
+                    }
+                }
+            }
+        }
@@ -11,6 +11,19 @@ class Settings(BaseSettings):
     MONGODB_URL: Optional[str] = "mongodb://localhost:27017" # Default for local dev/test
     MONGO_DB_CONNECTION_STRING: Optional[str] = None  # 별칭 지원
     MONGODB_DB_NAME: str = "jiobi"
+    # MongoDB 커넥션 풀 / 타임아웃 (버스트 트래픽 시 풀 고갈로 인한 지연 방지)
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = 60000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = 5000  # 풀에서 커넥션 대기 최대 시간
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 5000
+    # 소켓 타임아웃: 기본 없음 (시작 시 인덱스 로드/표시 필드 일괄 계산 같은 긴 스캔이 끊기지 않도록)
+    MONGODB_SOCKET_TIMEOUT_MS: Optional[int] = None
+    MONGODB_COMPRESSORS: Optional[str] = None  # 예: "zstd,snappy,zlib" (zstd/snappy는 별도 패키지 필요)
+    MONGODB_READ_PREFERENCE: str = "primary"  # primary / primaryPreferred / secondaryPreferred / nearest
+    MONGODB_PING_ON_STARTUP: bool = False  # 앱 시작 시 ping으로 연결 확인 (실패 시 시작 중단, 운영에서 켜기 권장)
+    MONGODB_SLOW_POOL_WAIT_MS: int = 100  # 풀 대기 시간이 이 값을 넘으면 경고 로그
     
     # JWT
     JWT_SECRET_KEY: Optional[str] = None
@@ -42,6 +55,16 @@ class Settings(BaseSettings):
     
     # Google Places API (평점/리뷰용)
     GOOGLE_PLACES_API_KEY: Optional[str] = None
+    # 이미지 프록시: 이미지 토큰 서명 키 (JWT 키와 별도) / 장소 이미지 URL의 기준 경로(다른 도메인에서 서빙 시 절대 URL)
+    # / 변환 이미지 디스크 캐시 위치
+    IMAGE_PROXY_SECRET: Optional[str] = None
+    IMAGE_PROXY_BASE_URL: str = "/api/v1/hk/images"
+    IMAGE_CACHE_DIR: str = str(BASE_DIR / ".image_cache")
+    # Google Place Details 백그라운드 갱신: 초당 최대 호출 수 / 하루 최대 호출 수 (워커 프로세스별)
+    GOOGLE_DETAILS_REFRESH_QPS: float = 1.0
+    GOOGLE_DETAILS_DAILY_LIMIT: int = 1000
+    # TourAPI 상세 정보 백그라운드 보강: 초당 최대 호출 수 (워커 프로세스별, 장소 1건당 detailCommon2 + detailIntro2)
+    TOUR_DETAIL_REFRESH_QPS: float = 0.5
     
     # Google OAuth (Social Login)
     GOOGLE_OAUTH_CLIENT_ID: Optional[str] = None
@@ -57,6 +80,9 @@ class Settings(BaseSettings):
     # Place API Provider 설정 (tour 또는 kakao)
     PLACE_API_PROVIDER: str = "tour"  # 기본값: tour
 
+    # 장소 검색 시 places 컬렉션 로컬 인덱스를 먼저 사용 (결과가 부족할 때만 외부 API 호출)
+    LOCAL_SEARCH_ENABLED: bool = True
+
     # 메인 화면 Featured Places 사용 여부
     USE_FEATURED_PLACES: bool = True
     
@@ -105,5 +131,11 @@ class Settings(BaseSettings):
                 "backend/.env 파일에 JWT_SECRET_KEY를 설정하세요."
             )
 
+        if not self.IMAGE_PROXY_SECRET:
+            raise ValueError(
+                "IMAGE_PROXY_SECRET 환경 변수가 설정되지 않았습니다. "
+                "backend/.env 파일에 IMAGE_PROXY_SECRET을 설정하세요."
+            )
+
 settings = Settings()
 
@@ -0,0 +1,86 @@
+"""
+위경도 계산 유틸리티
+- 거리 계산 (haversine)
+- 고정 크기 격자(grid) 버킷: 근접 장소 탐색 시 주변 셀만 확인
+- 웹 메르카토르 타일(z/x/y) 변환: 뷰포트 캐시 키 / 타일 응답
+"""
+
+import math
+from typing import Any, Iterator, List, Optional, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+
+# 기본 격자 크기 (도 단위, 약 1.1km x 0.9km @ 한국 위도)
+DEFAULT_CELL_DEG = 0.01
+
+
+def to_float(value: Any) -> Optional[float]:
+    """문자열/None이 섞인 좌표 값을 float로 변환 (실패 시 None)"""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리 (미터)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def grid_cell(lat: float, lng: float, cell_deg: float = DEFAULT_CELL_DEG) -> Tuple[int, int]:
+    """좌표가 속한 격자 셀"""
+    return (math.floor(lat / cell_deg), math.floor(lng / cell_deg))
+
+
+def neighbor_cells(cell: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+    """자기 자신 포함 주변 3x3 셀"""
+    row, col = cell
+    for d_row in (-1, 0, 1):
+        for d_col in (-1, 0, 1):
+            yield (row + d_row, col + d_col)
+
+
+# 웹 메르카토르 타일(z/x/y)에서 표현 가능한 최대 위도
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def latlng_to_tile(lat: float, lng: float, zoom: int) -> Tuple[int, int]:
+    """좌표가 속한 웹 메르카토르 타일 (x, y)"""
+    n = 2 ** zoom
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    lat_rad = math.radians(lat)
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return (min(max(x, 0), n - 1), min(max(y, 0), n - 1))
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """타일 범위 (sw_lat, sw_lng, ne_lat, ne_lng)"""
+    n = 2 ** zoom
+
+    def _lat(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return (_lat(y + 1), x / n * 360.0 - 180.0, _lat(y), (x + 1) / n * 360.0 - 180.0)
+
+
+def tiles_for_bbox(
+    sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float, zoom: int
+) -> List[Tuple[int, int, int]]:
+    """뷰포트를 덮는 타일 목록 (z, x, y)"""
+    min_x, max_y = latlng_to_tile(sw_lat, sw_lng, zoom)
+    max_x, min_y = latlng_to_tile(ne_lat, ne_lng, zoom)
+    return [(zoom, x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+
+def zoom_for_bbox(sw_lng: float, ne_lng: float, viewport_px: int = 1024) -> int:
+    """줌이 주어지지 않았을 때 뷰포트 경도 폭으로 지도 줌 추정"""
+    span = max(ne_lng - sw_lng, 1e-9)
+    return int(math.floor(math.log2(360.0 * viewport_px / (256 * span))))
@@ -0,0 +1,133 @@
+"""
+조건부 GET (ETag / Last-Modified) 응답
+- ETag: 문서 버전(updated_at 등)으로 만들거나, 없으면 응답 본문 해시 (약한 ETag)
+- If-None-Match가 있으면 ETag로, 없으면 If-Modified-Since와 Last-Modified로 비교해 304 반환
+- 버전 ETag는 본문을 직렬화하기 전에 비교하므로 304일 때 직렬화 비용도 들지 않음
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+# 엔드포인트별 Cache-Control
+# - 공개 데이터는 짧게 캐시 후 재검증, 개인 데이터(플랜)와 매번 새로 뽑는 섹션은 항상 재검증
+PLACE_CACHE_CONTROL = "public, max-age=60"
+THEME_CACHE_CONTROL = "public, max-age=60"
+PLAN_CACHE_CONTROL = "private, no-cache"
+SECTION_CACHE_CONTROL = "no-cache"
+HOME_CACHE_CONTROL = "public, max-age=60"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()[:32]
+
+
+def version_etag(*parts: Any) -> str:
+    """문서 식별자 + 버전(updated_at 등)으로 만든 ETag"""
+    return f'W/"{_digest("|".join(str(part) for part in parts).encode("utf-8"))}"'
+
+
+def content_etag(body: bytes) -> str:
+    """응답 본문 해시 ETag"""
+    return f'W/"{_digest(body)}"'
+
+
+def payload_etag(payload: Any) -> str:
+    """JSON 직렬화 결과 해시 ETag (프로세스/재시작과 무관하게 같은 내용이면 같은 값)"""
+    return content_etag(_encode(payload))
+
+
+def latest(*values: Any) -> Optional[datetime]:
+    """datetime 값 중 가장 최근 값 (없으면 None)"""
+    stamps = [value for value in values if isinstance(value, datetime)]
+    return max(stamps) if stamps else None
+
+
+def _as_utc(value: datetime) -> datetime:
+    # 저장된 시각은 datetime.utcnow() 기준 naive UTC
+    value = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두어 무시)"""
+    if header.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for tag in header.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == target:
+            return True
+    return False
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    return _as_utc(last_modified) <= _as_utc(since)
+
+
+def is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return bool(etag) and _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        return _not_modified_since(if_modified_since, last_modified)
+    return False
+
+
+def _headers(etag: Optional[str], last_modified: Optional[datetime], cache_control: str) -> dict:
+    headers = {"Cache-Control": cache_control}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def conditional_json(
+    request: Request,
+    payload: Any,
+    *,
+    cache_control: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """
+    조건부 GET JSON 응답.
+    - etag가 없으면 본문 해시로 만듦 (직렬화 후 비교, 대역폭만 절약)
+    - 일치하면 본문 없이 304 (ETag / Last-Modified / Cache-Control 헤더는 그대로)
+    """
+    body: Optional[bytes] = None
+    if etag is None:
+        body = _encode(payload)
+        etag = content_etag(body)
+    headers = _headers(etag, last_modified, cache_control)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        body = _encode(payload)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _encode(payload: Any) -> bytes:
+    # JSONResponse와 같은 직렬화 형식
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
@@ -0,0 +1,185 @@
+"""
+장소 이미지 프록시 URL
+- 저장: 원본 출처만 서명 없이 저장 (TourAPI 이미지 URL / API 키 없는 Google 사진 URL, source_place_images)
+- 응답: 조회 시점에 원본을 서명된 토큰으로 감싸 프록시 경로(IMAGE_PROXY_BASE_URL/{token})로 변환 (proxy_place_images)
+  - 서명 키(IMAGE_PROXY_SECRET)나 프록시 경로를 바꿔도 저장된 문서는 그대로 사용
+  - Google 사진 URL에 API 키가 들어가지 않음 (API 키는 프록시가 원본을 가져올 때만 사용)
+  - 서명으로 허용된 원본만 프록시 (임의 URL을 가져오는 오픈 프록시 방지)
+- 토큰은 원본만으로 결정되므로 같은 이미지는 항상 같은 URL (브라우저/CDN 캐시 재사용)
+- 이전에 저장된 형식(API 키 포함 Google URL / 프록시 URL)도 읽을 때 원본으로 되돌려 처리
+"""
+
+import base64
+import hashlib
+import hmac
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from app.core.config import settings
+
+# 원본 종류: Google 사진(photo_reference) / 허용 호스트의 이미지 URL
+IMAGE_SOURCE_GOOGLE = "g"
+IMAGE_SOURCE_URL = "u"
+# 프록시로 가져올 수 있는 이미지 호스트 (TourAPI)
+IMAGE_URL_HOSTS = ("tong.visitkorea.or.kr",)
+GOOGLE_PHOTO_HOST = "maps.googleapis.com"
+GOOGLE_PHOTO_PATH = "/maps/api/place/photo"
+# IMAGE_PROXY_BASE_URL 기본 경로 (설정이 바뀌기 전에 저장된 프록시 URL 인식용)
+DEFAULT_IMAGE_PROXY_PATH = "/api/v1/hk/images"
+
+# 제공 너비 (요청 너비는 이 중 같거나 큰 값으로 올림) / 너비 미지정 시 기본값
+IMAGE_WIDTHS = (160, 320, 640, 1280)
+DEFAULT_IMAGE_WIDTH = 640
+
+_SIGNATURE_LENGTH = 16
+
+
+def snap_image_width(width: Optional[int]) -> int:
+    """요청 너비 → 제공 너비 (가장 가까운 큰 값, 최대 너비 초과 시 최대 너비)"""
+    if not width or width <= 0:
+        return DEFAULT_IMAGE_WIDTH
+    for candidate in IMAGE_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return IMAGE_WIDTHS[-1]
+
+
+def _sign(payload: str) -> str:
+    key = settings.IMAGE_PROXY_SECRET.encode("utf-8")
+    return hmac.new(key, payload.encode("utf-8"), hashlib.sha256).hexdigest()[:_SIGNATURE_LENGTH]
+
+
+def _decode_token(token: str) -> Optional[Tuple[str, str, str]]:
+    """토큰 → (원본 종류, 원본 참조, 서명). 형식이 틀리면 None (서명은 확인하지 않음)"""
+    encoded, sep, signature = (token or "").partition(".")
+    if not sep or not encoded:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    kind, sep, ref = payload.partition(":")
+    if not sep or not ref or kind not in (IMAGE_SOURCE_GOOGLE, IMAGE_SOURCE_URL):
+        return None
+    return kind, ref, signature
+
+
+def make_image_token(kind: str, ref: str) -> str:
+    payload = f"{kind}:{ref}"
+    encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+    return f"{encoded}.{_sign(payload)}"
+
+
+def parse_image_token(token: str) -> Optional[Tuple[str, str]]:
+    """토큰 → (원본 종류, 원본 참조). 형식이 틀리거나 서명이 맞지 않으면 None"""
+    decoded = _decode_token(token)
+    if not decoded:
+        return None
+    kind, ref, signature = decoded
+    if not hmac.compare_digest(signature, _sign(f"{kind}:{ref}")):
+        return None
+    return kind, ref
+
+
+def image_source_key(kind: str, ref: str) -> str:
+    """원본 기준 콘텐츠 주소 (디스크 캐시 파일명 / ETag)"""
+    return hashlib.sha256(f"{kind}:{ref}".encode("utf-8")).hexdigest()
+
+
+def image_proxy_url(kind: str, ref: str, width: Optional[int] = None) -> str:
+    url = f"{settings.IMAGE_PROXY_BASE_URL.rstrip('/')}/{make_image_token(kind, ref)}"
+    if width:
+        url += f"?w={snap_image_width(width)}"
+    return url
+
+
+def google_photo_source_url(photo_reference: str, width: Optional[int] = None) -> str:
+    """Google 사진 원본 출처 (API 키 없는 Place Photo URL, 저장용)"""
+    query = {"photo_reference": photo_reference}
+    if width:
+        query["maxwidth"] = str(width)
+    return f"https://{GOOGLE_PHOTO_HOST}{GOOGLE_PHOTO_PATH}?{urlencode(query)}"
+
+
+def is_proxyable_image_url(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.scheme in ("http", "https") and (parsed.hostname or "") in IMAGE_URL_HOSTS
+
+
+def _int_param(query: Dict[str, Any], name: str) -> Optional[int]:
+    try:
+        return int((query.get(name) or ["0"])[0]) or None
+    except ValueError:
+        return None
+
+
+def _image_source(url: Optional[str]) -> Optional[Tuple[str, str, Optional[int]]]:
+    """
+    저장된 이미지 URL → (원본 종류, 원본 참조, 너비). 프록시할 수 없는 URL이면 None
+    - Google 사진 URL (API 키 유무 무관): photo_reference + maxwidth
+    - 허용 호스트의 TourAPI 이미지 URL
+    - 이전에 저장된 프록시 URL: 토큰의 원본 (이전 서명 키로 만든 토큰이므로 서명은 확인하지 않고, 원본 조건을 다시 확인)
+    """
+    if not url or not isinstance(url, str):
+        return None
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if parsed.hostname == GOOGLE_PHOTO_HOST and parsed.path == GOOGLE_PHOTO_PATH:
+        reference = (query.get("photo_reference") or [""])[0]
+        return (IMAGE_SOURCE_GOOGLE, reference, _int_param(query, "maxwidth")) if reference else None
+    if is_proxyable_image_url(url):
+        return IMAGE_SOURCE_URL, url, None
+    for base_path in {urlparse(settings.IMAGE_PROXY_BASE_URL).path.rstrip("/"), DEFAULT_IMAGE_PROXY_PATH}:
+        if parsed.path.startswith(f"{base_path}/"):
+            decoded = _decode_token(parsed.path[len(base_path) + 1:])
+            if not decoded:
+                return None
+            kind, ref, _ = decoded
+            if kind == IMAGE_SOURCE_URL and not is_proxyable_image_url(ref):
+                return None
+            return kind, ref, _int_param(query, "w")
+    return None
+
+
+def source_image_url(url: Optional[str]) -> Optional[str]:
+    """이미지 URL → 저장용 원본 출처 (API 키/서명 제거). 프록시할 수 없는 URL은 그대로 반환"""
+    source = _image_source(url)
+    if not source:
+        return url
+    kind, ref, width = source
+    return google_photo_source_url(ref, width) if kind == IMAGE_SOURCE_GOOGLE else ref
+
+
+def proxied_image_url(url: Optional[str]) -> Optional[str]:
+    """
+    이미지 URL(원본 출처 또는 이전 형식) → 응답용 프록시 URL (조회 시점에 서명).
+    - Google 사진은 maxwidth를 제공 너비로 맞춤
+    - 프록시할 수 없는 URL(허용되지 않은 호스트 등)은 그대로 반환
+    """
+    source = _image_source(url)
+    if not source:
+        return url
+    return image_proxy_url(*source)
+
+
+def _map_place_images(item: Dict[str, Any], convert: Callable[[Optional[str]], Optional[str]]) -> Dict[str, Any]:
+    for key in ("image", "imageUrl"):
+        if item.get(key):
+            item[key] = convert(item[key])
+    photos = item.get("google_photos")
+    if isinstance(photos, list):
+        item["google_photos"] = [
+            {**photo, "url": convert(photo.get("url"))} if isinstance(photo, dict) else photo
+            for photo in photos
+        ]
+    return item
+
+
+def source_place_images(item: Dict[str, Any]) -> Dict[str, Any]:
+    """장소 dict의 이미지 필드(image / imageUrl / google_photos[].url)를 저장용 원본 출처로 변환 (제자리 수정)"""
+    return _map_place_images(item, source_image_url)
+
+
+def proxy_place_images(item: Dict[str, Any]) -> Dict[str, Any]:
+    """장소 dict의 이미지 필드(image / imageUrl / google_photos[].url)를 프록시 URL로 변환 (제자리 수정, 응답 직전에 사용)"""
+    return _map_place_images(item, proxied_image_url)
@@ -1,26 +1,145 @@
-from pymongo import MongoClient
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from pymongo import MongoClient, monitoring
 from app.core.config import settings
-from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 class MongoDB:
     client: Optional[MongoClient] = None
 
 mongodb = MongoDB()
+_connect_lock = threading.Lock()
+
+
+class PoolWaitMonitor(monitoring.ConnectionPoolListener):
+    """
+    커넥션 풀 대기 시간 측정.
+    checkout 시작 ~ 커넥션 획득(또는 실패)까지의 시간을 누적하여
+    풀 고갈로 인한 지연을 지표로 확인할 수 있게 함.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.failures = 0
+            self.timeouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+            self.slow_checkouts = 0
+
+    def _record(self, failed: bool = False, timed_out: bool = False) -> None:
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        wait_ms = (time.perf_counter() - started) * 1000 if started is not None else 0.0
+        with self._lock:
+            if failed:
+                self.failures += 1
+                if timed_out:
+                    self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            if wait_ms >= settings.MONGODB_SLOW_POOL_WAIT_MS:
+                self.slow_checkouts += 1
+        if wait_ms >= settings.MONGODB_SLOW_POOL_WAIT_MS:
+            logger.warning(f"MongoDB 커넥션 풀 대기 지연: {wait_ms:.1f}ms (failed={failed})")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.failures
+            return {
+                "checkouts": self.checkouts,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+                "slow_checkouts": self.slow_checkouts,
+                "avg_wait_ms": round(self.total_wait_ms / attempts, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        self._record()
+
+    def connection_check_out_failed(self, event):
+        self._record(failed=True, timed_out=event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT)
+
+    # 나머지 이벤트는 사용하지 않음
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_created(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_checked_in(self, event): pass
+
+
+pool_monitor = PoolWaitMonitor()
+
+def _client_options() -> Dict[str, Any]:
+    """Settings 기반 MongoClient 옵션"""
+    options: Dict[str, Any] = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "readPreference": settings.MONGODB_READ_PREFERENCE,
+        "event_listeners": [pool_monitor],
+    }
+    if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+    if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS is not None:
+        options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGODB_SOCKET_TIMEOUT_MS is not None:
+        options["socketTimeoutMS"] = settings.MONGODB_SOCKET_TIMEOUT_MS
+    if settings.MONGODB_COMPRESSORS:
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    return options
 
 def connect_to_mongo():
     """MongoDB 연결"""
-    mongodb.client = MongoClient(settings.MONGODB_URL)
-    # 연결 테스트 생략 (로컬 테스트용)
-    # mongodb.client.admin.command('ping')
+    with _connect_lock:
+        if mongodb.client is None:
+            mongodb.client = MongoClient(settings.MONGODB_URL, **_client_options())
+
+def ping_mongo() -> float:
+    """MongoDB 연결 확인 (왕복 시간 ms 반환, 실패 시 예외)"""
+    if not mongodb.client:
+        connect_to_mongo()
+    started = time.perf_counter()
+    mongodb.client.admin.command("ping")
+    return (time.perf_counter() - started) * 1000
+
+def get_pool_stats() -> Dict[str, Any]:
+    """커넥션 풀 설정 및 대기 시간 지표"""
+    return {
+        "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+        "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+        "read_preference": settings.MONGODB_READ_PREFERENCE,
+        **pool_monitor.snapshot(),
+    }
 
 def close_mongo_connection():
     """MongoDB 연결 종료"""
-    if mongodb.client:
-        mongodb.client.close()
+    with _connect_lock:
+        if mongodb.client:
+            mongodb.client.close()
+            mongodb.client = None
 
 def get_database():
     """데이터베이스 인스턴스 반환"""
     if not mongodb.client:
         connect_to_mongo()
     return mongodb.client[settings.MONGODB_DB_NAME]
-
@@ -0,0 +1,118 @@
+"""
+Mapbox Vector Tile(MVT) 인코더 (점 피처 전용)
+- 스펙: https://github.com/mapbox/vector-tile-spec (v2)
+- 장소 핀만 그리므로 POINT 지오메트리와 문자열/실수/불리언 속성만 지원
+- protobuf 라이브러리 없이 필요한 필드만 직접 인코딩
+"""
+
+import math
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.geo import MAX_MERCATOR_LAT
+
+DEFAULT_EXTENT = 4096
+
+# protobuf wire type
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH = 2
+
+# geometry
+_GEOM_POINT = 1
+_CMD_MOVE_TO = 1
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(bits | 0x80)
+        else:
+            out.append(bits)
+            return bytes(out)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _length_delimited(field: int, payload: bytes) -> bytes:
+    return _key(field, _LENGTH) + _varint(len(payload)) + payload
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _packed(field: int, values: List[int]) -> bytes:
+    return _length_delimited(field, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: Any) -> bytes:
+    """Layer.Value 메시지"""
+    if isinstance(value, bool):
+        return _key(7, _VARINT) + _varint(int(value))
+    if isinstance(value, (int, float)):
+        return _key(3, _FIXED64) + struct.pack("<d", float(value))
+    return _length_delimited(1, str(value).encode("utf-8"))
+
+
+def tile_pixel(lat: float, lng: float, z: int, x: int, y: int, extent: int = DEFAULT_EXTENT) -> Tuple[int, int]:
+    """좌표 → 타일 내부 좌표 (0 ~ extent, 좌상단 기준)"""
+    n = 2 ** z
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    world_x = (lng + 180.0) / 360.0 * n
+    world_y = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n
+    return (int(round((world_x - x) * extent)), int(round((world_y - y) * extent)))
+
+
+def encode_point_layer(
+    name: str,
+    features: List[Tuple[int, int, Dict[str, Any]]],
+    extent: int = DEFAULT_EXTENT,
+) -> bytes:
+    """
+    점 피처 레이어 1개짜리 타일 인코딩.
+    features: (tile_x, tile_y, 속성) 목록 (None 속성은 생략)
+    """
+    keys: Dict[str, int] = {}
+    values: Dict[Tuple[type, Any], int] = {}
+    encoded_features = []
+
+    for px, py, properties in features:
+        tags: List[int] = []
+        for prop_key, prop_value in properties.items():
+            if prop_value is None:
+                continue
+            key_index = keys.setdefault(prop_key, len(keys))
+            value_index = values.setdefault((type(prop_value), prop_value), len(values))
+            tags.extend((key_index, value_index))
+        geometry = [(_CMD_MOVE_TO & 0x7) | (1 << 3), _zigzag(px), _zigzag(py)]
+        feature = b""
+        if tags:
+            feature += _packed(2, tags)
+        feature += _key(3, _VARINT) + _varint(_GEOM_POINT)
+        feature += _packed(4, geometry)
+        encoded_features.append(feature)
+
+    layer = _key(15, _VARINT) + _varint(2)
+    layer += _length_delimited(1, name.encode("utf-8"))
+    for feature in encoded_features:
+        layer += _length_delimited(2, feature)
+    for prop_key in keys:
+        layer += _length_delimited(3, prop_key.encode("utf-8"))
+    for (_, prop_value) in values:
+        layer += _length_delimited(4, _encode_value(prop_value))
+    layer += _key(5, _VARINT) + _varint(extent)
+
+    return _length_delimited(3, layer)
+
+
+def tile_in_range(z: int, x: int, y: int, max_zoom: Optional[int] = None) -> bool:
+    if z < 0 or (max_zoom is not None and z > max_zoom):
+        return False
+    n = 2 ** z
+    return 0 <= x < n and 0 <= y < n
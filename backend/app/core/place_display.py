@@ -0,0 +1,82 @@
+"""
+장소 표시 필드 (프론트 공통 필드)
+- imageUrl: Google 사진(google_photos[0].url) > image > 기존 imageUrl
+  - 저장은 원본 출처(서명 없음), 응답용 프록시 URL은 조회 시 ensure_display_fields에서 서명해 만듦
+- googleRating / googleRatingsTotal: google_rating / google_ratings_total을 숫자로 변환해 복사
+- place_ref: provider 네임스페이스 ID
+- 저장 시점에 한 번 계산해 문서에 함께 저장 (app.services.place_store), 조회는 저장된 값을 그대로 사용
+  - display_version이 현재 버전과 다른 문서(이전에 저장된 문서)만 조회 시 계산
+  - 계산 규칙을 바꾸면 DISPLAY_FIELDS_VERSION을 올림 (앱 시작 시 기존 문서 일괄 재계산)
+  - 버전 2: 이미지 필드를 프록시 URL 대신 원본 출처로 저장
+"""
+
+from typing import Any, Dict, Optional
+
+from app.core.image_urls import proxy_place_images, source_place_images
+from app.core.place_ids import PROVIDER_FIELDS, place_ref_of
+
+DISPLAY_FIELDS_VERSION = 2
+DISPLAY_VERSION_FIELD = "display_version"
+
+# 표시 필드 계산에 쓰는 원본 필드 (조회 projection에 함께 포함)
+DISPLAY_SOURCE_FIELDS = (
+    *PROVIDER_FIELDS,
+    "image", "imageUrl", "google_photos", "google_rating", "google_ratings_total",
+)
+DISPLAY_FIELDS = ("imageUrl", "googleRating", "googleRatingsTotal", "place_ref", DISPLAY_VERSION_FIELD)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value)) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def display_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """장소 문서 → 저장할 표시 필드 (값이 없는 필드는 제외). 이전 형식 이미지 URL도 원본 출처로 바꿔 함께 반환"""
+    images = source_place_images({key: doc[key] for key in ("image", "imageUrl", "google_photos") if key in doc})
+    fields: Dict[str, Any] = {key: value for key, value in images.items() if value != doc.get(key)}
+
+    image_url = None
+    photos = images.get("google_photos")
+    if isinstance(photos, list) and photos and isinstance(photos[0], dict):
+        image_url = photos[0].get("url")
+    image_url = image_url or images.get("image") or images.get("imageUrl")
+    if image_url:
+        fields["imageUrl"] = image_url
+
+    rating = _to_float(doc.get("google_rating"))
+    if rating is not None:
+        fields["googleRating"] = rating
+    ratings_total = _to_int(doc.get("google_ratings_total"))
+    if ratings_total is not None:
+        fields["googleRatingsTotal"] = ratings_total
+
+    place_ref = place_ref_of(doc)
+    if place_ref:
+        fields["place_ref"] = place_ref
+    fields[DISPLAY_VERSION_FIELD] = DISPLAY_FIELDS_VERSION
+    return fields
+
+
+def with_display_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """표시 필드를 채운 새 dict (저장용, 이미지는 원본 출처)"""
+    return {**doc, **display_fields(doc)}
+
+
+def ensure_display_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    응답용 새 dict. 저장 시 계산된 문서는 저장된 값을, 이전 버전 문서만 여기서 계산해 사용.
+    이미지 필드는 이 시점에 서명한 프록시 URL로 변환
+    """
+    if doc.get(DISPLAY_VERSION_FIELD) != DISPLAY_FIELDS_VERSION:
+        doc = with_display_fields(doc)
+    return proxy_place_images(dict(doc))
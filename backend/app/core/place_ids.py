@@ -0,0 +1,66 @@
+"""
+provider 네임스페이스 장소 ID (place_ref)
+- 형식: "tour:126508", "kakao:8217321"
+- TourAPI contentid와 Kakao 장소 ID가 모두 숫자라서 기존 place_id만으로는 provider를 구분할 수 없음
+- 기존 place_id(네임스페이스 없음)도 그대로 받되, provider 판별은 place_id_router 인덱스로 처리
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+PLACE_PROVIDERS = ("tour", "kakao")
+PLACE_REF_SEPARATOR = ":"
+# TourAPI contenttypeid (12 관광지, 14 문화시설, 15 축제/행사, 25 여행코스, 28 레포츠, 32 숙박, 38 쇼핑, 39 음식점)
+TOUR_CONTENT_TYPE_IDS = frozenset({"12", "14", "15", "25", "28", "32", "38", "39"})
+# TourAPI 정규화 결과에만 있는 필드
+_TOUR_ONLY_FIELDS = ("addr1", "addr2", "zipcode", "contentid", "contenttypeid", "detail_fetched_at")
+# provider 판별(provider_of)에 쓰는 필드 (조회 projection에 함께 포함)
+PROVIDER_FIELDS = ("place_id", "id", "place_ref", "provider_ids", "kakao_url", "category", *_TOUR_ONLY_FIELDS)
+
+
+def make_place_ref(provider: str, provider_id: Any) -> str:
+    return f"{provider}{PLACE_REF_SEPARATOR}{provider_id}"
+
+
+def parse_place_ref(value: str) -> Tuple[Optional[str], str]:
+    """"tour:126508" → ("tour", "126508"), 네임스페이스가 없으면 (None, 원래 값)"""
+    value = (value or "").strip()
+    provider, sep, provider_id = value.partition(PLACE_REF_SEPARATOR)
+    if sep and provider in PLACE_PROVIDERS and provider_id:
+        return provider, provider_id
+    return None, value
+
+
+def provider_of(doc: Dict[str, Any]) -> Optional[str]:
+    """
+    장소 문서/dict의 주 provider (place_id를 발급한 provider).
+    place_ref / provider_ids / provider별로만 생기는 필드로 판별하고, 근거가 없으면 None (추측하지 않음)
+    """
+    provider, _ = parse_place_ref(doc.get("place_ref") or "")
+    if provider:
+        return provider
+    place_id = str(doc.get("place_id") or doc.get("id") or "")
+    if not place_id:
+        return None
+    # 병합된 장소는 provider_ids에 양쪽 ID가 있고 place_id는 주 provider의 ID
+    provider_ids = doc.get("provider_ids") or {}
+    for name in PLACE_PROVIDERS:
+        if str(provider_ids.get(name) or "") == place_id:
+            return name
+    # 병합되지 않은 장소: Kakao 정규화 결과에만 kakao_url이 있음
+    if doc.get("kakao_url"):
+        return "kakao"
+    # TourAPI 정규화 결과는 category에 contenttypeid가 들어가고, 지번 주소/우편번호 등 전용 필드가 있음
+    if str(doc.get("category") or "") in TOUR_CONTENT_TYPE_IDS or any(doc.get(key) for key in _TOUR_ONLY_FIELDS):
+        return "tour"
+    return None
+
+
+def place_ref_of(doc: Dict[str, Any]) -> Optional[str]:
+    """장소 문서/dict의 place_ref (저장된 값이 없으면 provider를 판별해 생성)"""
+    if doc.get("place_ref"):
+        return doc["place_ref"]
+    provider = provider_of(doc)
+    place_id = doc.get("place_id") or doc.get("id")
+    if not provider or not place_id:
+        return None
+    return make_place_ref(provider, place_id)
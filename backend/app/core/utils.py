@@ -1,5 +1,7 @@
+import base64
+import json
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
 from jose import JWTError, jwt
 from app.core.config import settings
 
@@ -22,3 +24,19 @@ def verify_token(token: str):
     except JWTError:
         return None
 
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """페이지네이션 커서 인코딩 (클라이언트에는 불투명한 문자열로 전달)"""
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """페이지네이션 커서 디코딩 (형식이 잘못되면 None)"""
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
@@ -1,16 +1,38 @@
+import asyncio
+import logging
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.api import hk, auth, util, blog
 from app.api.v1 import gemini
-from app.core.mongodb import connect_to_mongo, close_mongo_connection
+from app.core.config import settings
+from app.core.mongodb import connect_to_mongo, close_mongo_connection, ping_mongo, get_pool_stats
+from app.services.home_feed_service import home_feed_builder
+from app.services.place_events import load_place_indexes
+from app.services.place_id_router import place_id_router
+from app.services.suggest_service import suggest_index
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
     connect_to_mongo()
+    if settings.MONGODB_PING_ON_STARTUP:
+        # 연결 문제를 첫 요청의 지연/오류가 아닌 시작 시점에 드러냄
+        rtt_ms = await asyncio.to_thread(ping_mongo)
+        logger.info(f"MongoDB 연결 확인 완료 (ping {rtt_ms:.1f}ms)")
+    # places 기반 메모리 인덱스(로컬 검색/자동완성)는 백그라운드에서 로드 (로드 전에는 외부 API 검색 사용)
+    threading.Thread(target=load_place_indexes, name="place-indexes", daemon=True).start()
+    # 홈 피드 스냅샷은 주기적으로 백그라운드 생성 (GET /home은 메모리 스냅샷에서 응답)
+    home_feed_builder.start()
     yield
     # 종료 시
+    home_feed_builder.stop()
+    # 아직 저장하지 않은 검색어 빈도 / 장소 ID 라우팅 정보 저장
+    suggest_index.flush_queries()
+    place_id_router.flush()
     close_mongo_connection()
 
 app = FastAPI(title="Jiobi API", version="1.0.0", lifespan=lifespan)
@@ -44,3 +66,17 @@ app.include_router(gemini.router, prefix="/api/v1/gemini", tags=["gemini"])
 async def root():
     return {"message": "Jiobi API", "version": "1.0.0"}
 
+@app.get("/health")
+async def health():
+    """헬스 체크 (MongoDB ping 및 커넥션 풀 대기 시간 지표)"""
+    try:
+        rtt_ms = await asyncio.to_thread(ping_mongo)
+        mongo_status = {"ok": True, "ping_ms": round(rtt_ms, 3)}
+    except Exception as e:
+        mongo_status = {"ok": False, "error": str(e)}
+    return {
+        "status": "ok" if mongo_status["ok"] else "degraded",
+        "mongodb": mongo_status,
+        "mongodb_pool": get_pool_stats(),
+    }
+
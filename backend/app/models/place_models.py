@@ -8,6 +8,8 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from app.core.place_ids import make_place_ref
+
 
 @dataclass
 class Place:
@@ -40,6 +42,10 @@ class Place:
     treatmenu: Optional[str] = None  # 취급 메뉴 (음식점)
     checkintime: Optional[str] = None  # 체크인 시간 (숙박)
     checkouttime: Optional[str] = None  # 체크아웃 시간 (숙박)
+    # 병합된 provider별 ID (예: {"tour": "126508", "kakao": "8217321"})
+    provider_ids: Optional[Dict[str, str]] = None
+    # provider 네임스페이스 ID (예: "tour:126508", "kakao:8217321")
+    place_ref: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (None 값 제외)"""
@@ -66,8 +72,8 @@ class PlaceNormalizer:
         # 주소 합치기
         address = " ".join(filter(None, [addr1, addr2]))
         
-        # 이미지 URL (firstimage2가 있으면 우선 사용)
-        image = first_image2 or first_image or ""
+        # 이미지 URL: 원본(firstimage) 우선, 없으면 썸네일 firstimage2 (응답 시 이미지 프록시로 표준 너비 제공)
+        image = first_image or first_image2 or ""
         
         # 지역 추출 (주소에서)
         region = None
@@ -123,6 +129,7 @@ class PlaceNormalizer:
         return Place(
             id=content_id,
             place_id=content_id,
+            place_ref=make_place_ref("tour", content_id) if content_id else None,
             title=title,
             place_name=title,
             address=address,
@@ -211,6 +218,7 @@ class PlaceNormalizer:
         return Place(
             id=place_id,
             place_id=place_id,
+            place_ref=make_place_ref("kakao", place_id) if place_id else None,
             title=place_name,
             place_name=place_name,
             address=address,
@@ -0,0 +1,34 @@
+"""
+장소 검색 관련 모델
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SearchQuery(BaseModel):
+    """배치 검색의 개별 검색 조건 (GET /search 파라미터와 동일)"""
+
+    key: Optional[str] = Field(default=None, description="결과 식별용 키 (없으면 입력 위치)")
+    keyword: Optional[str] = Field(default=None, description="검색 키워드")
+    region: Optional[str] = Field(default=None, description="시도 (예: 서울, 경기)")
+    district: Optional[str] = Field(default=None, description="구/군 (예: 강남구, 수원시)")
+    category: Optional[str] = Field(default=None, description="카테고리 (로컬 검색 필터)")
+    page: int = Field(default=1, ge=1, description="페이지 번호")
+    limit: int = Field(default=10, ge=1, le=50, description="페이지당 개수")
+
+
+class BatchSearchRequest(BaseModel):
+    """배치 검색 요청"""
+
+    queries: List[SearchQuery] = Field(..., min_length=1, max_length=30, description="검색 조건 목록")
+
+
+class PlaceBatchRequest(BaseModel):
+    """장소 상세 배치 조회 요청"""
+
+    ids: List[str] = Field(..., min_length=1, max_length=100, description="place_id 또는 place_ref 목록")
+    fields: Optional[List[str]] = Field(
+        default=None, max_length=50, description="반환할 필드 (없으면 전체, place_id/place_ref는 항상 포함)"
+    )
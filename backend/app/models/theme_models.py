@@ -36,6 +36,7 @@ class ThemeResponse(BaseModel):
     name_en: str
     places: List[ThemePlace]
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 
 class ThemesResponse(BaseModel):
@@ -0,0 +1,257 @@
+"""
+Google Place Details 백그라운드 갱신
+- 상세 조회 요청은 저장된 문서를 바로 반환하고, 비어 있거나 오래된 Google 정보는 큐에 넣어 백그라운드에서 갱신
+- 저장은 place_store.update_place (표시 필드 재계산 + 메모리 인덱스 반영)
+- 필드 그룹별 TTL: 기본 정보(이름/주소/좌표/사진) 30일, 연락처/영업시간 3일, 평점/리뷰 7일
+  - 만료된 그룹의 필드만 요청 (Google Details는 요청 필드 그룹별로 과금)
+- 우선순위: 큐에 있는 동안 조회된 횟수(트래픽)가 많은 장소 먼저
+- 속도 제한: 초당 GOOGLE_DETAILS_REFRESH_QPS, 하루 GOOGLE_DETAILS_DAILY_LIMIT (초과 시 다음 날까지 대기), 실패 시 지수 백오프
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.mongodb import get_database
+from app.services.google_places_service import google_places_service
+from app.services.place_store import update_place
+
+logger = logging.getLogger(__name__)
+
+# 큐 최대 크기 (넘으면 우선순위가 가장 낮은 장소를 버림)
+REFRESH_QUEUE_MAX = 5000
+# 갱신 실패 시 같은 장소를 다시 시도하기까지의 시간
+REFRESH_RETRY_AFTER = timedelta(hours=1)
+# 연속 실패 시 최대 대기 (초)
+REFRESH_MAX_BACKOFF_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class FieldGroup:
+    name: str
+    # Google Details 요청 필드
+    fields: Tuple[str, ...]
+    ttl: timedelta
+
+
+FIELD_GROUPS: Tuple[FieldGroup, ...] = (
+    FieldGroup("basic", ("name", "formatted_address", "geometry", "types", "photos"), timedelta(days=30)),
+    FieldGroup("contact", ("formatted_phone_number", "website", "opening_hours"), timedelta(days=3)),
+    FieldGroup("atmosphere", ("rating", "user_ratings_total", "reviews"), timedelta(days=7)),
+)
+_GROUPS_BY_NAME = {group.name: group for group in FIELD_GROUPS}
+
+# Google Details 응답 키 → places 필드 (photos는 google_photos)
+_DETAIL_FIELDS = {
+    "name": "google_name",
+    "formatted_address": "google_formatted_address",
+    "formatted_phone_number": "google_formatted_phone_number",
+    "website": "google_website",
+    "types": "google_types",
+    "rating": "google_rating",
+    "user_ratings_total": "google_ratings_total",
+    "opening_hours": "google_opening_hours",
+    "reviews": "google_reviews",
+    "photos": "google_photos",
+}
+
+
+def due_groups(doc: Dict[str, Any], now: Optional[datetime] = None) -> List[str]:
+    """갱신이 필요한 필드 그룹 (google_place_id가 없거나 재시도 대기 중이면 빈 목록)"""
+    if not doc.get("google_place_id"):
+        return []
+    now = now or datetime.utcnow()
+    retry_at = doc.get("google_details_retry_at")
+    if isinstance(retry_at, datetime) and retry_at > now:
+        return []
+    refreshed = doc.get("google_details_refreshed_at") or {}
+    # 그룹별 기록이 없는 기존 문서는 전체 갱신 시각(google_details_updated_at) 기준
+    legacy = doc.get("google_details_updated_at")
+    due = []
+    for group in FIELD_GROUPS:
+        refreshed_at = refreshed.get(group.name) or legacy
+        if not isinstance(refreshed_at, datetime) or now - refreshed_at >= group.ttl:
+            due.append(group.name)
+    return due
+
+
+def details_to_fields(details: Dict[str, Any], groups: List[str]) -> Dict[str, Any]:
+    """Google Details 응답 → places에 저장할 필드 (요청한 그룹의 값이 있는 필드만)"""
+    requested = {name for group in groups for name in _GROUPS_BY_NAME[group].fields}
+    updates: Dict[str, Any] = {}
+    for key, target in _DETAIL_FIELDS.items():
+        if key in requested and details.get(key) is not None:
+            updates[target] = details[key]
+    # 좌표: Google geometry를 우선 적용
+    location = details.get("location") or {}
+    if "geometry" in requested and location.get("lat") is not None and location.get("lng") is not None:
+        updates["latitude"] = location["lat"]
+        updates["longitude"] = location["lng"]
+    return updates
+
+
+@dataclass
+class _QueueEntry:
+    place_id: str
+    google_place_id: str
+    groups: Set[str]
+    hits: int
+    seq: int
+
+
+class GoogleDetailsRefresher:
+    """Google Details 갱신 큐 + 백그라운드 워커 (프로세스당 스레드 1개)"""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: Dict[str, _QueueEntry] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._day: Optional[date] = None
+        self._calls_today = 0
+        self._quota_logged = False
+        self._failures = 0
+        # 갱신 중인 place_id (그 사이 들어온 조회로 중복 갱신하지 않도록)
+        self._inflight: Optional[str] = None
+        self.refreshed = 0
+        self.failed = 0
+
+    def schedule(self, doc: Dict[str, Any]) -> bool:
+        """만료된 필드 그룹이 있으면 큐에 추가 (이미 있으면 조회 횟수만 증가). 추가/갱신 여부 반환"""
+        if not google_places_service.api_key:
+            return False
+        place_id = doc.get("place_id")
+        groups = due_groups(doc)
+        if not place_id or not groups:
+            return False
+        with self._cond:
+            if place_id == self._inflight:
+                return False
+            entry = self._queue.get(place_id)
+            if entry:
+                entry.hits += 1
+                entry.groups.update(groups)
+            else:
+                if len(self._queue) >= REFRESH_QUEUE_MAX:
+                    lowest = min(self._queue.values(), key=lambda e: (e.hits, -e.seq))
+                    del self._queue[lowest.place_id]
+                self._queue[place_id] = _QueueEntry(
+                    place_id=str(place_id),
+                    google_place_id=str(doc["google_place_id"]),
+                    groups=set(groups),
+                    hits=1,
+                    seq=next(self._seq),
+                )
+            self._ensure_worker_locked()
+            self._cond.notify()
+        return True
+
+    def _ensure_worker_locked(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="google-details-refresh", daemon=True)
+        self._thread.start()
+
+    def _pop_locked(self) -> Optional[_QueueEntry]:
+        if not self._queue:
+            return None
+        # 조회 횟수 많은 순, 같으면 먼저 들어온 순
+        entry = max(self._queue.values(), key=lambda e: (e.hits, -e.seq))
+        del self._queue[entry.place_id]
+        return entry
+
+    def _wait_for_quota_locked(self) -> float:
+        """하루 호출 한도 확인 (남은 한도가 없으면 다음 날 0시(UTC)까지 남은 초)"""
+        today = datetime.utcnow().date()
+        if self._day != today:
+            self._day = today
+            self._calls_today = 0
+            self._quota_logged = False
+        if self._calls_today < settings.GOOGLE_DETAILS_DAILY_LIMIT:
+            return 0.0
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        return max((tomorrow - datetime.utcnow()).total_seconds(), 1.0)
+
+    def _run(self) -> None:
+        interval = 1.0 / max(settings.GOOGLE_DETAILS_REFRESH_QPS, 1e-3)
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                quota_wait = self._wait_for_quota_locked()
+                if quota_wait:
+                    if not self._quota_logged:
+                        self._quota_logged = True
+                        logger.info(f"Google Details 하루 호출 한도 도달, {quota_wait:.0f}초 대기 (대기 {len(self._queue)}건)")
+                    self._cond.wait(timeout=quota_wait)
+                    continue
+                entry = self._pop_locked()
+                self._inflight = entry.place_id
+                self._calls_today += 1
+
+            started = time.monotonic()
+            ok = self.refresh(entry)
+            with self._cond:
+                self._inflight = None
+            if ok:
+                self._failures = 0
+                delay = interval
+            else:
+                self._failures += 1
+                delay = max(interval, min(2 ** self._failures, REFRESH_MAX_BACKOFF_SECONDS))
+            time.sleep(max(delay - (time.monotonic() - started), 0.0))
+
+    def refresh(self, entry: _QueueEntry) -> bool:
+        """장소 1건의 만료된 필드 그룹 갱신 (DB 저장 + 메모리 인덱스 반영)"""
+        groups = [group.name for group in FIELD_GROUPS if group.name in entry.groups]
+        fields = [name for group in groups for name in _GROUPS_BY_NAME[group].fields]
+        places_col = get_database().places
+        now = datetime.utcnow()
+        try:
+            details = google_places_service.get_place_details(entry.google_place_id, fields)
+        except Exception as e:
+            logger.warning(f"Google Details 조회 실패 (place_id={entry.place_id}): {e}")
+            details = None
+
+        try:
+            if not details:
+                self.failed += 1
+                places_col.update_one(
+                    {"place_id": entry.place_id},
+                    {"$set": {"google_details_retry_at": now + REFRESH_RETRY_AFTER}},
+                )
+                return False
+
+            doc = places_col.find_one({"place_id": entry.place_id}, {"_id": 0})
+            if not doc:
+                return False
+            refreshed_at = dict(doc.get("google_details_refreshed_at") or {})
+            refreshed_at.update({group: now for group in groups})
+            updates = details_to_fields(details, groups)
+            updates["google_details_refreshed_at"] = refreshed_at
+            updates["google_details_updated_at"] = now
+            # 사진/평점이 바뀌면 표시 필드(imageUrl / googleRating 등)도 같은 쓰기에서 다시 계산
+            update_place(doc, updates, places_col, unset=("google_details_retry_at",))
+            self.refreshed += 1
+            return True
+        except Exception as e:
+            logger.warning(f"Google Details 저장 실패 (place_id={entry.place_id}): {e}")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "calls_today": self._calls_today,
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+        }
+
+
+google_details_refresher = GoogleDetailsRefresher()
@@ -7,17 +7,23 @@ Google Places API 래퍼
 from __future__ import annotations
 
 import re
-from typing import Optional, Dict, Any
+from typing import Any, Dict, Iterable, Optional
 from urllib.parse import urlencode
 from urllib import request as urlrequest
 import json
 import logging
 
 from app.core.config import settings
+from app.core.image_urls import google_photo_source_url
 
 
 logger = logging.getLogger(__name__)
 
+DETAILS_ALL_FIELDS = (
+    "place_id,name,formatted_address,formatted_phone_number,geometry,website,types,"
+    "rating,user_ratings_total,opening_hours,reviews,photos"
+)
+
 
 def normalize_place_name_for_google(raw_name: str) -> str:
     """
@@ -108,26 +114,26 @@ class GooglePlacesService:
             "user_ratings_total": cand.get("user_ratings_total"),
         }
 
-        # 대표 사진 1장 URL 생성 (프리패치용)
+        # 대표 사진 1장 원본 출처 (프리패치용, API 키 없이 저장하고 응답 시 이미지 프록시 URL로 변환)
         photos_raw = cand.get("photos") or []
         if photos_raw and self.api_key:
             ref = photos_raw[0].get("photo_reference")
             if ref:
-                url = f"{self.BASE_URL}/photo?maxwidth=800&photo_reference={ref}&key={self.api_key}"
-                out["google_photos"] = [{"url": url}]
+                out["google_photos"] = [{"url": google_photo_source_url(ref, 640)}]
         return out
 
-    def get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+    def get_place_details(self, place_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Google Place Details API 호출.
         - 별점/리뷰/영업시간 등의 상세 정보를 반환.
+        - fields: 요청할 필드 (없으면 전체, 요청하지 않은 필드는 None으로 반환)
         """
         if not place_id:
             return None
 
         params = {
             "place_id": place_id,
-            "fields": "place_id,name,formatted_address,formatted_phone_number,geometry,website,types,rating,user_ratings_total,opening_hours,reviews,photos",
+            "fields": ",".join(["place_id", *fields]) if fields else DETAILS_ALL_FIELDS,
             "language": "ko",
         }
         data = self._request("/details/json", params)
@@ -145,10 +151,9 @@ class GooglePlacesService:
             ref = p.get("photo_reference")
             if not ref:
                 continue
-            # 서버에서 완성된 URL을 만들어 프론트에서는 바로 사용하도록 함
-            url = f"{self.BASE_URL}/photo?maxwidth=1600&photo_reference={ref}&key={self.api_key}"
+            # API 키 없는 원본 출처로 저장 (응답 시 이미지 프록시 URL로 변환)
             photos.append({
-                "url": url,
+                "url": google_photo_source_url(ref, 1280),
                 "width": p.get("width"),
                 "height": p.get("height"),
             })
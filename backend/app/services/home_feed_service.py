@@ -0,0 +1,177 @@
+"""
+홈 피드 스냅샷
+- 홈 화면의 모든 섹션을 주기적으로(HOME_FEED_REFRESH_SECONDS) 미리 만들어 프로세스 메모리에 보관
+  - 섹션마다 랜덤 변형 HOME_FEED_VARIANTS개 (기존 refresh_section의 랜덤 지역/샘플링 그대로 사용)
+  - 스냅샷은 버전 번호로 구분하고 통째로 교체 (요청 처리 중 일부만 바뀌지 않음)
+  - 변형별 ETag는 스냅샷을 만들 때 섹션 내용 해시로 계산 (워커/재시작이 달라도 내용이 같으면 같은 ETag)
+- GET /home은 스냅샷에서 바로 응답 → 홈 응답 시간이 TourAPI/Kakao 응답 시간과 무관
+- 갱신은 전용 스레드의 이벤트 루프에서 실행 (외부 API 호출이 동기라서 서버 이벤트 루프를 막지 않도록)
+- 섹션 생성이 실패하면 이전 스냅샷의 해당 섹션을 그대로 유지
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOME_SECTION_TYPES: Tuple[str, ...] = ("restaurant", "shopping", "accommodation", "travel_course")
+HOME_FEED_VARIANTS = 3
+HOME_FEED_SECTION_LIMIT = 6
+HOME_FEED_REFRESH_SECONDS = 30 * 60
+# 실패 후 다시 만들기까지 대기 (초)
+HOME_FEED_RETRY_SECONDS = 60
+# 첫 스냅샷이 아직 없을 때 요청이 기다리는 최대 시간 (초)
+HOME_FEED_FIRST_BUILD_TIMEOUT_SECONDS = 20
+
+
+@dataclass(frozen=True)
+class HomeFeedSnapshot:
+    version: int
+    built_at: datetime
+    # section_type → 변형 목록 (변형마다 refresh_section 응답)
+    sections: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # 변형 번호 → 해당 변형 섹션 내용의 ETag
+    etags: Dict[int, str] = field(default_factory=dict)
+
+
+def _variant_sections(sections: Dict[str, List[Dict[str, Any]]], variant: int) -> Dict[str, Dict[str, Any]]:
+    return {section_type: variants[variant % len(variants)] for section_type, variants in sections.items()}
+
+
+def _variant_etags(sections: Dict[str, List[Dict[str, Any]]]) -> Dict[int, str]:
+    from app.core.http_cache import payload_etag
+
+    return {
+        variant: payload_etag({"variant": variant, "sections": _variant_sections(sections, variant)})
+        for variant in range(HOME_FEED_VARIANTS)
+    }
+
+
+class HomeFeedBuilder:
+    """홈 피드 스냅샷 생성/보관 (프로세스당 갱신 스레드 1개)"""
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[HomeFeedSnapshot] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._version = 0
+        self.builds = 0
+        self.failures = 0
+
+    @property
+    def snapshot(self) -> Optional[HomeFeedSnapshot]:
+        return self._snapshot
+
+    def start(self) -> None:
+        """갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="home-feed", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ok = asyncio.run(self.build())
+            except Exception as e:
+                logger.warning(f"홈 피드 스냅샷 생성 실패: {e}")
+                ok = False
+            self._stop.wait(HOME_FEED_REFRESH_SECONDS if ok else HOME_FEED_RETRY_SECONDS)
+
+    async def _build_section(self, section_type: str) -> List[Dict[str, Any]]:
+        from app.services.tour_service import TourService
+
+        tour_service = TourService()
+        variants: List[Dict[str, Any]] = []
+        seen = set()
+        for _ in range(HOME_FEED_VARIANTS):
+            try:
+                result = await tour_service.refresh_section(section_type, HOME_FEED_SECTION_LIMIT)
+            except Exception as e:
+                logger.warning(f"홈 피드 섹션 생성 실패 (section_type={section_type}): {e}")
+                continue
+            places = result.get("places") or []
+            # 같은 장소 구성의 변형은 하나만 유지
+            key = tuple(sorted(str(p.get("place_id")) for p in places))
+            if not places or key in seen:
+                continue
+            seen.add(key)
+            variants.append(result)
+        return variants
+
+    async def build(self) -> bool:
+        """모든 섹션의 변형을 만들어 새 버전으로 교체. 한 섹션이라도 만들었으면 True"""
+        previous = self._snapshot
+        results = await asyncio.gather(*(self._build_section(s) for s in HOME_SECTION_TYPES))
+        sections: Dict[str, List[Dict[str, Any]]] = {}
+        built = 0
+        for section_type, variants in zip(HOME_SECTION_TYPES, results):
+            if variants:
+                sections[section_type] = variants
+                built += 1
+            elif previous and previous.sections.get(section_type):
+                sections[section_type] = previous.sections[section_type]
+        if not built:
+            self.failures += 1
+            return False
+
+        etags = _variant_etags(sections)
+        with self._lock:
+            self._version += 1
+            self._snapshot = HomeFeedSnapshot(
+                version=self._version, built_at=datetime.utcnow(), sections=sections, etags=etags
+            )
+        self._ready.set()
+        self.builds += 1
+        logger.info(
+            f"홈 피드 스냅샷 v{self._version} 생성 "
+            f"({', '.join(f'{s}={len(v)}' for s, v in sections.items())})"
+        )
+        return True
+
+    def wait_ready(self, timeout: float = HOME_FEED_FIRST_BUILD_TIMEOUT_SECONDS) -> Optional[HomeFeedSnapshot]:
+        """첫 스냅샷이 없으면 갱신 스레드를 시작하고 최대 timeout초 대기"""
+        if self._snapshot is None:
+            self.start()
+            self._ready.wait(timeout)
+        return self._snapshot
+
+    @staticmethod
+    def pick(snapshot: HomeFeedSnapshot, variant: Optional[int] = None) -> Dict[str, Any]:
+        """
+        스냅샷에서 변형 1개씩 골라 홈 응답 생성.
+        - variant가 없으면 랜덤 (반환한 variant를 다시 보내면 같은 구성)
+        """
+        variant = random.randrange(HOME_FEED_VARIANTS) if variant is None else variant % HOME_FEED_VARIANTS
+        return {
+            "version": snapshot.version,
+            "built_at": snapshot.built_at,
+            "variant": variant,
+            "sections": _variant_sections(snapshot.sections, variant),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "built_at": snapshot.built_at if snapshot else None,
+            "builds": self.builds,
+            "failures": self.failures,
+        }
+
+
+home_feed_builder = HomeFeedBuilder()
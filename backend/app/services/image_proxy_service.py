@@ -0,0 +1,224 @@
+"""
+장소 이미지 프록시 (Google Places 사진 / TourAPI 이미지)
+- 토큰(app.core.image_urls)으로 원본을 확인하고, 표준 너비(IMAGE_WIDTHS)로 줄인 WebP를 반환
+- 디스크 캐시: 원본 기준 해시(콘텐츠 주소)로 원본 1개 + 너비별 WebP 저장
+  - Google 사진은 원본 요청마다 과금되므로 원본을 한 번만 받아 두고 모든 너비를 여기서 만듦
+- 같은 토큰+너비의 결과는 바뀌지 않으므로 강한 ETag + 장기 Cache-Control(immutable)로 응답
+- 원본 요청의 리다이렉트는 원본 종류별 허용 호스트로만 따라감 (Google 사진 → googleusercontent.com)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib import request as urlrequest
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlparse
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+from app.core.image_urls import (
+    GOOGLE_PHOTO_HOST,
+    IMAGE_SOURCE_GOOGLE,
+    IMAGE_URL_HOSTS,
+    image_source_key,
+    is_proxyable_image_url,
+    parse_image_token,
+    snap_image_width,
+)
+from app.services.google_places_service import google_places_service
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+IMAGE_MEDIA_TYPE = "image/webp"
+IMAGE_WEBP_QUALITY = 80
+# 원본 요청 (Google은 제공 최대 너비보다 약간 크게 받아 둠)
+IMAGE_FETCH_TIMEOUT_SECONDS = 10
+IMAGE_FETCH_MAX_BYTES = 10 * 1024 * 1024
+GOOGLE_PHOTO_FETCH_WIDTH = 1600
+# 원본 요청이 리다이렉트로 따라갈 수 있는 호스트 (정확히 일치 / 하위 도메인 접미사)
+GOOGLE_PHOTO_REDIRECT_HOSTS: Tuple[str, ...] = (GOOGLE_PHOTO_HOST,)
+GOOGLE_PHOTO_REDIRECT_HOST_SUFFIXES: Tuple[str, ...] = (".googleusercontent.com",)
+# 원본 해시별 락 개수 (같은 이미지를 동시에 여러 번 받지 않도록, 개수 고정)
+IMAGE_LOCK_STRIPES = 64
+
+
+def _host_allowed(url: str, hosts: Tuple[str, ...], suffixes: Tuple[str, ...] = ()) -> bool:
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    return parsed.scheme in ("http", "https") and (host in hosts or any(host.endswith(s) for s in suffixes))
+
+
+class _AllowlistRedirectHandler(urlrequest.HTTPRedirectHandler):
+    """허용 호스트가 아닌 곳으로의 리다이렉트 거부"""
+
+    def __init__(self, hosts: Tuple[str, ...], suffixes: Tuple[str, ...] = ()) -> None:
+        self.hosts = hosts
+        self.suffixes = suffixes
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if not _host_allowed(newurl, self.hosts, self.suffixes):
+            raise HTTPError(newurl, code, f"Redirect to a host that is not allowed: {urlparse(newurl).hostname}", headers, fp)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def _etag(key: str, width: int) -> str:
+    return f'"{key[:32]}-{width}"'
+
+
+@dataclass(frozen=True)
+class ProxiedImage:
+    data: bytes
+    etag: str
+    media_type: str = IMAGE_MEDIA_TYPE
+
+
+class ImageProxyService:
+    """토큰 → 너비별 WebP (디스크 캐시)"""
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = Path(cache_dir or settings.IMAGE_CACHE_DIR)
+        # 원본 해시로 고르는 락 (개수 고정, 다른 이미지가 같은 락을 쓰면 순서대로 처리될 뿐)
+        self._locks = [threading.Lock() for _ in range(IMAGE_LOCK_STRIPES)]
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    @staticmethod
+    def etag_for(token: str, width: Optional[int]) -> Optional[str]:
+        """토큰+너비의 ETag (원본을 읽지 않고 계산, If-None-Match 비교용). 토큰이 잘못되면 None"""
+        source = parse_image_token(token)
+        if not source:
+            return None
+        return _etag(image_source_key(*source), snap_image_width(width))
+
+    def get_image(self, token: str, width: Optional[int] = None) -> ProxiedImage:
+        """
+        토큰+너비 → WebP 이미지.
+        - 토큰이 잘못되면 ValueError, 원본을 가져오지 못하면 LookupError
+        """
+        source = parse_image_token(token)
+        if not source:
+            raise ValueError("Invalid image token")
+        kind, ref = source
+        key = image_source_key(kind, ref)
+        width = snap_image_width(width)
+        etag = _etag(key, width)
+
+        variant_path = self._path(key, f"_{width}.webp")
+        data = self._read(variant_path)
+        if data is not None:
+            self.hits += 1
+            return ProxiedImage(data=data, etag=etag)
+
+        with self._lock_for(key):
+            data = self._read(variant_path)
+            if data is None:
+                self.misses += 1
+                original = self._original(key, kind, ref)
+                data = self._resize(original, width)
+                self._write(variant_path, data)
+            else:
+                self.hits += 1
+        return ProxiedImage(data=data, etag=etag)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[int(key[:8], 16) % len(self._locks)]
+
+    @staticmethod
+    def _read(path: Path) -> Optional[bytes]:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체 (동시 요청/다른 워커가 반쯤 쓴 파일을 읽지 않도록)"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"이미지 캐시 저장 실패 ({path}): {e}")
+
+    def _original(self, key: str, kind: str, ref: str) -> bytes:
+        path = self._path(key, ".orig")
+        data = self._read(path)
+        if data is not None:
+            return data
+        data = self._fetch(kind, ref)
+        # 이미지가 아닌 응답(오류 페이지 등)은 캐시하지 않음
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image.verify()
+        except Exception as e:
+            raise LookupError(f"Invalid image data: {e}") from e
+        self._write(path, data)
+        return data
+
+    def _fetch(self, kind: str, ref: str) -> bytes:
+        if kind == IMAGE_SOURCE_GOOGLE:
+            if not google_places_service.api_key:
+                raise LookupError("Google Places API key is not configured")
+            query = urlencode({
+                "maxwidth": GOOGLE_PHOTO_FETCH_WIDTH,
+                "photo_reference": ref,
+                "key": google_places_service.api_key,
+            })
+            url = f"{google_places_service.BASE_URL}/photo?{query}"
+            redirect = _AllowlistRedirectHandler(GOOGLE_PHOTO_REDIRECT_HOSTS, GOOGLE_PHOTO_REDIRECT_HOST_SUFFIXES)
+        else:
+            # 서명된 토큰이라도 허용 호스트를 다시 확인 (허용 목록이 줄어든 경우)
+            if not is_proxyable_image_url(ref):
+                raise LookupError("Image host is not allowed")
+            url = ref
+            redirect = _AllowlistRedirectHandler(IMAGE_URL_HOSTS)
+
+        self.fetches += 1
+        try:
+            req = urlrequest.Request(url, headers={"User-Agent": "jiobi-image-proxy"})
+            opener = urlrequest.build_opener(redirect)
+            with opener.open(req, timeout=IMAGE_FETCH_TIMEOUT_SECONDS) as resp:
+                data = resp.read(IMAGE_FETCH_MAX_BYTES + 1)
+        except Exception as e:
+            raise LookupError(f"Image fetch failed: {e}") from e
+        if len(data) > IMAGE_FETCH_MAX_BYTES:
+            raise LookupError("Image is too large")
+        return data
+
+    @staticmethod
+    def _resize(original: bytes, width: int) -> bytes:
+        """원본 → 지정 너비 WebP (원본보다 크게 늘리지 않음)"""
+        try:
+            with Image.open(io.BytesIO(original)) as image:
+                image = ImageOps.exif_transpose(image)
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+                if image.width > width:
+                    height = max(round(image.height * width / image.width), 1)
+                    image = image.resize((width, height), Image.LANCZOS)
+                out = io.BytesIO()
+                image.save(out, format="WEBP", quality=IMAGE_WEBP_QUALITY, method=4)
+                return out.getvalue()
+        except (OSError, ValueError) as e:
+            raise LookupError(f"Invalid image data: {e}") from e
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "fetches": self.fetches}
+
+
+image_proxy_service = ImageProxyService()
@@ -7,11 +7,18 @@ from geopy.distance import geodesic
 import logging
 import asyncio
 from app.core.mongodb import get_database
+from app.core.place_display import ensure_display_fields
 from app.models.place_models import PlaceNormalizer
+from app.services.place_store import upsert_place
+from app.services.place_spatial_index import place_spatial_index
 import re
 
 logger = logging.getLogger(__name__)
 
+# 숙소 추천: 공간 인덱스(places)에서 이 개수 이상 찾으면 Kakao 카테고리 검색 생략
+MIN_LOCAL_ACCOMMODATIONS = 3
+ACCOMMODATION_SEARCH_RADIUS_M = 5000
+
 class LogisticsService:
     def __init__(self):
         self.tour_service = TourService()
@@ -57,11 +64,7 @@ class LogisticsService:
                                 # search_result는 이미 PlaceNormalizer에서 온 표준 딕셔너리라고 가정
                                 place_doc = dict(search_result)
                                 place_doc["place_id"] = place_id_value
-                                places_col.update_one(
-                                    {"place_id": place_id_value},
-                                    {"$set": place_doc},
-                                    upsert=True,
-                                )
+                                upsert_place(place_doc, places_col)
                         except Exception as e:
                             logger.warning(f"Failed to upsert place for logistics item ({keyword}): {e}")
                     else:
@@ -312,13 +315,46 @@ class LogisticsService:
                 else:
                     item.description = warning
 
+    def _local_accommodations_near(self, lat: float, lng: float, limit: int = 10) -> list[dict]:
+        """
+        places에 저장된 Kakao 숙소 중 반경 내 가까운 순 (Kakao 카테고리 검색 응답 형태로 변환).
+        Kakao에서 온 장소(kakao_url 있음)만 사용해 이후 from_kakao_api 변환 결과가 원본과 같게 유지.
+        """
+        if not place_spatial_index.ready:
+            return []
+        hits = place_spatial_index.radius(lat, lng, ACCOMMODATION_SEARCH_RADIUS_M, limit=limit, bucket="stay")
+        if not hits:
+            return []
+        place_ids = [pid for pid, _ in hits]
+        docs = {
+            doc["place_id"]: doc
+            for doc in self.db.places.find({"place_id": {"$in": place_ids}, "kakao_url": {"$ne": None}}, {"_id": 0})
+        }
+        documents = []
+        for pid in place_ids:
+            doc = docs.get(pid)
+            if not doc or doc.get("latitude") is None or doc.get("longitude") is None:
+                continue
+            address_name = doc.get("address_name") or doc.get("address") or ""
+            documents.append({
+                "id": pid,
+                "place_name": doc.get("title") or doc.get("place_name") or "",
+                "category_name": doc.get("description") or "",
+                "address_name": address_name,
+                "road_address_name": (doc.get("address") or "") if doc.get("address") != address_name else "",
+                "x": str(doc["longitude"]),
+                "y": str(doc["latitude"]),
+            })
+        return documents
+
     async def _add_accommodations(self, plan: OptimizedPlanResponse, region: Optional[str] = None) -> None:
         """
         각 날짜의 마지막 장소와 다음 날 첫 장소 사이에 위치한 숙소를 자동으로 추천하여
         Day별 일정 마지막에 '숙소' 타입 ScheduleItem을 추가한다.
         """
-        # Kakao API 키가 없으면 숙소 추천 스킵
-        if not getattr(self.kakao_api, "api_key", None):
+        # Kakao API 키도 없고 공간 인덱스도 준비되지 않았으면 숙소 추천 스킵
+        has_kakao = bool(getattr(self.kakao_api, "api_key", None))
+        if not has_kakao and not place_spatial_index.ready:
             logger.info("Kakao API key not configured. Skipping accommodation suggestions.")
             return
 
@@ -371,16 +407,19 @@ class LogisticsService:
                     mid_lat = lat1
                     mid_lng = lng1
 
-                # 숙소 검색 (동기 API를 쓰므로 스레드로 감싸서 호출)
-                result = await asyncio.to_thread(
-                    self.kakao_api.search_accommodation_near,
-                    mid_lat,
-                    mid_lng,
-                    5000,
-                    1,
-                    5,
-                )
-                documents = (result or {}).get("documents") or []
+                # 숙소 검색: 이미 저장된 Kakao 숙소(공간 인덱스) 우선, 부족하면 Kakao 카테고리 검색
+                documents = self._local_accommodations_near(mid_lat, mid_lng)
+                if len(documents) < MIN_LOCAL_ACCOMMODATIONS and has_kakao:
+                    # 동기 API를 쓰므로 스레드로 감싸서 호출
+                    result = await asyncio.to_thread(
+                        self.kakao_api.search_accommodation_near,
+                        mid_lat,
+                        mid_lng,
+                        ACCOMMODATION_SEARCH_RADIUS_M,
+                        1,
+                        5,
+                    )
+                    documents = (result or {}).get("documents") or []
 
                 # 모텔 제외 필터링
                 filtered_docs = []
@@ -499,11 +538,7 @@ class LogisticsService:
                             logger.warning(f"Failed to enrich accommodation with Google data: {e}")
 
                         if place_id_value:
-                            places_col.update_one(
-                                {"place_id": place_id_value},
-                                {"$set": place_doc},
-                                upsert=True,
-                            )
+                            upsert_place(place_doc, places_col)
                     except Exception as e:
                         logger.warning(f"Failed to normalize/upsert accommodation place: {e}")
                         place_id_value = None
@@ -526,13 +561,7 @@ class LogisticsService:
                         db_doc = places_col.find_one({"place_id": place_id_value}) or {}
                         google_rating = db_doc.get("google_rating")
                         google_ratings_total = db_doc.get("google_ratings_total")
-                        photos = db_doc.get("google_photos") or []
-                        if photos and isinstance(photos, list):
-                            first_photo = photos[0]
-                            if isinstance(first_photo, dict):
-                                image_url = first_photo.get("url")
-                        if not image_url:
-                            image_url = db_doc.get("image")
+                        image_url = ensure_display_fields(db_doc).get("imageUrl")
 
                     tag_type = cand.get("tag_type")
                     tag_label = cand.get("tag_label")
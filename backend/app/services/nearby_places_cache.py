@@ -0,0 +1,109 @@
+"""
+상세 페이지 "주변 장소" 결과 캐시
+- (place_id, k, category, ranked) 단위로 프로세스 메모리에 캐시 (TTL + LRU)
+- 항목마다 기준 좌표와 결과 반경을 함께 저장해, 그 반경 안의 장소가 upsert되면(주변이 바뀌면) 무효화
+  - 무효화는 upsert를 처리한 프로세스에만 적용되므로, 다른 워커는 짧은 TTL로 최신 결과를 맞춤
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from app.core.geo import haversine_m, to_float
+
+logger = logging.getLogger(__name__)
+
+# 다른 워커 프로세스의 upsert는 무효화되지 않으므로 뷰포트 타일 메모리 캐시와 같은 짧은 TTL
+NEARBY_CACHE_TTL_SECONDS = 60
+NEARBY_CACHE_MAX_ENTRIES = 5000
+_M_PER_DEG_LAT = 111_000.0
+
+NearbyKey = Tuple[str, int, str, bool]
+
+
+def nearby_cache_key(place_id: str, k: int, category: Optional[str], ranked: bool) -> NearbyKey:
+    return (place_id, k, (category or "").strip().lower(), ranked)
+
+
+@dataclass
+class _NearbyEntry:
+    expires_at: float
+    lat: float
+    lng: float
+    # 결과 중 가장 먼 장소까지의 거리 (이 안에 새 장소가 생기면 결과가 바뀔 수 있음)
+    radius_m: float
+    place_ids: FrozenSet[str]
+    result: Dict[str, Any]
+
+
+class NearbyPlacesCache:
+    """주변 장소 결과 메모리 캐시"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[NearbyKey, _NearbyEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: NearbyKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+
+    def put(self, key: NearbyKey, lat: float, lng: float, radius_m: float, result: Dict[str, Any]) -> None:
+        place_ids = frozenset(str(p.get("place_id")) for p in result.get("places") or [])
+        entry = _NearbyEntry(
+            expires_at=time.monotonic() + NEARBY_CACHE_TTL_SECONDS,
+            lat=lat,
+            lng=lng,
+            radius_m=radius_m,
+            place_ids=place_ids,
+            result=result,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > NEARBY_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def invalidate_place(self, doc: Dict[str, Any]) -> None:
+        """
+        upsert된 장소의 영향을 받는 항목 삭제:
+        - 그 장소가 기준이거나 결과에 포함된 항목
+        - 그 장소가 결과 반경 안에 들어오는 항목
+        """
+        place_id = str(doc.get("place_id") or "")
+        lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == place_id
+                or place_id in entry.place_ids
+                or (
+                    lat is not None
+                    and lng is not None
+                    # 위도 차이만으로 먼저 걸러냄 (위도 1도 ≈ 111km)
+                    and abs(entry.lat - lat) * _M_PER_DEG_LAT <= entry.radius_m
+                    and haversine_m(entry.lat, entry.lng, lat, lng) <= entry.radius_m
+                )
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+nearby_places_cache = NearbyPlacesCache()
@@ -0,0 +1,330 @@
+"""
+지도 뷰포트 클러스터링
+- 줌 레벨별 고정 크기 격자(셀)에 장소 수/좌표 합/대표 장소를 미리 집계
+- 뷰포트 요청 시 범위 안의 셀 집계만 읽어 클러스터(중심 좌표, 개수, 상위 대표 장소)로 반환
+- 셀 수가 MAX_CLUSTERS를 넘으면 더 큰 격자로 올려서 응답 크기를 제한 (뷰포트가 아무리 넓어도 일정)
+- 카테고리 버킷(food/cafe/spot ...)별 집계도 함께 유지
+- 앱 시작 시 places에서 로드, 이후 upsert 시점마다 증분 반영
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.geo import grid_cell, to_float, zoom_for_bbox
+from app.core.place_display import DISPLAY_VERSION_FIELD, ensure_display_fields
+from app.core.mongodb import get_database
+from app.services.ranking import RANKING_PROFILES, score_places
+
+logger = logging.getLogger(__name__)
+
+# 집계하는 줌 레벨 범위 (웹 지도 줌 기준). 이보다 확대된 화면은 개별 장소로 응답
+CLUSTER_MIN_ZOOM = 5
+CLUSTER_MAX_ZOOM = 16
+# 화면에서 셀 하나가 차지하는 대략적인 크기 (픽셀)
+CLUSTER_CELL_PX = 64
+# 응답 클러스터 최대 개수 / 클러스터당 대표 장소 수
+MAX_CLUSTERS = 200
+REPRESENTATIVES_PER_CELL = 3
+
+# 카테고리 버킷: 장소 category/google_types/description에 포함된 키워드로 판단
+CATEGORY_BUCKETS: Dict[str, Tuple[str, ...]] = {
+    "food": ("food", "restaurant", "음식", "식당"),
+    "cafe": ("cafe", "카페"),
+    "spot": ("tour", "attraction", "명소", "관광"),
+    "stay": ("lodging", "accommodation", "숙박", "호텔", "펜션", "모텔"),
+    "shopping": ("shopping", "store", "쇼핑", "시장", "백화점"),
+}
+ALL_BUCKET = "all"
+
+# 로드 시 가져올 필드 (대표 장소 표시용 요약 포함)
+CLUSTER_PROJECTION = {
+    "_id": 0,
+    "place_id": 1,
+    "title": 1,
+    "place_name": 1,
+    "category": 1,
+    "description": 1,
+    "google_types": 1,
+    "latitude": 1,
+    "longitude": 1,
+    "region": 1,
+    "district": 1,
+    "image": 1,
+    "google_photos": 1,
+    "google_rating": 1,
+    "google_ratings_total": 1,
+    "imageUrl": 1,
+    "googleRating": 1,
+    "googleRatingsTotal": 1,
+    DISPLAY_VERSION_FIELD: 1,
+}
+
+
+def cell_deg_for_zoom(zoom: int) -> float:
+    """줌 레벨의 격자 크기 (도 단위)"""
+    return CLUSTER_CELL_PX * 360.0 / (256 * 2 ** zoom)
+
+
+def category_buckets(doc: Dict[str, Any]) -> Set[str]:
+    """장소가 속한 카테고리 버킷"""
+    google_types = doc.get("google_types") or []
+    text = " ".join(
+        filter(None, [
+            str(doc.get("category") or ""),
+            str(doc.get("description") or "")[:50],
+            " ".join(str(t) for t in google_types) if isinstance(google_types, list) else "",
+        ])
+    ).lower()
+    return {name for name, keywords in CATEGORY_BUCKETS.items() if any(k in text for k in keywords)}
+
+
+def _summary(doc: Dict[str, Any], lat: float, lng: float) -> Dict[str, Any]:
+    """클러스터 대표 장소로 내려줄 요약 필드 (표시 필드는 저장된 값 사용)"""
+    display = ensure_display_fields(doc)
+    summary = {
+        "place_id": str(doc.get("place_id") or doc.get("id")),
+        "title": doc.get("title") or doc.get("place_name"),
+        "category": doc.get("category"),
+        "region": doc.get("region"),
+        "district": doc.get("district"),
+        "latitude": lat,
+        "longitude": lng,
+        "imageUrl": display.get("imageUrl"),
+        "googleRating": display.get("googleRating"),
+        "googleRatingsTotal": display.get("googleRatingsTotal"),
+    }
+    return {k: v for k, v in summary.items() if v is not None}
+
+
+@dataclass
+class _Point:
+    lat: float
+    lng: float
+    score: float
+    buckets: Tuple[str, ...]
+    summary: Dict[str, Any]
+
+
+@dataclass
+class _CellAggregate:
+    count: int = 0
+    sum_lat: float = 0.0
+    sum_lng: float = 0.0
+    members: Set[str] = field(default_factory=set)
+    # 대표 장소 (score 내림차순 place_id), None이면 다음 조회 시 members에서 재계산
+    top: Optional[List[str]] = None
+
+
+class PlaceClusterIndex:
+    """줌 레벨별 격자 집계 (프로세스 메모리)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._points: Dict[str, _Point] = {}
+        # (zoom, bucket) -> {cell: aggregate}
+        self._cells: Dict[Tuple[int, str], Dict[Tuple[int, int], _CellAggregate]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def load(self) -> int:
+        """places 컬렉션 중 좌표가 있는 장소 전체 집계 (시작 시 1회)"""
+        try:
+            db = get_database()
+            docs = list(db.places.find({"place_id": {"$ne": None}, "latitude": {"$ne": None}}, CLUSTER_PROJECTION))
+            # 대표 장소 선정용 점수는 한 번에 계산
+            scores = score_places(docs, RANKING_PROFILES["section"])
+            for doc, score in zip(docs, scores):
+                self._add(doc, float(score))
+            self.ready = True
+            logger.info(f"지도 클러스터 인덱스 로드 완료: {len(self._points)}건")
+            return len(self._points)
+        except Exception as e:
+            logger.warning(f"지도 클러스터 인덱스 로드 실패: {e}")
+            return 0
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        """장소 1건 추가/갱신 (place_id 기준)"""
+        if not isinstance(doc, dict):
+            return
+        place_id = doc.get("place_id") or doc.get("id")
+        if not place_id:
+            return
+        self._add(doc, float(score_places([doc], RANKING_PROFILES["section"])[0]))
+
+    def _add(self, doc: Dict[str, Any], score: float) -> None:
+        place_id = str(doc.get("place_id") or doc.get("id"))
+        lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+        with self._lock:
+            old = self._points.get(place_id)
+            if lat is None or lng is None:
+                # 좌표가 없는 부분 갱신은 기존 좌표 유지
+                if not old:
+                    return
+                lat, lng = old.lat, old.lng
+            buckets = category_buckets(doc)
+            summary = _summary(doc, lat, lng)
+            if old:
+                # 일부 필드만 담긴 갱신이면 기존 요약/버킷 유지
+                summary = {**old.summary, **summary}
+                if not buckets:
+                    buckets = set(old.buckets) - {ALL_BUCKET}
+            point = _Point(
+                lat=lat,
+                lng=lng,
+                score=score,
+                buckets=(ALL_BUCKET, *sorted(buckets)),
+                summary=summary,
+            )
+            if old:
+                self._remove_locked(place_id)
+            self._points[place_id] = point
+            for zoom in range(CLUSTER_MIN_ZOOM, CLUSTER_MAX_ZOOM + 1):
+                cell = grid_cell(lat, lng, cell_deg_for_zoom(zoom))
+                for bucket in point.buckets:
+                    agg = self._cells.setdefault((zoom, bucket), {}).setdefault(cell, _CellAggregate())
+                    agg.count += 1
+                    agg.sum_lat += lat
+                    agg.sum_lng += lng
+                    agg.members.add(place_id)
+                    if agg.top is not None:
+                        agg.top = heapq.nlargest(
+                            REPRESENTATIVES_PER_CELL, [*agg.top, place_id], key=lambda pid: self._points[pid].score
+                        )
+
+    def remove(self, place_id: str) -> None:
+        with self._lock:
+            self._remove_locked(str(place_id))
+
+    def _remove_locked(self, place_id: str) -> None:
+        old = self._points.pop(place_id, None)
+        if not old:
+            return
+        for zoom in range(CLUSTER_MIN_ZOOM, CLUSTER_MAX_ZOOM + 1):
+            cell = grid_cell(old.lat, old.lng, cell_deg_for_zoom(zoom))
+            for bucket in old.buckets:
+                cells = self._cells.get((zoom, bucket), {})
+                agg = cells.get(cell)
+                if not agg:
+                    continue
+                agg.count -= 1
+                agg.sum_lat -= old.lat
+                agg.sum_lng -= old.lng
+                agg.members.discard(place_id)
+                if not agg.members:
+                    del cells[cell]
+                elif agg.top is not None and place_id in agg.top:
+                    agg.top = None
+
+    def _top(self, agg: _CellAggregate) -> List[str]:
+        if agg.top is None:
+            agg.top = heapq.nlargest(
+                REPRESENTATIVES_PER_CELL, agg.members, key=lambda pid: self._points[pid].score
+            )
+        return agg.top
+
+    def _cells_in_bbox(
+        self, zoom: int, bucket: str, sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float
+    ) -> Optional[List[Tuple[Tuple[int, int], _CellAggregate]]]:
+        """뷰포트 안의 비어 있지 않은 셀 (MAX_CLUSTERS 초과 시 None)"""
+        cells = self._cells.get((zoom, bucket), {})
+        deg = cell_deg_for_zoom(zoom)
+        min_row, min_col = grid_cell(sw_lat, sw_lng, deg)
+        max_row, max_col = grid_cell(ne_lat, ne_lng, deg)
+        span = (max_row - min_row + 1) * (max_col - min_col + 1)
+        found = []
+        if span <= len(cells):
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    agg = cells.get((row, col))
+                    if agg:
+                        found.append(((row, col), agg))
+                        if len(found) > MAX_CLUSTERS:
+                            return None
+        else:
+            for (row, col), agg in cells.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    found.append(((row, col), agg))
+                    if len(found) > MAX_CLUSTERS:
+                        return None
+        return found
+
+    def clusters(
+        self,
+        sw_lat: float,
+        sw_lng: float,
+        ne_lat: float,
+        ne_lng: float,
+        zoom: Optional[int] = None,
+        bucket: str = ALL_BUCKET,
+    ) -> Dict[str, Any]:
+        """
+        뷰포트 클러스터.
+        - zoom이 없으면 뷰포트 폭으로 추정, 셀이 너무 많으면 MAX_CLUSTERS 안에 들어오는 줌으로 조정
+        - 장소가 1개인 셀은 places에, 2개 이상은 clusters에 담음
+        """
+        if zoom is None:
+            zoom = zoom_for_bbox(sw_lng, ne_lng)
+        start = max(CLUSTER_MIN_ZOOM, min(zoom, CLUSTER_MAX_ZOOM))
+        with self._lock:
+            used_zoom, found = CLUSTER_MIN_ZOOM, []
+            for candidate in range(start, CLUSTER_MIN_ZOOM - 1, -1):
+                cells = self._cells_in_bbox(candidate, bucket, sw_lat, sw_lng, ne_lat, ne_lng)
+                if cells is not None:
+                    used_zoom, found = candidate, cells
+                    break
+            else:
+                # 가장 큰 격자로도 넘치면 장소 수가 많은 셀부터 MAX_CLUSTERS개
+                cells = self._cells.get((CLUSTER_MIN_ZOOM, bucket), {})
+                deg = cell_deg_for_zoom(CLUSTER_MIN_ZOOM)
+                min_row, min_col = grid_cell(sw_lat, sw_lng, deg)
+                max_row, max_col = grid_cell(ne_lat, ne_lng, deg)
+                found = heapq.nlargest(
+                    MAX_CLUSTERS,
+                    (
+                        (cell, agg) for cell, agg in cells.items()
+                        if min_row <= cell[0] <= max_row and min_col <= cell[1] <= max_col
+                    ),
+                    key=lambda item: item[1].count,
+                )
+
+            deg = cell_deg_for_zoom(used_zoom)
+            clusters: List[Dict[str, Any]] = []
+            places: List[Dict[str, Any]] = []
+            total = 0
+            for (row, col), agg in found:
+                total += agg.count
+                representatives = [self._points[pid].summary for pid in self._top(agg)]
+                if agg.count == 1:
+                    places.extend(representatives)
+                    continue
+                clusters.append({
+                    "id": f"{used_zoom}/{row}/{col}",
+                    "latitude": agg.sum_lat / agg.count,
+                    "longitude": agg.sum_lng / agg.count,
+                    "count": agg.count,
+                    "bounds": {
+                        "sw_lat": row * deg,
+                        "sw_lng": col * deg,
+                        "ne_lat": (row + 1) * deg,
+                        "ne_lng": (col + 1) * deg,
+                    },
+                    "places": representatives,
+                })
+
+        clusters.sort(key=lambda c: c["count"], reverse=True)
+        return {
+            "clusters": clusters,
+            "places": places,
+            "total": total,
+            "zoom": used_zoom,
+        }
+
+
+place_cluster_index = PlaceClusterIndex()
@@ -0,0 +1,77 @@
+"""
+places 컬렉션 변경 시 프로세스 메모리 인덱스 동기화
+- 장소를 upsert하는 모든 경로는 on_place_upserted를 호출 (place_store.upsert_place / update_place가 호출)
+- 앱 시작 시 load_place_indexes로 전체 로드 (이전 버전 표시 필드 재계산 후)
+- 인덱스 갱신 / 캐시 무효화는 단계별로 실패를 처리 (앞 단계가 실패해도 캐시는 항상 무효화)
+- 장소 좌표가 바뀌면 이전 위치의 타일/주변 장소 캐시도 무효화
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from app.services.nearby_places_cache import nearby_places_cache
+from app.services.place_cluster_index import place_cluster_index
+from app.services.place_search_index import place_search_index
+from app.services.place_spatial_index import place_spatial_index
+from app.services.place_tile_service import place_tile_service
+from app.services.region_code_service import region_code_service
+from app.services.suggest_service import suggest_index
+from app.services.viewport_tile_cache import viewport_tile_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _moved_from(doc: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """이전 좌표가 있고 현재 좌표와 다르면 이전 위치 기준 문서 (캐시 무효화용)"""
+    if not previous:
+        return None
+    lat, lng = previous.get("latitude"), previous.get("longitude")
+    if lat is None or lng is None or (lat, lng) == (doc.get("latitude"), doc.get("longitude")):
+        return None
+    return {**doc, "latitude": lat, "longitude": lng}
+
+
+def on_place_upserted(doc: Dict[str, Any], previous: Optional[Dict[str, Any]] = None) -> None:
+    """
+    장소 upsert 직후 호출 (인덱스 갱신 실패는 요청 처리에 영향 없음).
+    - previous: 저장 전 문서 (latitude / longitude만 있어도 됨, 이전 위치 캐시 무효화용)
+    """
+    place_id = doc.get("place_id")
+    for name, add in (
+        ("search", place_search_index.add),
+        ("suggest", suggest_index.add_place),
+        ("cluster", place_cluster_index.add),
+        ("spatial", place_spatial_index.add),
+    ):
+        try:
+            add(doc)
+        except Exception as e:
+            logger.warning(f"장소 인덱스 갱신 실패 ({name}, place_id={place_id}): {e}")
+
+    targets = [doc]
+    moved_from = _moved_from(doc, previous)
+    if moved_from:
+        targets.append(moved_from)
+    for name, invalidate in (
+        ("viewport_tiles", viewport_tile_cache.invalidate_place),
+        ("place_tiles", place_tile_service.invalidate_place),
+        ("nearby", nearby_places_cache.invalidate_place),
+    ):
+        for target in targets:
+            try:
+                invalidate(target)
+            except Exception as e:
+                logger.warning(f"장소 캐시 무효화 실패 ({name}, place_id={place_id}): {e}")
+
+
+def load_place_indexes() -> None:
+    """places 기반 메모리 인덱스 및 지역 코드 테이블 전체 로드 (백그라운드 스레드에서 실행)"""
+    from app.services.place_store import backfill_display_fields
+
+    backfill_display_fields()
+    region_code_service.load()
+    place_search_index.load()
+    suggest_index.load()
+    place_cluster_index.load()
+    place_spatial_index.load()
+    place_tile_service.warm()
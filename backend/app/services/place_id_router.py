@@ -0,0 +1,147 @@
+"""
+장소 ID → provider 라우팅 인덱스
+- 외부 API 검색/섹션 결과로 응답한 장소(places에 저장되지 않은 것 포함)의 place_id를 provider와 함께 기록
+- 상세 조회 시 DB에 없는 장소도 place_id만으로 provider를 알 수 있어 한 provider에만 조회
+- Kakao는 ID로 직접 조회하는 API가 없으므로 이름/좌표를 함께 저장해 좁은 범위 키워드 검색 1회로 찾음
+- 기록은 메모리에 모아 두었다가 백그라운드 스레드가 주기적으로 한 번에 저장 (검색 요청 경로에서 DB 쓰기 없음)
+  - 저장 전 라우팅 정보도 resolve에서 바로 사용
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pymongo import UpdateOne
+
+from app.core.mongodb import get_database
+from app.core.place_ids import PLACE_PROVIDERS, make_place_ref, parse_place_ref, provider_of
+from app.models.place_models import Place
+
+logger = logging.getLogger(__name__)
+
+# 라우팅 정보 보관 기간 (검색 결과 캐시보다 길게 유지)
+PLACE_ROUTE_TTL_DAYS = 30
+# 기록 대기 라우팅 정보 저장 주기 (초)
+PLACE_ROUTE_FLUSH_INTERVAL_SECONDS = 5
+# 기록 대기 건수가 이 수를 넘으면 주기를 기다리지 않고 저장
+PLACE_ROUTE_FLUSH_MAX_PENDING = 2000
+
+
+class PlaceIdRouter:
+    """place_id_routes 컬렉션 기반 ID → provider 인덱스"""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # place_ref → 라우팅 정보 (저장 대기)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, places: Iterable[Union[Place, Dict[str, Any]]]) -> int:
+        """장소 목록의 (provider, place_id, 이름, 좌표)를 저장 대기열에 추가. 추가한 건수 반환"""
+        routes = []
+        for place in places:
+            doc = place.to_dict() if isinstance(place, Place) else place
+            if not isinstance(doc, dict):
+                continue
+            provider = provider_of(doc)
+            place_id = str(doc.get("place_id") or doc.get("id") or "")
+            if not provider or not place_id:
+                continue
+            routes.append({
+                "place_ref": make_place_ref(provider, place_id),
+                "place_id": place_id,
+                "provider": provider,
+                "title": doc.get("title") or doc.get("place_name"),
+                "latitude": doc.get("latitude"),
+                "longitude": doc.get("longitude"),
+            })
+        if not routes:
+            return 0
+        with self._cond:
+            was_empty = not self._pending
+            for route in routes:
+                self._pending[route["place_ref"]] = route
+            self._ensure_worker_locked()
+            # 처음 쌓일 때(주기 대기 시작) / 최대치에 도달했을 때(바로 저장)만 깨움
+            if was_empty or len(self._pending) >= PLACE_ROUTE_FLUSH_MAX_PENDING:
+                self._cond.notify()
+        return len(routes)
+
+    def _ensure_worker_locked(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="place-id-routes-flush", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                if len(self._pending) < PLACE_ROUTE_FLUSH_MAX_PENDING:
+                    self._cond.wait(timeout=PLACE_ROUTE_FLUSH_INTERVAL_SECONDS)
+            self.flush()
+
+    def flush(self) -> int:
+        """저장 대기 라우팅 정보를 place_id_routes에 한 번에 저장 (실패해도 요청 처리에 영향 없음). 저장한 건수 반환"""
+        with self._cond:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        expires_at = datetime.utcnow() + timedelta(days=PLACE_ROUTE_TTL_DAYS)
+        operations = [
+            UpdateOne(
+                {"place_ref": place_ref},
+                {"$set": {
+                    **{key: value for key, value in route.items() if key != "place_ref"},
+                    "expires_at": expires_at,
+                }},
+                upsert=True,
+            )
+            for place_ref, route in pending.items()
+        ]
+        try:
+            get_database().place_id_routes.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"장소 ID 라우팅 기록 실패 ({len(operations)}건): {e}")
+            return 0
+        return len(operations)
+
+    def _pending_routes(self, provider: Optional[str], raw_id: str) -> List[Dict[str, Any]]:
+        providers = (provider,) if provider else PLACE_PROVIDERS
+        with self._cond:
+            routes = [self._pending.get(make_place_ref(name, raw_id)) for name in providers]
+        return [
+            {key: value for key, value in route.items() if key != "place_ref"}
+            for route in routes
+            if route
+        ]
+
+    def resolve(self, place_id: str) -> List[Dict[str, Any]]:
+        """
+        place_id(또는 place_ref) → 라우팅 정보 목록 {provider, place_id, title, latitude, longitude}.
+        - place_ref면 provider가 정해져 있으므로 항상 1개 (기록이 없으면 이름/좌표 없이 반환)
+        - 기존 place_id는 기록된 provider 수만큼 (TourAPI/Kakao ID가 우연히 같으면 2개, 기록이 없으면 빈 목록)
+        """
+        provider, raw_id = parse_place_ref(place_id)
+        query: Dict[str, Any] = {"place_ref": make_place_ref(provider, raw_id)} if provider else {"place_id": raw_id}
+        # 아직 저장하지 않은 기록 우선, 나머지 provider는 DB에서 조회
+        routes = self._pending_routes(provider, raw_id)
+        if len(routes) < (1 if provider else len(PLACE_PROVIDERS)):
+            try:
+                stored = get_database().place_id_routes.find(
+                    query, {"_id": 0, "place_ref": 0, "expires_at": 0}
+                ).limit(len(PLACE_PROVIDERS))
+                known = {route["provider"] for route in routes}
+                routes += [route for route in stored if route.get("provider") not in known]
+            except Exception as e:
+                logger.warning(f"장소 ID 라우팅 조회 실패 (place_id={place_id}): {e}")
+        if provider and not routes:
+            routes = [{"provider": provider, "place_id": raw_id}]
+        return routes
+
+
+place_id_router = PlaceIdRouter()
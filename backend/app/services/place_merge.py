@@ -0,0 +1,138 @@
+"""
+멀티 provider(TourAPI / Kakao) 검색 결과 중복 제거 및 병합
+- 정규화된 장소명 해시 인덱스 + 격자 버킷 근접 검사로 O(n+m) 병합
+- Tour/Kakao 주소 표기 차이와 무관하게 같은 장소를 하나로 합치고
+  provider_ids에 양쪽 ID를 함께 기록
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from app.core.geo import grid_cell, haversine_m, neighbor_cells
+from app.models.place_models import Place
+from app.services.google_places_service import normalize_place_name_for_google
+from app.services.place_search_index import normalize_text
+
+# 이름이 같을 때 같은 장소로 보는 최대 거리 (미터)
+SAME_NAME_MAX_DISTANCE_M = 300.0
+# 이름이 부분 일치(한쪽이 다른 쪽을 포함)할 때 같은 장소로 보는 최대 거리 (미터)
+SIMILAR_NAME_MAX_DISTANCE_M = 50.0
+
+
+def canonical_name(place: Place) -> str:
+    """비교용 장소명 ("스타벅스 여수해양공원점(본점)" -> "스타벅스여수해양공원")"""
+    raw = place.title or place.place_name or ""
+    return normalize_text(normalize_place_name_for_google(raw))
+
+
+def _coords(place: Place) -> Optional[Tuple[float, float]]:
+    if place.latitude is None or place.longitude is None:
+        return None
+    return (place.latitude, place.longitude)
+
+
+def _same_area(a: Place, b: Place) -> bool:
+    """좌표가 없을 때의 보조 판단: 시도/구군이 충돌하지 않으면 같은 지역으로 간주"""
+    if a.region and b.region and a.region != b.region:
+        return False
+    if a.district and b.district and a.district != b.district:
+        return False
+    return True
+
+
+class _PlaceIndex:
+    """병합 기준 장소 인덱스 (이름 해시 + 격자 버킷)"""
+
+    def __init__(self) -> None:
+        self.places: List[Place] = []
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_cell: Dict[Tuple[int, int], List[int]] = {}
+        self.names: List[str] = []
+
+    def find(self, place: Place, name: str) -> Optional[int]:
+        """같은 장소로 판단되는 기존 항목 위치"""
+        coords = _coords(place)
+
+        for idx in self.by_name.get(name, []) if name else []:
+            other = _coords(self.places[idx])
+            if coords and other:
+                if haversine_m(*coords, *other) <= SAME_NAME_MAX_DISTANCE_M:
+                    return idx
+            elif _same_area(place, self.places[idx]):
+                return idx
+
+        if coords and name:
+            for cell in neighbor_cells(grid_cell(*coords)):
+                for idx in self.by_cell.get(cell, []):
+                    other_name = self.names[idx]
+                    if not other_name or (name not in other_name and other_name not in name):
+                        continue
+                    other = _coords(self.places[idx])
+                    if other and haversine_m(*coords, *other) <= SIMILAR_NAME_MAX_DISTANCE_M:
+                        return idx
+        return None
+
+    def add(self, place: Place, name: str) -> None:
+        idx = len(self.places)
+        self.places.append(place)
+        self.names.append(name)
+        if name:
+            self.by_name.setdefault(name, []).append(idx)
+        coords = _coords(place)
+        if coords:
+            self.by_cell.setdefault(grid_cell(*coords), []).append(idx)
+
+
+def _absorb(target: Place, other: Place) -> None:
+    """target에 비어 있는 필드를 other 값으로 보강"""
+    if not target.latitude and other.latitude:
+        target.latitude = other.latitude
+    if not target.longitude and other.longitude:
+        target.longitude = other.longitude
+    if not target.category and other.category:
+        target.category = other.category
+    if not target.tel and other.tel:
+        target.tel = other.tel
+    if not target.kakao_url and other.kakao_url:
+        target.kakao_url = other.kakao_url
+    if not target.image and other.image:
+        target.image = other.image
+    if not target.region and other.region:
+        target.region = other.region
+    if not target.district and other.district:
+        target.district = other.district
+    target.provider_ids = {**(other.provider_ids or {}), **(target.provider_ids or {})}
+
+
+def merge_places(tour_places: List[Place], kakao_places: List[Place]) -> List[Place]:
+    """
+    TourAPI 결과(설명/이미지)를 기준으로 Kakao 결과(좌표/전화/카테고리)를 병합.
+    - 같은 provider 안의 중복(place_id 동일, 같은 장소)도 함께 제거
+    - 순서: TourAPI 결과 → Kakao에만 있는 결과
+    """
+    index = _PlaceIndex()
+    seen_ids = set()
+
+    for source, places in (("tour", tour_places), ("kakao", kakao_places)):
+        for place in places:
+            if place.place_id:
+                # Tour contentid와 Kakao id는 둘 다 숫자라 provider와 함께 비교
+                if (source, place.place_id) in seen_ids:
+                    continue
+                seen_ids.add((source, place.place_id))
+                if not place.provider_ids:
+                    place.provider_ids = {source: place.place_id}
+
+            name = canonical_name(place)
+            existing = index.find(place, name)
+            if existing is not None:
+                target = index.places[existing]
+                had_coords = _coords(target) is not None
+                _absorb(target, place)
+                if not had_coords and _coords(target):
+                    index.by_cell.setdefault(grid_cell(*_coords(target)), []).append(existing)
+                continue
+            index.add(place, name)
+
+    return index.places
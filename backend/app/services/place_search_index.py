@@ -0,0 +1,264 @@
+"""
+places 컬렉션 로컬 검색 인덱스
+- 한글은 띄어쓰기/조사 차이가 커서 단어 단위 대신 문자 bigram 역색인 사용
+- 필드 가중치: 제목 > 카테고리 > 주소
+- 지역(시도)/구군/카테고리 필터 지원
+- 앱 시작 시 places에서 로드, 이후 upsert 시점마다 증분 반영
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.mongodb import get_database
+from app.services.region_code_service import region_code_service
+
+logger = logging.getLogger(__name__)
+
+# 필드별 가중치
+FIELD_WEIGHTS: Dict[str, float] = {
+    "title": 3.0,
+    "category": 1.5,
+    "address": 1.0,
+}
+
+# 검색어 bigram 중 이 비율 이상이 매칭되어야 결과로 인정
+MIN_COVERAGE = 0.6
+
+# description을 카테고리 텍스트로 취급할 최대 길이
+MAX_CATEGORY_DESCRIPTION_LENGTH = 50
+
+# 인덱스 로드 시 가져올 필드
+INDEX_PROJECTION = {
+    "_id": 0,
+    "place_id": 1,
+    "title": 1,
+    "place_name": 1,
+    "address": 1,
+    "address_name": 1,
+    "category": 1,
+    "description": 1,
+    "region": 1,
+    "district": 1,
+    "google_types": 1,
+}
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎ]+")
+
+
+def place_categories(doc: Dict[str, Any]) -> List[str]:
+    """카테고리 필터 대상 값 (category + google_types)"""
+    categories = [str(doc["category"])] if doc.get("category") else []
+    google_types = doc.get("google_types") or []
+    if isinstance(google_types, list):
+        categories.extend(str(t) for t in google_types)
+    return categories
+
+
+def matches_category(categories: List[str], category: str) -> bool:
+    """카테고리 필터 (대소문자 무시, 부분 일치 허용)"""
+    category_lower = category.lower()
+    return any(category_lower == c or category_lower in c for c in (c.lower() for c in categories))
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """소문자 변환 + 공백/기호 제거 ("강릉 중앙시장" -> "강릉중앙시장")"""
+    if not text or not isinstance(text, str):
+        return ""
+    return _NON_WORD.sub("", text.lower())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """문자 bigram 토큰 (한 글자면 unigram)"""
+    compact = normalize_text(text)
+    if len(compact) < 2:
+        return [compact] if compact else []
+    return [compact[i:i + 2] for i in range(len(compact) - 1)]
+
+
+@dataclass
+class _IndexedPlace:
+    place_id: str
+    title: str
+    address: str
+    region: str
+    district: str
+    categories: List[str]
+    tokens: Dict[str, float] = field(default_factory=dict)
+
+
+class PlaceSearchIndex:
+    """문자 bigram 기반 places 역색인 (프로세스 메모리)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._places: Dict[str, _IndexedPlace] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    def load(self) -> int:
+        """places 컬렉션 전체를 인덱싱 (시작 시 1회)"""
+        try:
+            db = get_database()
+            count = 0
+            for doc in db.places.find({"place_id": {"$ne": None}}, INDEX_PROJECTION):
+                self.add(doc)
+                count += 1
+            self.ready = True
+            logger.info(f"로컬 검색 인덱스 로드 완료: {count}건")
+            return count
+        except Exception as e:
+            logger.warning(f"로컬 검색 인덱스 로드 실패 (외부 API 검색만 사용): {e}")
+            return 0
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        """장소 1건 추가/갱신 (place_id 기준)"""
+        if not isinstance(doc, dict):
+            return
+        place_id = doc.get("place_id") or doc.get("id")
+        if not place_id:
+            return
+        place_id = str(place_id)
+
+        title = doc.get("title") or doc.get("place_name") or ""
+        address = doc.get("address") or doc.get("address_name") or ""
+        categories = place_categories(doc)
+        # Kakao는 description에 카테고리명("음식점 > 카페")이 들어옴. 긴 개요 문장은 제외
+        description = doc.get("description") or ""
+        if len(description) > MAX_CATEGORY_DESCRIPTION_LENGTH:
+            description = ""
+        category_text = " ".join(filter(None, [description, *categories]))
+
+        tokens: Dict[str, float] = {}
+        for field_name, text in (("title", title), ("category", category_text), ("address", address)):
+            weight = FIELD_WEIGHTS[field_name]
+            for token in set(tokenize(text)):
+                tokens[token] = tokens.get(token, 0.0) + weight
+
+        entry = _IndexedPlace(
+            place_id=place_id,
+            title=normalize_text(title),
+            address=normalize_text(" ".join([address, doc.get("region") or ""])),
+            region=doc.get("region") or "",
+            district=doc.get("district") or "",
+            categories=[c.lower() for c in categories],
+            tokens=tokens,
+        )
+
+        with self._lock:
+            self._remove_locked(place_id)
+            self._places[place_id] = entry
+            for token, weight in tokens.items():
+                self._postings.setdefault(token, {})[place_id] = weight
+
+    def remove(self, place_id: str) -> None:
+        with self._lock:
+            self._remove_locked(str(place_id))
+
+    def _remove_locked(self, place_id: str) -> None:
+        old = self._places.pop(place_id, None)
+        if not old:
+            return
+        for token in old.tokens:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(place_id, None)
+                if not posting:
+                    del self._postings[token]
+
+    def _matches_filters(
+        self,
+        entry: _IndexedPlace,
+        region: Optional[str],
+        district: Optional[str],
+        category: Optional[str],
+    ) -> bool:
+        if region:
+            province = region_code_service.find_province(region)
+            aliases = province.aliases if province else (region,)
+            if entry.region != region and not any(normalize_text(a) in entry.address for a in aliases):
+                return False
+        if district:
+            district_norm = normalize_text(district)
+            if entry.district != district and district_norm not in entry.address:
+                return False
+        if category and not matches_category(entry.categories, category):
+            return False
+        return True
+
+    def search(
+        self,
+        keyword: str,
+        region: Optional[str] = None,
+        district: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Tuple[str, float]]:
+        """
+        키워드 검색 → [(place_id, score)] (점수 내림차순)
+        - 키워드가 없으면 필터만 적용 (정렬은 제목순)
+        """
+        hits, _ = self.search_counted(keyword, region, district, category, limit)
+        return hits
+
+    def search_counted(
+        self,
+        keyword: str,
+        region: Optional[str] = None,
+        district: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """search와 같은 결과 + limit 적용 전 전체 매칭 건수"""
+        query_tokens = list(dict.fromkeys(tokenize(keyword)))
+
+        with self._lock:
+            if not query_tokens:
+                hits = [
+                    (pid, 0.0) for pid, entry in self._places.items()
+                    if (region or district or category)
+                    and self._matches_filters(entry, region, district, category)
+                ]
+                hits.sort(key=lambda h: self._places[h[0]].title)
+                return hits[:limit], len(hits)
+
+            total_docs = max(len(self._places), 1)
+            scores: Dict[str, float] = {}
+            matched: Dict[str, int] = {}
+            for token in query_tokens:
+                posting = self._postings.get(token)
+                if not posting:
+                    continue
+                idf = math.log(1 + total_docs / len(posting))
+                for pid, weight in posting.items():
+                    scores[pid] = scores.get(pid, 0.0) + weight * idf
+                    matched[pid] = matched.get(pid, 0) + 1
+
+            compact_query = normalize_text(keyword)
+            results: List[Tuple[str, float]] = []
+            for pid, score in scores.items():
+                if matched[pid] / len(query_tokens) < MIN_COVERAGE:
+                    continue
+                entry = self._places[pid]
+                if not self._matches_filters(entry, region, district, category):
+                    continue
+                # 제목에 검색어가 그대로 포함되면 가산점 (접두 일치면 추가 가산)
+                if compact_query and compact_query in entry.title:
+                    score *= 1.5
+                    if entry.title.startswith(compact_query):
+                        score *= 1.2
+                results.append((pid, score))
+
+        results.sort(key=lambda h: h[1], reverse=True)
+        return results[:limit], len(results)
+
+
+place_search_index = PlaceSearchIndex()
@@ -1,16 +1,114 @@
 import asyncio
-from typing import Dict, Any, Optional, List
+import math
+import uuid
+from dataclasses import replace
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from app.api.tour_api import TourAPI
 from app.api.kakao_api import KakaoAPI
 from app.models.place_models import Place, PlaceNormalizer
 from app.core.mongodb import get_database
 from app.core.config import settings
+from app.core.geo import (
+    EARTH_RADIUS_M,
+    grid_cell,
+    haversine_m,
+    neighbor_cells,
+    tile_bounds,
+    tiles_for_bbox,
+    to_float,
+    zoom_for_bbox,
+)
+from app.core.place_display import (
+    DISPLAY_SOURCE_FIELDS,
+    DISPLAY_VERSION_FIELD,
+    ensure_display_fields,
+    with_display_fields,
+)
+from app.core.place_ids import make_place_ref, parse_place_ref, place_ref_of
+from app.core.utils import encode_cursor, decode_cursor
+from app.services.google_details_refresher import google_details_refresher
 from app.services.google_places_service import google_places_service
+from app.services.nearby_places_cache import nearby_cache_key, nearby_places_cache
+from app.services.place_id_router import place_id_router
+from app.services.tour_detail_refresher import tour_detail_refresher
+from app.services.place_cluster_index import (
+    ALL_BUCKET,
+    CATEGORY_BUCKETS,
+    CLUSTER_MAX_ZOOM,
+    category_buckets,
+    place_cluster_index,
+)
+from app.services.place_merge import canonical_name, merge_places
+from app.services.place_search_index import matches_category, place_categories, place_search_index
+from app.services.place_spatial_index import place_spatial_index
+from app.services.place_store import update_place, upsert_place
+from app.services.ranking import rank_places
+from app.services.region_code_service import RegionFilter, region_code_service
+from app.services.suggest_service import suggest_index
+from app.services.viewport_tile_cache import (
+    TILE_PLACE_LIMIT,
+    VIEWPORT_MAX_TILES,
+    VIEWPORT_TILE_MAX_ZOOM,
+    VIEWPORT_TILE_MIN_ZOOM,
+    Tile,
+    viewport_tile_cache,
+)
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 커서 기반 검색: provider 페이지 크기 (Kakao 키워드 검색은 size 15, page 45가 최대)
+TOUR_MAX_PAGE_SIZE = 50
+KAKAO_MAX_PAGE_SIZE = 15
+KAKAO_MAX_PAGE = 45
+# Kakao 상세 조회: 기록된 좌표 주변 검색 범위 (도 단위, 약 ±500m)
+KAKAO_DETAIL_RECT_DEG = 0.005
+# 한 라운드에 provider별로 동시에 가져올 페이지 수 / 요청당 최대 라운드
+PAGED_SEARCH_PAGES_PER_ROUND = 2
+PAGED_SEARCH_MAX_ROUNDS = 4
+# 커서 세션(남은 결과/중복 키) 보관 시간
+PAGED_SEARCH_SESSION_TTL_MINUTES = 30
+# 커서 세션에 저장할 중복 키 최대 수 (넘으면 오래된 키부터 버림 → 세션 문서 크기 제한)
+PAGED_SEARCH_MAX_SEEN_KEYS = 3000
+# 뷰포트 외부 보강: 지도 카테고리 → provider 카테고리
+# - kakao: 카테고리 그룹 코드 (FD6 음식점, CE7 카페, AT4 관광명소, AD5 숙박, MT1 대형마트)
+# - tour: contentTypeId (39 음식점, 12 관광지, 32 숙박, 38 쇼핑, None 전체)
+VIEWPORT_PROVIDER_CATEGORIES: Dict[str, Dict[str, List[Any]]] = {
+    "": {"kakao": ["AT4", "FD6"], "tour": [None]},
+    "food": {"kakao": ["FD6"], "tour": ["39"]},
+    "cafe": {"kakao": ["CE7"], "tour": []},
+    "spot": {"kakao": ["AT4"], "tour": ["12"]},
+    "stay": {"kakao": ["AD5"], "tour": ["32"]},
+    "shopping": {"kakao": ["MT1"], "tour": ["38"]},
+}
+# 배치 검색: 요청당 최대 검색 수 / 동시에 외부 API로 보낼 검색 수 (검색 1건당 Tour+Kakao 동시 호출)
+BATCH_SEARCH_MAX_QUERIES = 30
+BATCH_SEARCH_CONCURRENCY = 4
+# 장소 상세 배치 조회: 요청당 최대 ID 수 / DB에 없는 장소를 동시에 외부 API로 조회할 수
+PLACES_BATCH_MAX_IDS = 100
+PLACES_BATCH_CONCURRENCY = 4
+# 배치 조회 시 projection과 무관하게 조회하는 필드 (요청 ID 매칭 / Google 상세 갱신 판단)
+_PLACES_BATCH_BASE_FIELDS = (
+    "place_id",
+    "place_ref",
+    "kakao_url",
+    "provider_ids",
+    "google_place_id",
+    "google_details_refreshed_at",
+    "google_details_updated_at",
+    "google_details_retry_at",
+    DISPLAY_VERSION_FIELD,
+)
+# 표시용 필드 → 조회할 저장 필드 (저장된 값 + 이전 버전 문서에서 계산할 때 필요한 원본 필드)
+_DISPLAY_SOURCE_FIELDS = {
+    name: (name, *DISPLAY_SOURCE_FIELDS) for name in ("imageUrl", "googleRating", "googleRatingsTotal")
+}
+# 상세 페이지 주변 장소: 최대 개수 / 탐색 반경 / 평점 재정렬 시 거리순 후보 배수
+NEARBY_MAX_K = 30
+NEARBY_MAX_RADIUS_M = 20000
+NEARBY_CANDIDATE_FACTOR = 3
+
 class PlaceService:
     """장소 관련 서비스"""
     
@@ -21,31 +119,45 @@ class PlaceService:
         self.api_provider = settings.PLACE_API_PROVIDER.lower()  # tour 또는 kakao
         self.db = get_database()
     
+    @staticmethod
+    def _extract_tour_items(tour_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """TourAPI 목록 응답 → item 목록 (결과 1건이면 dict, 0건이면 빈 문자열로 오는 경우 처리)"""
+        body = (tour_result or {}).get("response", {}).get("body", {})
+        items = body.get("items", {})
+        if not isinstance(items, dict):
+            items = {}
+        tour_items = items.get("item", [])
+        if not isinstance(tour_items, list):
+            tour_items = [tour_items] if tour_items else []
+        return [t for t in tour_items if isinstance(t, dict)]
+
     async def _search_tour_api(
         self, 
         keyword: str, 
         page: int, 
         limit: int,
-        region: Optional[str] = None,
-        district: Optional[str] = None
+        region_filter: Optional[RegionFilter] = None,
     ) -> List[Place]:
-        """TourAPI 검색 (내부 메서드, 비동기)"""
+        """TourAPI 검색 (내부 메서드, 비동기) - 지역 조건은 areaCode/sigunguCode로 전달"""
+        region_filter = region_filter or RegionFilter()
         try:
             # 동기 함수를 비동기로 실행
             tour_result = await asyncio.to_thread(
-                self.tour_api.search_places, keyword, page, limit, region, district
+                self.tour_api.search_places,
+                keyword,
+                page,
+                limit,
+                region_filter.area_code,
+                None,
+                None,
+                region_filter.sigungu_code,
             )
-            body = tour_result.get("response", {}).get("body", {})
-            items = body.get("items", {})
-            if not isinstance(items, dict):
-                items = {}
-            tour_items = items.get("item", [])
-            if not isinstance(tour_items, list):
-                tour_items = [tour_items] if tour_items else []
-            tour_items = [t for t in tour_items if isinstance(t, dict)]
+            tour_items = self._extract_tour_items(tour_result)
             if not tour_items:
-                logger.info(f"TourAPI 검색 결과 0건: keyword={keyword}, region={region}, response_body={str(tour_result)[:800]}")
-            return self.normalizer.normalize_list(tour_items, source="tour")
+                logger.info(f"TourAPI 검색 결과 0건: keyword={keyword}, areaCode={region_filter.area_code}, response_body={str(tour_result)[:800]}")
+            places = self.normalizer.normalize_list(tour_items, source="tour")
+            place_id_router.register(places)
+            return places
         except Exception as e:
             import traceback
             logger.warning(f"TourAPI 검색 실패: keyword={keyword}, error={type(e).__name__}: {str(e)}")
@@ -64,13 +176,15 @@ class PlaceService:
         page: int, 
         limit: int,
         region: Optional[str] = None,
-        district: Optional[str] = None
+        district: Optional[str] = None,
+        region_filter: Optional[RegionFilter] = None,
     ) -> List[Place]:
-        """KakaoAPI 검색 (내부 메서드, 비동기)"""
+        """KakaoAPI 검색 (내부 메서드, 비동기) - 시도 범위는 rect로 전달"""
+        rect = region_filter.kakao_rect if region_filter else None
         try:
             # 동기 함수를 비동기로 실행
             kakao_result = await asyncio.to_thread(
-                self.kakao_api.search_places, keyword, page, limit, region, district
+                self.kakao_api.search_places, keyword, page, limit, region, district, rect
             )
             kakao_items = kakao_result.get("documents", [])
             if not isinstance(kakao_items, list):
@@ -78,7 +192,9 @@ class PlaceService:
             kakao_items = [k for k in kakao_items if isinstance(k, dict)]
             if not kakao_items:
                 logger.info(f"KakaoAPI 검색 결과 0건: keyword={keyword}, region={region}, response_body={str(kakao_result)[:800]}")
-            return self.normalizer.normalize_list(kakao_items, source="kakao")
+            places = self.normalizer.normalize_list(kakao_items, source="kakao")
+            place_id_router.register(places)
+            return places
         except Exception as e:
             import traceback
             logger.warning(f"KakaoAPI 검색 실패: keyword={keyword}, error={type(e).__name__}: {str(e)}")
@@ -92,138 +208,134 @@ class PlaceService:
             return []
     
     def _filter_by_region(self, places: List[Place], region: Optional[str], district: Optional[str]) -> List[Place]:
-        """지역 필터링"""
+        """
+        지역 필터링 (provider에서 이미 지역 조건을 적용하므로 명확히 다른 지역인 결과만 제외)
+        - 시도: 주소의 시도 표기(서울특별시/서울, 강원특별자치도/강원도 등)로 판단
+        - 구군: 주소에 구군명이 포함되는지로 판단
+        """
         if not region and not district:
             return places
         
         filtered = []
         for place in places:
-            if region and place.region != region:
-                continue
-            if district and place.district != district:
+            address = place.address or place.address_name or ""
+            if region:
+                in_region = region_code_service.address_in_region(address, region)
+                if in_region is False or (in_region is None and place.region and place.region != region):
+                    continue
+            if district and address and district.strip() not in address and place.district != district:
                 continue
             filtered.append(place)
         return filtered
     
     def _merge_place_data(self, tour_places: List[Place], kakao_places: List[Place]) -> List[Place]:
-        """두 API 결과를 통합하여 데이터 보강 (TourAPI 설명 + KakaoAPI 위치 정보)"""
-        # KakaoAPI 결과를 딕셔너리로 변환 (이름+주소 기준)
-        kakao_map = {}
-        for place in kakao_places:
-            key = f"{(place.title or place.place_name or '').strip()}|{(place.address or place.address_name or '').strip()}"
-            if key:
-                kakao_map[key] = place
-        
-        merged_places = []
-        
-        # TourAPI 결과를 기준으로 KakaoAPI 데이터 보강
-        for tour_place in tour_places:
-            title = (tour_place.title or tour_place.place_name or "").strip()
-            address = (tour_place.address or tour_place.address_name or "").strip()
-            key = f"{title}|{address}" if title and address else title
-            
-            # 같은 장소가 KakaoAPI에도 있으면 데이터 보강
-            if key and key in kakao_map:
-                kakao_place = kakao_map[key]
-                # KakaoAPI의 정확한 좌표와 전화번호 정보로 보강
-                if not tour_place.latitude and kakao_place.latitude:
-                    tour_place.latitude = kakao_place.latitude
-                if not tour_place.longitude and kakao_place.longitude:
-                    tour_place.longitude = kakao_place.longitude
-                # KakaoAPI의 카테고리 정보 보강
-                if not tour_place.category and kakao_place.category:
-                    tour_place.category = kakao_place.category
-            
-            merged_places.append(tour_place)
-        
-        # KakaoAPI에만 있는 장소 추가
-        for kakao_place in kakao_places:
-            title = (kakao_place.title or kakao_place.place_name or "").strip()
-            address = (kakao_place.address or kakao_place.address_name or "").strip()
-            key = f"{title}|{address}" if title and address else title
-            
-            # TourAPI에 없는 장소만 추가
-            found = False
-            for tour_place in tour_places:
-                tour_title = (tour_place.title or tour_place.place_name or "").strip()
-                tour_address = (tour_place.address or tour_place.address_name or "").strip()
-                tour_key = f"{tour_title}|{tour_address}" if tour_title and tour_address else tour_title
-                if key and key == tour_key:
-                    found = True
-                    break
-            
-            if not found:
-                merged_places.append(kakao_place)
-        
-        return merged_places
-    
-    def _remove_duplicates(self, places: List[Place]) -> List[Place]:
-        """중복 제거 (place_id, 이름+주소 기준)"""
-        seen_ids = set()
-        seen_names = set()
-        unique_places = []
-
-        for place in places:
-            # 1차: place_id로 중복 체크
-            place_id = place.place_id or place.id
-            if place_id and place_id in seen_ids:
-                continue
-            
-            # 2차: 이름+주소로 중복 체크 (place_id가 없는 경우)
-            name_key = None
-            if place.title or place.place_name:
-                title = (place.title or place.place_name or "").strip()
-                address = (place.address or place.address_name or "").strip()
-                if title and address:
-                    name_key = f"{title}|{address}"
-                elif title:
-                    name_key = title
-            
-            if name_key and name_key in seen_names:
-                continue
-
-            # 중복이 아니면 추가
-            if place_id:
-                seen_ids.add(place_id)
-            if name_key:
-                seen_names.add(name_key)
-            unique_places.append(place)
-
-        return unique_places
+        """두 API 결과를 통합하여 데이터 보강 및 중복 제거 (TourAPI 설명 + KakaoAPI 위치 정보)"""
+        return merge_places(tour_places, kakao_places)
 
     def _add_display_fields_to_places(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        프론트 공통 사용 필드 추가:
-        - imageUrl: Tour/Kakao 이미지가 우선, 없으면 google_photos[0].url 사용
-        - googleRating / googleRatingsTotal: google_rating / google_ratings_total 래핑
+        프론트 공통 사용 필드(imageUrl / googleRating / googleRatingsTotal / place_ref, app.core.place_display).
+        - 저장 시 계산되어 있으므로 그대로 반환, 이전에 저장된 문서만 여기서 계산
         """
-        enriched: List[Dict[str, Any]] = []
-        for p in places:
-            if not isinstance(p, dict):
-                continue
-            item = dict(p)
+        return [ensure_display_fields(p) for p in places if isinstance(p, dict)]
 
-            # 이미지 우선순위: Google 사진 > 기존 image
-            google_thumb = None
-            google_photos = item.get("google_photos") or []
-            if isinstance(google_photos, list) and google_photos:
-                first = google_photos[0]
-                if isinstance(first, dict):
-                    google_thumb = first.get("url") or google_thumb
-            base_image = item.get("image")
+    def _search_local(
+        self,
+        keyword: str,
+        page: int,
+        limit: int,
+        region: Optional[str] = None,
+        district: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        places 컬렉션 로컬 인덱스 검색.
+        요청한 페이지를 채울 만큼 결과가 있을 때만 응답을 반환하고, 부족하면 None (외부 API 사용).
+        """
+        if not settings.LOCAL_SEARCH_ENABLED or not place_search_index.ready:
+            return None
 
-            image_url = google_thumb or base_image
-            if image_url:
-                item["imageUrl"] = image_url
+        offset = (max(page, 1) - 1) * limit
+        hits, total = place_search_index.search_counted(
+            keyword, region=region, district=district, category=category, limit=offset + limit
+        )
+        if len(hits) < offset + limit:
+            logger.info(f"로컬 검색 결과 부족 ({len(hits)}건), 외부 API 사용: keyword={keyword}")
+            return None
 
-            if "google_rating" in item:
-                item["googleRating"] = item.get("google_rating")
-            if "google_ratings_total" in item:
-                item["googleRatingsTotal"] = item.get("google_ratings_total")
+        page_ids = [pid for pid, _ in hits[offset:offset + limit]]
+        docs = {
+            doc["place_id"]: doc
+            for doc in self.db.places.find({"place_id": {"$in": page_ids}}, {"_id": 0})
+        }
+        places = [docs[pid] for pid in page_ids if pid in docs]
+        if len(places) < len(page_ids):
+            # 인덱스와 DB가 어긋난 경우 (삭제 등) 외부 API로 처리
+            return None
 
-            enriched.append(item)
+        return {
+            "keyword": keyword,
+            "places": self._add_display_fields_to_places(places),
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "cached": False,
+            "source": "local",
+        }
 
-        return enriched
+    @staticmethod
+    def _search_cache_key(
+        keyword: Optional[str],
+        region: Optional[str],
+        district: Optional[str],
+        page: int,
+        limit: int,
+        category: Optional[str] = None,
+    ) -> str:
+        """검색 캐시 키 (정규화: 빈 값 처리 및 소문자 변환)"""
+        normalized_keyword = (keyword or "").strip().lower()
+        normalized_region = (region or "").strip().lower()
+        normalized_district = (district or "").strip().lower()
+        normalized_category = (category or "").strip().lower()
+        return (
+            f"search:{normalized_keyword}:{normalized_region}:{normalized_district}:{page}:{limit}"
+            f":{normalized_category}"
+        )
+
+    @staticmethod
+    def _filter_by_category(places: List[Place], category: Optional[str]) -> List[Place]:
+        """카테고리 필터 (로컬 인덱스와 같은 규칙: category + google_types)"""
+        if not category or not category.strip():
+            return places
+        return [p for p in places if matches_category(place_categories(p.to_dict()), category.strip())]
+
+    def _cached_search_response(
+        self, keyword: str, page: int, limit: int, cached_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        cached_places = cached_result.get("places", []) or []
+        return {
+            "keyword": keyword,
+            "places": self._add_display_fields_to_places(cached_places),
+            "page": page,
+            "limit": limit,
+            "total": cached_result.get("total", 0),
+            "cached": True
+        }
+
+    def _store_search_cache(self, cache_key: str, places: List[Dict[str, Any]], total: int) -> None:
+        """검색 결과 캐시 저장 (24시간 TTL) - 중복 방지"""
+        try:
+            self.db.search_cache.insert_one({
+                "cache_key": cache_key,
+                "places": places,
+                "total": total,
+                "created_at": datetime.utcnow(),
+                "expires_at": datetime.utcnow() + timedelta(hours=24)
+            })
+        except Exception as e:
+            # 중복 키 오류는 무시 (다른 요청이 이미 캐시를 저장한 경우)
+            if "duplicate key" not in str(e).lower() and "E11000" not in str(e):
+                logger.warning(f"캐시 저장 실패: {str(e)}")
 
     async def search_places(
         self, 
@@ -231,15 +343,24 @@ class PlaceService:
         page: int = 1, 
         limit: int = 10,
         region: Optional[str] = None,
-        district: Optional[str] = None
+        district: Optional[str] = None,
+        category: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """장소 검색 (외부 API 병렬 호출)"""
+        """장소 검색 (로컬 인덱스 우선, 부족하면 외부 API 병렬 호출)"""
         try:
-            # 캐시 키 생성 (정규화: 빈 값 처리 및 소문자 변환)
-            normalized_keyword = (keyword or "").strip().lower()
-            normalized_region = (region or "").strip().lower()
-            normalized_district = (district or "").strip().lower()
-            cache_key = f"search:{normalized_keyword}:{normalized_region}:{normalized_district}:{page}:{limit}"
+            # 자동완성용 인기 검색어 집계 (페이지 넘김은 제외)
+            if keyword and page == 1:
+                suggest_index.record_query(keyword)
+
+            # 0) places 컬렉션 로컬 인덱스로 충분하면 외부 API 호출 생략
+            try:
+                local_result = self._search_local(keyword, page, limit, region, district, category)
+                if local_result:
+                    return local_result
+            except Exception as e:
+                logger.warning(f"로컬 검색 실패 (외부 API 사용): {e}")
+
+            cache_key = self._search_cache_key(keyword, region, district, page, limit, category)
             
             # 캐시 확인
             db = get_database()
@@ -248,20 +369,14 @@ class PlaceService:
             
             if cached_result:
                 logger.info(f"캐시에서 검색 결과 반환: {cache_key}")
-                cached_places = cached_result.get("places", []) or []
-                places_with_display = self._add_display_fields_to_places(cached_places)
-                return {
-                    "keyword": keyword,
-                    "places": places_with_display,
-                    "page": page,
-                    "limit": limit,
-                    "total": cached_result.get("total", 0),
-                    "cached": True
-                }
+                return self._cached_search_response(keyword, page, limit, cached_result)
             
             # 병렬로 외부 API 호출 (안전장치: 한쪽이 실패해도 다른 쪽 결과 반환)
-            tour_task = self._search_tour_api(keyword, page, limit, region, district)
-            kakao_task = self._search_kakao_api(keyword, page, limit, region, district)
+            # 지역 조건을 provider 파라미터(TourAPI areaCode/sigunguCode, Kakao rect)로 변환
+            region_filter = await asyncio.to_thread(region_code_service.resolve, region, district)
+
+            tour_task = self._search_tour_api(keyword, page, limit, region_filter)
+            kakao_task = self._search_kakao_api(keyword, page, limit, region, district, region_filter)
             
             tour_places, kakao_places = await asyncio.gather(
                 tour_task,
@@ -289,40 +404,24 @@ class PlaceService:
                     "cached": False
                 }
             
-            # 결과 합치기 및 데이터 보강 (TourAPI 설명 + KakaoAPI 위치 정보)
+            # 결과 합치기, 데이터 보강 및 중복 제거 (TourAPI 설명 + KakaoAPI 위치 정보)
             all_places = self._merge_place_data(list(tour_places), list(kakao_places))
             
-            # 지역 필터링
+            # 지역/카테고리 필터링
             if region or district:
                 all_places = self._filter_by_region(all_places, region, district)
+            unique_places = self._filter_by_category(all_places, category)
             
-            # 중복 제거
-            unique_places = self._remove_duplicates(all_places)
+            # Place 객체를 딕셔너리로 변환 후 검색어 일치도/평점 기준 정렬, 제한 적용
+            ranked_places = rank_places([place.to_dict() for place in unique_places], "search", query=keyword)
+            places_dict = ranked_places[:limit]
             
-            # 제한 적용
-            limited_places = unique_places[:limit]
-            
-            # Place 객체를 딕셔너리로 변환
-            places_dict = [place.to_dict() for place in limited_places]
-            places_with_display = self._add_display_fields_to_places(places_dict)
-            
-            # 캐시 저장 (24시간 TTL) - 중복 방지
-            try:
-                cache_collection.insert_one({
-                    "cache_key": cache_key,
-                    "places": places_with_display,
-                    "total": len(unique_places),
-                    "created_at": datetime.utcnow(),
-                    "expires_at": datetime.utcnow() + timedelta(hours=24)
-                })
-            except Exception as e:
-                # 중복 키 오류는 무시 (다른 요청이 이미 캐시를 저장한 경우)
-                if "duplicate key" not in str(e).lower() and "E11000" not in str(e):
-                    logger.warning(f"캐시 저장 실패: {str(e)}")
+            # 캐시에는 표시 필드(이미지는 원본 출처)를 저장, 응답용 이미지 URL은 조회 시 변환
+            self._store_search_cache(cache_key, [with_display_fields(p) for p in places_dict], len(unique_places))
             
             return {
                 "keyword": keyword,
-                "places": places_dict,
+                "places": self._add_display_fields_to_places(places_dict),
                 "page": page,
                 "limit": limit,
                 "total": len(unique_places),
@@ -340,6 +439,475 @@ class PlaceService:
                 "cached": False
             }
 
+    async def search_places_batch(self, queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 검색을 한 번에 처리.
+        - 같은 조건(키워드/지역/페이지/개수/카테고리)은 한 번만 검색
+        - 로컬 인덱스 → 검색 캐시(한 번의 $in 조회) 순으로 처리하고, 남은 검색만 외부 API로 동시 호출
+          (동시 검색 수는 BATCH_SEARCH_CONCURRENCY로 제한)
+        - 결과는 입력 순서대로, 각 항목의 key(없으면 입력 위치)와 함께 반환
+        """
+        if len(queries) > BATCH_SEARCH_MAX_QUERIES:
+            raise ValueError(f"한 번에 최대 {BATCH_SEARCH_MAX_QUERIES}개까지 검색할 수 있습니다.")
+
+        unique: Dict[str, Dict[str, Any]] = {}
+        query_keys: List[str] = []
+        for i, q in enumerate(queries):
+            if not q.get("keyword") and not q.get("region") and not q.get("district"):
+                raise ValueError(f"queries[{i}]: 검색 키워드 또는 지역을 입력해주세요.")
+            # 검색 캐시 키를 그대로 중복 제거 키로 사용 (카테고리 포함)
+            dedupe_key = self._search_cache_key(
+                q.get("keyword"), q.get("region"), q.get("district"), q.get("page", 1), q.get("limit", 10),
+                q.get("category"),
+            )
+            unique.setdefault(dedupe_key, q)
+            query_keys.append(dedupe_key)
+
+        results: Dict[str, Dict[str, Any]] = {}
+
+        # 1) 로컬 인덱스
+        for dedupe_key, q in unique.items():
+            try:
+                local_result = self._search_local(
+                    q.get("keyword") or "", q.get("page", 1), q.get("limit", 10),
+                    q.get("region"), q.get("district"), q.get("category"),
+                )
+            except Exception as e:
+                logger.warning(f"로컬 검색 실패 (외부 API 사용): {e}")
+                local_result = None
+            if local_result:
+                results[dedupe_key] = local_result
+
+        # 2) 검색 캐시 일괄 조회
+        pending = {k: q for k, q in unique.items() if k not in results}
+        if pending:
+            try:
+                cached_docs = {
+                    doc["cache_key"]: doc
+                    for doc in self.db.search_cache.find(
+                        {"cache_key": {"$in": list(pending)}}
+                    )
+                }
+            except Exception as e:
+                logger.warning(f"검색 캐시 일괄 조회 실패: {e}")
+                cached_docs = {}
+            for dedupe_key, q in pending.items():
+                cached = cached_docs.get(dedupe_key)
+                if cached:
+                    results[dedupe_key] = self._cached_search_response(
+                        q.get("keyword") or "", q.get("page", 1), q.get("limit", 10), cached
+                    )
+
+        # 3) 나머지는 외부 API로 동시 검색
+        semaphore = asyncio.Semaphore(BATCH_SEARCH_CONCURRENCY)
+
+        async def _run(dedupe_key: str, q: Dict[str, Any]) -> None:
+            async with semaphore:
+                results[dedupe_key] = await self.search_places(
+                    q.get("keyword") or "", q.get("page", 1), q.get("limit", 10),
+                    q.get("region"), q.get("district"), q.get("category"),
+                )
+
+        await asyncio.gather(*[_run(k, q) for k, q in unique.items() if k not in results])
+
+        return {
+            "results": [
+                {"key": q.get("key") or str(i), **results[dedupe_key]}
+                for i, (q, dedupe_key) in enumerate(zip(queries, query_keys))
+            ],
+            "count": len(queries),
+            "unique": len(unique),
+        }
+
+    @staticmethod
+    def _stream_key(place: Dict[str, Any], first_source: Optional[str] = None) -> str:
+        """
+        스트리밍 결과의 안정 키.
+        먼저 도착한 provider의 ID를 우선 사용 → 나중에 다른 provider 결과와 병합돼도 키가 바뀌지 않음
+        """
+        provider_ids = place.get("provider_ids") or {}
+        for source in (first_source, "kakao", "tour"):
+            if source and provider_ids.get(source):
+                return f"{source}:{provider_ids[source]}"
+        return f"place:{place.get('place_id') or place.get('title')}"
+
+    async def search_places_stream(
+        self,
+        keyword: str = "",
+        page: int = 1,
+        limit: int = 10,
+        region: Optional[str] = None,
+        district: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        점진적 장소 검색 (SSE용 이벤트 스트림).
+        - 로컬 인덱스/캐시에 결과가 있으면 바로 최종 결과로 전송
+        - 없으면 TourAPI/Kakao를 동시에 호출하고, provider가 끝날 때마다 그때까지의 병합 결과를 전송
+        - 각 장소에 key(안정 ID)를 붙여 클라이언트가 목록을 갱신할 수 있게 함
+        """
+        if keyword and page == 1:
+            suggest_index.record_query(keyword)
+
+        def _event(stage: str, places: List[Dict[str, Any]], total: int, final: bool, cached: bool = False):
+            return {
+                "stage": stage,
+                "keyword": keyword,
+                "places": places,
+                "page": page,
+                "limit": limit,
+                "total": total,
+                "cached": cached,
+                "final": final,
+            }
+
+        try:
+            local_result = self._search_local(keyword, page, limit, region, district, category)
+        except Exception as e:
+            logger.warning(f"로컬 검색 실패 (외부 API 사용): {e}")
+            local_result = None
+        if local_result:
+            places = [{**p, "key": self._stream_key(p)} for p in local_result["places"]]
+            yield _event("local", places, local_result["total"], final=True)
+            return
+
+        cache_key = self._search_cache_key(keyword, region, district, page, limit, category)
+        cached_result = self.db.search_cache.find_one({"cache_key": cache_key})
+        if cached_result:
+            cached = self._cached_search_response(keyword, page, limit, cached_result)
+            places = [{**p, "key": self._stream_key(p)} for p in cached["places"]]
+            yield _event("cached", places, cached["total"], final=True, cached=True)
+            return
+
+        region_filter = await asyncio.to_thread(region_code_service.resolve, region, district)
+        tasks = {
+            asyncio.ensure_future(self._search_tour_api(keyword, page, limit, region_filter)): "tour",
+            asyncio.ensure_future(
+                self._search_kakao_api(keyword, page, limit, region, district, region_filter)
+            ): "kakao",
+        }
+        results: Dict[str, List[Place]] = {"tour": [], "kakao": []}
+        first_source: Optional[str] = None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source = tasks[task]
+                    try:
+                        results[source] = list(task.result() or [])
+                    except Exception as e:
+                        logger.warning(f"{source} 검색 오류 (다른 API 결과 사용): {e}")
+                    if first_source is None and results[source]:
+                        first_source = source
+
+                final = not pending
+                if not final and first_source is None:
+                    # 먼저 끝난 provider 결과가 비어 있으면 다음 provider까지 대기
+                    continue
+
+                # 지금까지 도착한 결과로 병합 (원본 Place는 다음 병합에서 다시 쓰이므로 복사본 사용)
+                merged = self._merge_place_data(
+                    [replace(p) for p in results["tour"]], [replace(p) for p in results["kakao"]]
+                )
+                if region or district:
+                    merged = self._filter_by_region(merged, region, district)
+                merged = self._filter_by_category(merged, category)
+                keyed = [place.to_dict() for place in merged]
+                for place_dict in keyed:
+                    place_dict["key"] = self._stream_key(place_dict, first_source)
+                ranked = rank_places(keyed, "search", query=keyword)[:limit]
+                places = self._add_display_fields_to_places(ranked)
+
+                stage = "merged" if final else first_source
+                if final and merged:
+                    self._store_search_cache(
+                        cache_key,
+                        [with_display_fields({k: v for k, v in p.items() if k != "key"}) for p in ranked],
+                        len(merged),
+                    )
+                yield _event(stage, places, len(merged), final=final)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _seen_keys(self, place: Place) -> List[str]:
+        """페이지 간 중복 판단 키 (provider ID + 장소명@격자 셀)"""
+        keys = [f"{source}:{pid}" for source, pid in (place.provider_ids or {}).items()]
+        name = canonical_name(place)
+        if name and place.latitude is not None and place.longitude is not None:
+            row, col = grid_cell(place.latitude, place.longitude)
+            keys.append(f"{name}@{row},{col}")
+        elif name:
+            keys.append(f"{name}@{place.district or place.region or ''}")
+        return keys
+
+    def _is_seen(self, place: Place, seen: Dict[str, None]) -> bool:
+        if any(f"{source}:{pid}" in seen for source, pid in (place.provider_ids or {}).items()):
+            return True
+        name = canonical_name(place)
+        if not name:
+            return False
+        if place.latitude is not None and place.longitude is not None:
+            cell = grid_cell(place.latitude, place.longitude)
+            return any(f"{name}@{row},{col}" in seen for row, col in neighbor_cells(cell))
+        return f"{name}@{place.district or place.region or ''}" in seen
+
+    async def search_places_paged(
+        self,
+        keyword: str = "",
+        limit: int = 10,
+        region: Optional[str] = None,
+        district: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        커서 기반 장소 검색 (요청한 limit을 채울 때까지 provider 다음 페이지를 계속 조회).
+        - 커서: provider별 다음 페이지/소진 여부 + 세션 ID (search_sessions 컬렉션에 남은 결과와 중복 키 저장)
+        - 다음 페이지 요청은 이전 페이지를 다시 조회/병합하지 않고 이어서 진행
+        """
+        state = decode_cursor(cursor) if cursor else {}
+        if cursor and not state:
+            raise ValueError("Invalid cursor")
+
+        query_key = f"{(keyword or '').strip().lower()}:{(region or '').strip()}:{(district or '').strip()}"
+        buffer: List[Dict[str, Any]] = []
+        # 중복 키 (삽입 순서 유지 → 저장 시 최근 키만 남김)
+        seen: Dict[str, None] = {}
+        if state:
+            if state.get("q") != query_key:
+                raise ValueError("Cursor does not match the search conditions")
+            session = self.db.search_sessions.find_one({"session_id": state.get("s")})
+            if not session:
+                raise ValueError("Cursor expired")
+            buffer = session.get("buffer") or []
+            seen = dict.fromkeys(session.get("seen") or [])
+
+        tour_page = int(state.get("tp", 1))
+        kakao_page = int(state.get("kp", 1))
+        tour_done = bool(state.get("td", False))
+        kakao_done = bool(state.get("kd", False)) or not self.kakao_api.api_key
+        # TourAPI 페이지 번호는 페이지 크기 기준이므로 첫 페이지에서 정한 크기를 커서로 유지
+        # (다음 요청의 limit이 달라도 같은 크기로 이어서 조회해야 결과가 건너뛰거나 겹치지 않음)
+        tour_size = int(state.get("ts") or min(max(limit, 10), TOUR_MAX_PAGE_SIZE))
+        kakao_size = KAKAO_MAX_PAGE_SIZE
+
+        region_filter = await asyncio.to_thread(region_code_service.resolve, region, district)
+
+        results = buffer[:limit]
+        buffer = buffer[limit:]
+        rounds = 0
+        while len(results) < limit and not (tour_done and kakao_done) and rounds < PAGED_SEARCH_MAX_ROUNDS:
+            rounds += 1
+            tour_pages = [] if tour_done else list(range(tour_page, tour_page + PAGED_SEARCH_PAGES_PER_ROUND))
+            kakao_pages = [] if kakao_done else [
+                p for p in range(kakao_page, kakao_page + PAGED_SEARCH_PAGES_PER_ROUND) if p <= KAKAO_MAX_PAGE
+            ]
+            batches = await asyncio.gather(
+                *[self._search_tour_api(keyword, p, tour_size, region_filter) for p in tour_pages],
+                *[self._search_kakao_api(keyword, p, kakao_size, region, district, region_filter) for p in kakao_pages],
+                return_exceptions=True,
+            )
+            batches = [b if isinstance(b, list) else [] for b in batches]
+            tour_batches, kakao_batches = batches[:len(tour_pages)], batches[len(tour_pages):]
+
+            # 페이지 크기보다 적게 오면 해당 provider 소진
+            tour_page += len(tour_pages)
+            kakao_page += len(kakao_pages)
+            tour_done = tour_done or any(len(b) < tour_size for b in tour_batches)
+            kakao_done = kakao_done or kakao_page > KAKAO_MAX_PAGE or any(len(b) < kakao_size for b in kakao_batches)
+
+            merged = self._merge_place_data(
+                [p for b in tour_batches for p in b],
+                [p for b in kakao_batches for p in b],
+            )
+            if region or district:
+                merged = self._filter_by_region(merged, region, district)
+
+            # 이번 라운드 신규 결과만 정렬 (이미 내려준 페이지 순서는 유지)
+            fresh = []
+            for place in merged:
+                if self._is_seen(place, seen):
+                    continue
+                seen.update(dict.fromkeys(self._seen_keys(place)))
+                fresh.append(place.to_dict())
+            for place_dict in rank_places(fresh, "search", query=keyword):
+                if len(results) < limit:
+                    results.append(place_dict)
+                else:
+                    buffer.append(place_dict)
+
+        has_more = bool(buffer) or not (tour_done and kakao_done)
+        next_cursor = None
+        if has_more:
+            session_id = uuid.uuid4().hex
+            self.db.search_sessions.insert_one({
+                "session_id": session_id,
+                "buffer": buffer,
+                "seen": list(seen)[-PAGED_SEARCH_MAX_SEEN_KEYS:],
+                "created_at": datetime.utcnow(),
+                "expires_at": datetime.utcnow() + timedelta(minutes=PAGED_SEARCH_SESSION_TTL_MINUTES),
+            })
+            next_cursor = encode_cursor({
+                "s": session_id,
+                "q": query_key,
+                "ts": tour_size,
+                "tp": tour_page,
+                "kp": kakao_page,
+                "td": tour_done,
+                "kd": kakao_done,
+            })
+
+        return {
+            "keyword": keyword,
+            "places": self._add_display_fields_to_places(results),
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+
+    def _hydrate_places(self, place_ids: List[str]) -> List[Dict[str, Any]]:
+        """place_id 목록 → places 문서 (입력 순서 유지, 없는 문서는 제외)"""
+        if not place_ids:
+            return []
+        docs = {doc["place_id"]: doc for doc in self.db.places.find({"place_id": {"$in": place_ids}}, {"_id": 0})}
+        return [docs[pid] for pid in place_ids if pid in docs]
+
+    def _viewport_places_from_index(
+        self,
+        sw_lat: float,
+        sw_lng: float,
+        ne_lat: float,
+        ne_lng: float,
+        category: Optional[str],
+        limit: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """공간 인덱스로 뷰포트 상위 limit개를 고른 뒤 해당 문서만 조회 (인덱스 미준비/미지원 카테고리는 None)"""
+        if not place_spatial_index.ready or (category and category not in CATEGORY_BUCKETS):
+            return None
+        hits = place_spatial_index.bbox(sw_lat, sw_lng, ne_lat, ne_lng, limit=limit, bucket=category)
+        return self._hydrate_places([pid for pid, _ in hits])
+
+    def _query_tile_places(self, tile: Tile, category: Optional[str]) -> List[Dict[str, Any]]:
+        """타일 범위 안의 장소 (리뷰 수 많은 순 TILE_PLACE_LIMIT개)"""
+        tile_sw_lat, tile_sw_lng, tile_ne_lat, tile_ne_lng = tile_bounds(*tile)
+        # 타일 경계에 걸친 장소가 양쪽 타일에 모두 들어가지 않도록 북/동쪽 경계는 제외
+        query: Dict[str, Any] = {
+            "latitude": {"$gte": tile_sw_lat, "$lt": tile_ne_lat},
+            "longitude": {"$gte": tile_sw_lng, "$lt": tile_ne_lng},
+        }
+        if category:
+            # 기본 category 필드 또는 google_types 에 포함된 값으로 필터링
+            query["$or"] = [
+                {"category": category},
+                {"google_types": {"$regex": category, "$options": "i"}},
+            ]
+        return list(
+            self.db.places.find(query, {"_id": 0})
+            .sort("google_ratings_total", -1)
+            .limit(TILE_PLACE_LIMIT)
+        )
+
+    def _viewport_places_from_tiles(
+        self,
+        sw_lat: float,
+        sw_lng: float,
+        ne_lat: float,
+        ne_lng: float,
+        category: Optional[str],
+        limit: int,
+        zoom: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        뷰포트를 z/x/y 타일로 나눠 타일별 캐시 결과를 모은 뒤 뷰포트 범위로 자르고 랭킹 순 limit개 반환.
+        같은 타일을 보는 다른 요청/이동(pan)은 캐시된 타일을 재사용.
+        """
+        tile_zoom = zoom if zoom is not None else zoom_for_bbox(sw_lng, ne_lng)
+        tile_zoom = max(VIEWPORT_TILE_MIN_ZOOM, min(tile_zoom, VIEWPORT_TILE_MAX_ZOOM))
+        tiles = tiles_for_bbox(sw_lat, sw_lng, ne_lat, ne_lng, tile_zoom)
+        while len(tiles) > VIEWPORT_MAX_TILES and tile_zoom > VIEWPORT_TILE_MIN_ZOOM:
+            tile_zoom -= 1
+            tiles = tiles_for_bbox(sw_lat, sw_lng, ne_lat, ne_lng, tile_zoom)
+
+        tile_places = viewport_tile_cache.get_many(tiles, category)
+        for tile in tiles:
+            if tile not in tile_places:
+                tile_places[tile] = self._query_tile_places(tile, category)
+                viewport_tile_cache.put(tile, category, tile_places[tile])
+
+        in_view: List[Dict[str, Any]] = []
+        seen_ids: set = set()
+        for tile in tiles:
+            for doc in tile_places[tile]:
+                lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+                if lat is None or lng is None or not (sw_lat <= lat <= ne_lat and sw_lng <= lng <= ne_lng):
+                    continue
+                pid = doc.get("place_id")
+                if pid in seen_ids:
+                    continue
+                seen_ids.add(pid)
+                in_view.append(doc)
+        return rank_places(in_view, "section")[:limit]
+
+    async def _search_viewport_external(
+        self,
+        sw_lat: float,
+        sw_lng: float,
+        ne_lat: float,
+        ne_lng: float,
+        category: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        뷰포트 범위 외부 검색.
+        - Kakao: 카테고리 그룹 코드별 카테고리 검색 + rect(뷰포트)
+        - TourAPI: 뷰포트 중심 locationBasedList2 (반경 = 중심~모서리 거리, 최대 20km) + contentTypeId
+        - 병합 후 뷰포트 안의 장소만 랭킹 순으로 반환
+        """
+        codes = VIEWPORT_PROVIDER_CATEGORIES.get(category or "", VIEWPORT_PROVIDER_CATEGORIES[""])
+        rect = f"{sw_lng},{sw_lat},{ne_lng},{ne_lat}"
+        center_lat, center_lng = (sw_lat + ne_lat) / 2, (sw_lng + ne_lng) / 2
+        radius = int(min(haversine_m(center_lat, center_lng, ne_lat, ne_lng), 20000))
+
+        async def _kakao(code: str) -> List[Place]:
+            if not self.kakao_api.api_key:
+                return []
+            result = await asyncio.to_thread(
+                self.kakao_api.search_category, code, rect, 1, KAKAO_MAX_PAGE_SIZE
+            )
+            documents = [d for d in (result or {}).get("documents", []) if isinstance(d, dict)]
+            return self.normalizer.normalize_list(documents, source="kakao")
+
+        async def _tour(content_type_id: Optional[str]) -> List[Place]:
+            if not self.tour_api.api_key:
+                return []
+            result = await asyncio.to_thread(
+                self.tour_api.search_location, center_lat, center_lng, radius, 1,
+                min(max(limit, 10), TOUR_MAX_PAGE_SIZE), content_type_id,
+            )
+            return self.normalizer.normalize_list(self._extract_tour_items(result), source="tour")
+
+        tour_types = codes["tour"]
+        batches = await asyncio.gather(
+            *[_tour(t) for t in tour_types],
+            *[_kakao(code) for code in codes["kakao"]],
+            return_exceptions=True,
+        )
+        for batch in batches:
+            if isinstance(batch, Exception):
+                logger.warning(f"뷰포트 외부 검색 일부 실패: {batch}")
+        batches = [b if isinstance(b, list) else [] for b in batches]
+        tour_places = [p for b in batches[:len(tour_types)] for p in b]
+        kakao_places = [p for b in batches[len(tour_types):] for p in b]
+
+        in_view = []
+        for place in self._merge_place_data(tour_places, kakao_places):
+            if place.latitude is None or place.longitude is None:
+                continue
+            if sw_lat <= place.latitude <= ne_lat and sw_lng <= place.longitude <= ne_lng:
+                in_view.append(place.to_dict())
+        return rank_places(in_view, "section")[:limit]
+
     async def search_places_in_viewport(
         self,
         sw_lat: float,
@@ -349,39 +917,32 @@ class PlaceService:
         category: Optional[str] = None,
         limit: int = 50,
         include_external: bool = False,
+        cluster: bool = False,
+        zoom: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         지도 뷰포트(위경도 범위) 기준 장소 검색.
+        0) cluster=True 이면 줌 레벨별 격자 집계로 클러스터 응답 (충분히 확대된 줌/미지원 카테고리는 개별 장소)
         1) 우리 MongoDB places 컬렉션에서 위경도 박스 안의 장소를 먼저 조회.
-        2) include_external=True 이고, 결과가 부족하면 기존 search_places 로 외부 API(Tour/Kakao)를 호출해 보강.
+        2) include_external=True 이고, 결과가 부족하면 뷰포트 범위로 외부 API(Kakao 카테고리 rect / TourAPI 위치 기반)를 호출해 보강.
         """
+        if (
+            cluster
+            and place_cluster_index.ready
+            and (zoom is None or zoom <= CLUSTER_MAX_ZOOM)
+            and (not category or category in CATEGORY_BUCKETS)
+        ):
+            result = place_cluster_index.clusters(sw_lat, sw_lng, ne_lat, ne_lng, zoom, category or ALL_BUCKET)
+            return {**result, "source": "cluster", "from_cache": True}
+
         try:
             places_col = self.db.places
 
-            query: Dict[str, Any] = {
-                "latitude": {"$gte": float(sw_lat), "$lte": float(ne_lat)},
-                "longitude": {"$gte": float(sw_lng), "$lte": float(ne_lng)},
-            }
-
-            if category:
-                # 기본 category 필드 또는 google_types 에 포함된 값으로 필터링
-                query["$or"] = [
-                    {"category": category},
-                    {"google_types": {"$regex": category, "$options": "i"}},
-                ]
-
-            docs = list(
-                places_col.find(query).limit(limit)
-            )
-
-            internal_places: List[Dict[str, Any]] = []
-            for doc in docs:
-                if not isinstance(doc, dict):
-                    continue
-                doc = dict(doc)
-                doc.pop("_id", None)
-                internal_places.append(doc)
-
+            internal_places = self._viewport_places_from_index(sw_lat, sw_lng, ne_lat, ne_lng, category, limit)
+            if internal_places is None:
+                internal_places = self._viewport_places_from_tiles(
+                    sw_lat, sw_lng, ne_lat, ne_lng, category, limit, zoom
+                )
             internal_places = self._add_display_fields_to_places(internal_places)
 
             # DB 결과만으로 충분하면 그대로 반환
@@ -393,37 +954,12 @@ class PlaceService:
                     "from_cache": True,
                 }
 
-            # 외부 API 호출로 보강 (기존 search_places 재사용)
-            # 지역 정보는 뷰포트 중심의 위도 기반으로 대략적인 지역명을 추정하거나, 클라이언트에서 전달한 category 만 사용
-            # 여기서는 keyword/region 없이 전국 검색 후, 위경도 박스로 다시 필터링
-            external_result = await self.search_places(
-                keyword="",
-                page=1,
-                limit=limit,
+            # 외부 API 호출로 보강 (Kakao 카테고리 검색 rect + TourAPI 위치 기반 목록, 뷰포트 범위 안 결과만)
+            external_in_view = await self._search_viewport_external(
+                sw_lat, sw_lng, ne_lat, ne_lng, category, limit
             )
-            external_places_raw: List[Dict[str, Any]] = external_result.get("places", []) or []
 
-            # 위경도 박스 안에 있는 외부 장소만 선택
-            external_in_view: List[Dict[str, Any]] = []
-            for p in external_places_raw:
-                try:
-                    lat = float(p.get("latitude"))
-                    lng = float(p.get("longitude"))
-                except (TypeError, ValueError):
-                    continue
-                if not (sw_lat <= lat <= ne_lat and sw_lng <= lng <= ne_lng):
-                    continue
-                if category:
-                    cat = f"{p.get('category','')} {' '.join(p.get('google_types',[]) or [])}".lower()
-                    if category == "food" and not any(k in cat for k in ["food", "restaurant", "음식", "식당"]):
-                        continue
-                    if category == "cafe" and "cafe" not in cat and "카페" not in cat:
-                        continue
-                    if category == "spot" and not any(k in cat for k in ["tour", "attraction", "명소", "관광"]):
-                        continue
-                external_in_view.append(p)
-
-            # DB에 upsert (캐시) 후, display 필드 추가
+            # DB에 upsert (캐시, 표시 필드 포함)
             enriched_external: List[Dict[str, Any]] = []
             for p in external_in_view:
                 if not isinstance(p, dict):
@@ -433,14 +969,7 @@ class PlaceService:
                 if place_id_value:
                     item["place_id"] = str(place_id_value)
                     try:
-                        places_col.update_one(
-                            {"place_id": item["place_id"]},
-                            {
-                                "$set": {**item, "updated_at": datetime.utcnow()},
-                                "$setOnInsert": {"created_at": datetime.utcnow()},
-                            },
-                            upsert=True,
-                        )
+                        item = upsert_place(item, places_col)
                     except Exception as e:
                         logger.warning(f"Viewport external place upsert 실패: {e}")
                 enriched_external.append(item)
@@ -478,36 +1007,55 @@ class PlaceService:
     async def get_place_detail(self, place_id: str) -> Optional[Dict[str, Any]]:
         """
         장소 상세 정보 조회 우선순위:
-        1) MongoDB places 컬렉션에서 place_id로 조회
+        1) MongoDB places 컬렉션에서 place_id(또는 place_ref, provider_ids의 provider별 ID)로 조회
         2) 외부 API(Tour/Kakao) 조회 후 Place로 normalize + DB에 upsert
+           - Google 상세 정보(평점/리뷰/영업시간)는 요청 중에 조회하지 않고 google_details_refresher로 백그라운드 갱신
+           - 목록 API로만 저장된 TourAPI 장소의 상세 정보도 tour_detail_refresher로 백그라운드 보강
+           - place_ref("tour:126508" / "kakao:8217321")거나 place_id_router에 기록된 ID면 해당 provider에만 조회
+           - TourAPI contentid는 detailCommon2/detailIntro2로 바로 조회
         """
         try:
             logger.info(f"장소 상세 정보 조회 시작: place_id={place_id}, provider={self.api_provider}")
 
             places_col = self.db.places
+            _, raw_id = parse_place_ref(place_id)
 
-            # 1) DB에서 먼저 조회
-            doc = places_col.find_one({"place_id": place_id})
+            # 1) DB에서 먼저 조회 (병합된 장소는 다른 provider ID로도 찾음)
+            doc = places_col.find_one(self._place_id_query(place_id))
             if doc:
                 logger.info(f"DB에서 장소 상세 정보 찾음: place_id={place_id}")
                 # MongoDB ObjectId 제거
                 doc.pop("_id", None)
-                # Google 상세 정보 보강 (가능한 경우)
-                doc = self._enrich_with_google_details(doc, places_col)
-                return doc
-
-            # 2) 설정에 따라 외부 API 선택
-            if self.api_provider == "kakao":
-                place_data = await self._get_place_detail_kakao(place_id, logger)
-            else:
-                place_data = await self._get_place_detail_tour(place_id, logger)
-
-            # 2-1) place_id가 장소명(숫자 아님)인데 실패 시, 다른 provider로 폴백
-            if not place_data and not place_id.isdigit():
+                # Google 상세 정보는 비어 있거나 오래된 경우, TourAPI 상세 정보(개요/이용시간 등)는
+                # 목록 API로만 저장된 경우 백그라운드 갱신 (응답은 저장된 값 그대로)
+                google_details_refresher.schedule(doc)
+                tour_detail_refresher.schedule(doc)
+                return ensure_display_fields(doc)
+
+            # 2) provider를 아는 ID면 그 provider에만 조회
+            place_data = None
+            routes = place_id_router.resolve(place_id)
+            for route in routes:
+                if route["provider"] == "kakao":
+                    place_data = await self._get_place_detail_kakao(route["place_id"], logger, hint=route)
+                else:
+                    place_data = await self._get_place_detail_tour(route["place_id"], logger)
+                if place_data:
+                    break
+
+            # 2-1) 기록이 없는 기존 ID: 설정에 따라 외부 API 선택
+            if not routes:
                 if self.api_provider == "kakao":
-                    place_data = await self._get_place_detail_tour(place_id, logger)
+                    place_data = await self._get_place_detail_kakao(raw_id, logger)
                 else:
-                    place_data = await self._get_place_detail_kakao(place_id, logger)
+                    place_data = await self._get_place_detail_tour(raw_id, logger)
+
+                # place_id가 장소명(숫자 아님)인데 실패 시, 다른 provider로 폴백
+                if not place_data and not raw_id.isdigit():
+                    if self.api_provider == "kakao":
+                        place_data = await self._get_place_detail_tour(raw_id, logger)
+                    else:
+                        place_data = await self._get_place_detail_kakao(raw_id, logger)
 
             if not place_data:
                 logger.warning(f"외부 API에서도 장소 상세 정보를 찾지 못함: place_id={place_id}")
@@ -515,188 +1063,349 @@ class PlaceService:
 
             # 3) Place 데이터 DB에 upsert (향후 재사용 및 빠른 응답을 위해)
             try:
-                place_id_value = place_data.get("place_id") or place_id
-                place_data["place_id"] = place_id_value
-                # Google 상세 정보 보강 (google_place_id가 있는 경우)
-                place_data = self._enrich_with_google_details(place_data, places_col)
-                places_col.update_one(
-                    {"place_id": place_id_value},
-                    {"$set": place_data, "$setOnInsert": {"created_at": datetime.utcnow()}},
-                    upsert=True,
-                )
+                place_data["place_id"] = place_data.get("place_id") or raw_id
+                place_data.setdefault("place_ref", place_ref_of(place_data))
+                place_data = upsert_place(place_data, places_col)
+                # Google 상세 정보 백그라운드 갱신 (google_place_id가 있는 경우)
+                google_details_refresher.schedule(place_data)
             except Exception as e:
                 logger.warning(f"Place upsert 실패 (place_id={place_id}): {e}")
 
-            return place_data
+            return ensure_display_fields(place_data)
         except Exception as e:
             logger.error(f"장소 상세 정보 조회 실패: {str(e)}")
             raise Exception(f"Failed to get place detail: {str(e)}")
 
-    def _enrich_with_google_details(self, place_data: Dict[str, Any], places_col) -> Dict[str, Any]:
+    @staticmethod
+    def _match_requested_ids(place_ids: List[str], docs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """요청 ID(place_id/place_ref/provider별 ID) → 문서 (_place_id_query와 같은 기준)"""
+        by_place_id: Dict[str, Dict[str, Any]] = {}
+        by_ref: Dict[str, Dict[str, Any]] = {}
+        by_alias: Dict[str, Dict[str, Any]] = {}
+        for doc in docs:
+            by_place_id.setdefault(str(doc.get("place_id")), doc)
+            place_ref = place_ref_of(doc)
+            if place_ref:
+                by_ref.setdefault(place_ref, doc)
+            for provider, provider_id in (doc.get("provider_ids") or {}).items():
+                by_ref.setdefault(make_place_ref(provider, provider_id), doc)
+                by_alias.setdefault(str(provider_id), doc)
+
+        matched: Dict[str, Dict[str, Any]] = {}
+        for place_id in place_ids:
+            provider, raw_id = parse_place_ref(place_id)
+            doc = by_ref.get(place_id) if provider else (by_place_id.get(raw_id) or by_alias.get(raw_id))
+            if doc is not None:
+                matched[place_id] = doc
+        return matched
+
+    async def get_places_batch(
+        self, place_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
-        Google Place Details 정보를 place_data에 보강.
-        - google_place_id가 있고, 아직 reviews/영업시간 정보가 없을 때만 호출.
-        - 결과는 MongoDB에도 저장.
+        여러 장소 상세를 한 번에 조회 (플랜/위시리스트/테마 페이지).
+        - DB에 있는 장소는 $in 조회 1회 (place_id / place_ref / provider별 ID 모두 지원)
+        - 없는 장소만 get_place_detail로 provider별 동시 조회
+        - fields: 반환할 필드 (없으면 전체 + 표시용 필드)
+        - places: 요청 ID → 장소 (못 찾으면 None)
         """
-        try:
-            google_place_id = place_data.get("google_place_id")
-            if not google_place_id:
-                return place_data
-
-            has_details = place_data.get("google_reviews") or place_data.get("google_opening_hours")
-            if has_details:
-                return place_data
-
-            details = google_places_service.get_place_details(google_place_id)
-            if not details:
-                return place_data
-
-            rating = details.get("rating")
-            reviews_total = details.get("user_ratings_total")
-            opening_hours = details.get("opening_hours")
-            reviews = details.get("reviews")
-            photos = details.get("photos")
-            formatted_address = details.get("formatted_address")
-            formatted_phone = details.get("formatted_phone_number")
-            website = details.get("website")
-            types = details.get("types")
-            location = details.get("location") or {}
-
-            # Google 기본 정보 우선 적용
-            if details.get("name"):
-                place_data["google_name"] = details.get("name")
-            if formatted_address:
-                place_data["google_formatted_address"] = formatted_address
-            if formatted_phone:
-                place_data["google_formatted_phone_number"] = formatted_phone
-            if website:
-                place_data["google_website"] = website
-            if types:
-                place_data["google_types"] = types
-
-            # 좌표: Google geometry를 우선 적용
-            lat = location.get("lat")
-            lng = location.get("lng")
-            if lat is not None and lng is not None:
-                place_data["latitude"] = lat
-                place_data["longitude"] = lng
-
-            # 품질 정보
-            if rating is not None:
-                place_data["google_rating"] = rating
-            if reviews_total is not None:
-                place_data["google_ratings_total"] = reviews_total
-            if opening_hours is not None:
-                place_data["google_opening_hours"] = opening_hours
-            if reviews is not None:
-                place_data["google_reviews"] = reviews
-            if photos is not None:
-                place_data["google_photos"] = photos
-
-            # DB에 즉시 반영 (캐싱)
-            place_id_value = place_data.get("place_id")
-            if place_id_value:
-                places_col.update_one(
-                    {"place_id": place_id_value},
-                    {"$set": {
-                        "google_name": place_data.get("google_name"),
-                        "google_formatted_address": place_data.get("google_formatted_address"),
-                        "google_formatted_phone_number": place_data.get("google_formatted_phone_number"),
-                        "google_website": place_data.get("google_website"),
-                        "google_types": place_data.get("google_types"),
-                        "google_rating": place_data.get("google_rating"),
-                        "google_ratings_total": place_data.get("google_ratings_total"),
-                        "google_opening_hours": place_data.get("google_opening_hours"),
-                        "google_reviews": place_data.get("google_reviews"),
-                        "google_photos": place_data.get("google_photos"),
-                        "latitude": place_data.get("latitude"),
-                        "longitude": place_data.get("longitude"),
-                        "google_details_updated_at": datetime.utcnow(),
-                    }},
-                    upsert=True,
+        place_ids = list(dict.fromkeys(str(pid).strip() for pid in place_ids if pid and str(pid).strip()))
+        if not place_ids:
+            raise ValueError("ids가 비어 있습니다")
+        if len(place_ids) > PLACES_BATCH_MAX_IDS:
+            raise ValueError(f"ids는 최대 {PLACES_BATCH_MAX_IDS}개까지 가능합니다")
+        if fields is not None:
+            fields = list(dict.fromkeys(f.strip() for f in fields if f and f.strip()))
+            if any(f.startswith("$") or f.startswith("_") for f in fields):
+                raise ValueError("fields에 사용할 수 없는 필드가 있습니다")
+
+        raw_ids = list({parse_place_ref(pid)[1] for pid in place_ids})
+        refs = [pid for pid in place_ids if parse_place_ref(pid)[0]]
+        projection: Optional[Dict[str, int]] = None
+        if fields:
+            sources = [name for f in fields for name in _DISPLAY_SOURCE_FIELDS.get(f, (f,))]
+            projection = {"_id": 0, **{name: 1 for name in (*_PLACES_BATCH_BASE_FIELDS, *sources)}}
+        docs = list(self.db.places.find(
+            {
+                "$or": [
+                    {"place_id": {"$in": raw_ids + refs}},
+                    {"place_ref": {"$in": refs}},
+                    {"provider_ids.tour": {"$in": raw_ids}},
+                    {"provider_ids.kakao": {"$in": raw_ids}},
+                ]
+            },
+            projection or {"_id": 0},
+        ))
+        found = self._match_requested_ids(place_ids, docs)
+        for doc in found.values():
+            google_details_refresher.schedule(doc)
+
+        # DB에 없는 장소: provider별 상세 조회 (동시 PLACES_BATCH_CONCURRENCY개)
+        misses = [pid for pid in place_ids if pid not in found]
+        if misses:
+            semaphore = asyncio.Semaphore(PLACES_BATCH_CONCURRENCY)
+
+            async def _resolve(pid: str) -> None:
+                async with semaphore:
+                    try:
+                        place = await self.get_place_detail(pid)
+                    except Exception as e:
+                        logger.warning(f"배치 장소 상세 조회 실패 (place_id={pid}): {e}")
+                        return
+                if place:
+                    found[pid] = place
+
+            await asyncio.gather(*(_resolve(pid) for pid in misses))
+
+        places: Dict[str, Optional[Dict[str, Any]]] = {}
+        for pid in place_ids:
+            doc = found.get(pid)
+            if doc is None:
+                places[pid] = None
+                continue
+            item = self._add_display_fields_to_places([doc])[0]
+            if fields:
+                keep = {"place_id", "place_ref", *fields}
+                item = {key: value for key, value in item.items() if key in keep}
+            places[pid] = item
+
+        missing = [pid for pid in place_ids if places[pid] is None]
+        return {
+            "places": places,
+            "count": len(place_ids) - len(missing),
+            "missing": missing,
+        }
+
+    def _nearest_from_db(
+        self, lat: float, lng: float, k: int, category: Optional[str], exclude_id: str
+    ) -> List[Tuple[str, float]]:
+        """공간 인덱스 미준비 시: 탐색 반경 박스를 DB에서 조회해 거리순 k개"""
+        d_lat = math.degrees(NEARBY_MAX_RADIUS_M / EARTH_RADIUS_M)
+        d_lng = d_lat / max(math.cos(math.radians(lat)), 1e-6)
+        candidates: List[Tuple[str, float]] = []
+        for doc in self.db.places.find(
+            {
+                "latitude": {"$gte": lat - d_lat, "$lte": lat + d_lat},
+                "longitude": {"$gte": lng - d_lng, "$lte": lng + d_lng},
+            },
+            {"_id": 0, "place_id": 1, "latitude": 1, "longitude": 1, "category": 1, "description": 1, "google_types": 1},
+        ):
+            pid = str(doc.get("place_id") or "")
+            doc_lat, doc_lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+            if not pid or pid == exclude_id or doc_lat is None or doc_lng is None:
+                continue
+            if category and category not in category_buckets(doc):
+                continue
+            distance = haversine_m(lat, lng, doc_lat, doc_lng)
+            if distance <= NEARBY_MAX_RADIUS_M:
+                candidates.append((pid, distance))
+        candidates.sort(key=lambda item: item[1])
+        return candidates[:k]
+
+    async def get_nearby_places(
+        self,
+        place_id: str,
+        k: int = 10,
+        category: Optional[str] = None,
+        ranked: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        상세 페이지 주변 장소 (외부 API 호출 없음).
+        - 기준 좌표는 places 문서에서 조회 (문서/좌표가 없으면 None)
+        - 공간 인덱스 최근접 탐색 → ranked=True 이면 거리순 후보 k*3개를 평점/리뷰/거리 점수로 재정렬
+        - (place_id, k, category, ranked) 단위로 캐시, 결과 반경 안의 장소가 upsert되면 무효화
+        """
+        if k < 1 or k > NEARBY_MAX_K:
+            raise ValueError(f"k는 1~{NEARBY_MAX_K} 사이여야 합니다")
+        category = (category or "").strip().lower() or None
+        if category and category not in CATEGORY_BUCKETS:
+            raise ValueError(f"지원하지 않는 카테고리입니다: {category}")
+
+        cache_key = nearby_cache_key(place_id, k, category, ranked)
+        cached = nearby_places_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "from_cache": True}
+
+        anchor = self.db.places.find_one(
+            self._place_id_query(place_id), {"_id": 0, "place_id": 1, "latitude": 1, "longitude": 1}
+        )
+        lat = to_float((anchor or {}).get("latitude"))
+        lng = to_float((anchor or {}).get("longitude"))
+        if lat is None or lng is None:
+            return None
+        anchor_id = str(anchor["place_id"])
+
+        pool = k * NEARBY_CANDIDATE_FACTOR if ranked else k
+        if place_spatial_index.ready:
+            # 기준 장소 자신이 포함되므로 1개 더 조회
+            hits = place_spatial_index.nearest(lat, lng, pool + 1, bucket=category, max_radius_m=NEARBY_MAX_RADIUS_M)
+            hits = [(pid, distance) for pid, distance in hits if pid != anchor_id][:pool]
+        else:
+            hits = self._nearest_from_db(lat, lng, pool, category, anchor_id)
+
+        distances = dict(hits)
+        places = self._hydrate_places([pid for pid, _ in hits])
+        if ranked:
+            places = rank_places(places, "nearby", reference=(lat, lng))
+        places = self._add_display_fields_to_places(places[:k])
+        for place in places:
+            place["distance_m"] = round(distances.get(place["place_id"], 0.0))
+
+        result = {
+            "place_id": place_id,
+            "places": places,
+            "total": len(places),
+            "category": category,
+        }
+        # 후보가 부족하면 탐색 반경 전체, 아니면 가장 먼 후보까지가 결과에 영향을 주는 범위
+        radius_m = NEARBY_MAX_RADIUS_M if len(hits) < pool else max(distances.values())
+        nearby_places_cache.put(cache_key, lat, lng, radius_m, result)
+        return {**result, "from_cache": False}
+
+    @staticmethod
+    def _place_id_query(place_id: str) -> Dict[str, Any]:
+        """
+        place_id로 places 문서를 찾는 조건.
+        - place_ref("tour:126508"): 해당 provider의 ID로 저장됐거나 병합된 장소만
+        - 기존 place_id: place_id 또는 provider별 ID(provider_ids.tour / provider_ids.kakao)
+        """
+        provider, raw_id = parse_place_ref(place_id)
+        if not provider:
+            return {
+                "$or": [
+                    {"place_id": raw_id},
+                    {"provider_ids.tour": raw_id},
+                    {"provider_ids.kakao": raw_id},
+                ]
+            }
+        # place_ref가 없는 기존 문서: 병합되지 않은 Kakao 장소에만 kakao_url이 있음
+        if provider == "kakao":
+            own_id = {
+                "place_id": raw_id,
+                "place_ref": {"$exists": False},
+                "kakao_url": {"$nin": [None, ""]},
+                "provider_ids.tour": {"$ne": raw_id},
+            }
+        else:
+            own_id = {
+                "place_id": raw_id,
+                "place_ref": {"$exists": False},
+                "$or": [{"kakao_url": {"$in": [None, ""]}}, {"provider_ids.tour": raw_id}],
+            }
+        return {
+            "$or": [
+                {"place_ref": make_place_ref(provider, raw_id)},
+                {f"provider_ids.{provider}": raw_id},
+                own_id,
+            ]
+        }
+
+    async def _fetch_tour_detail(
+        self, content_id: str, content_type_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        TourAPI 상세(공통 + 소개) 조회 후 병합한 item.
+        - contenttypeid를 알면 detailCommon2 / detailIntro2 동시 호출
+        - 모르면 detailCommon2에서 contenttypeid를 얻은 뒤 detailIntro2 호출
+        """
+        if content_type_id:
+            common, intro = await asyncio.gather(
+                asyncio.to_thread(self.tour_api.get_detail_common, content_id),
+                asyncio.to_thread(self.tour_api.get_detail_intro, content_id, content_type_id),
+                return_exceptions=True,
+            )
+            if isinstance(common, Exception):
+                raise common
+        else:
+            common = await asyncio.to_thread(self.tour_api.get_detail_common, content_id)
+            intro = None
+
+        common_items = self._extract_tour_items(common)
+        if not common_items:
+            return None
+        item = dict(common_items[0])
+
+        if intro is None and item.get("contenttypeid"):
+            try:
+                intro = await asyncio.to_thread(
+                    self.tour_api.get_detail_intro, content_id, str(item["contenttypeid"])
                 )
-        except Exception as e:
-            logger.warning(f"Google details enrichment failed for place_id={place_data.get('place_id')}: {e}")
+            except Exception as e:
+                intro = e
+        if isinstance(intro, Exception):
+            logger.warning(f"detailIntro2 조회 실패: {intro}, 기본 정보만 사용 (contentid={content_id})")
+        elif intro:
+            intro_items = self._extract_tour_items(intro)
+            if intro_items:
+                item.update(intro_items[0])
+        return item
 
-        return place_data
-    
     async def _get_place_detail_tour(self, place_id: str, logger) -> Optional[Dict[str, Any]]:
         """TourAPI를 사용한 장소 상세 정보 조회"""
-        import asyncio
-        
-        # 방법 1: 검색 결과에서 찾기
-        logger.info(f"[TourAPI] 검색 결과에서 장소 찾기 시도: {place_id}")
-        
-        try:
-            tour_search_result = await asyncio.to_thread(
-                self.tour_api.search_places, "", 1, 50  # 넓은 범위로 검색
-            )
-            
-            # TourAPI 검색 결과에서 contentid 매칭
-            if tour_search_result:
-                items = tour_search_result.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-                if not isinstance(items, list):
-                    items = [items] if items else []
-                for item in items:
-                    if str(item.get("contentid", "")) == place_id:
-                        place = self.normalizer.from_tour_api(item)
-                        logger.info(f"TourAPI 검색 결과에서 장소 찾음: {place_id}")
-                        return place.to_dict()
-        except Exception as e:
-            logger.warning(f"TourAPI 검색 실패: {str(e)}")
-        
+        # 방법 1: place_id가 contentid(숫자)면 상세 API로 바로 조회
+        if place_id.isdigit():
+            try:
+                item = await self._fetch_tour_detail(place_id)
+                if item:
+                    place_data = self.normalizer.from_tour_api(item).to_dict()
+                    place_data["detail_fetched_at"] = datetime.utcnow()
+                    logger.info(f"TourAPI 직접 조회 성공: {place_id}")
+                    return place_data
+            except Exception as e:
+                logger.warning(f"TourAPI 직접 조회 실패: {str(e)}")
+
         # 방법 2: place_id가 숫자가 아니면(장소명) 키워드 검색으로 시도
-        if not place_id.isdigit():
+        else:
             try:
                 tour_search_result = await asyncio.to_thread(
                     self.tour_api.search_places, place_id, 1, 1
                 )
-                if tour_search_result:
-                    items = tour_search_result.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-                    if not isinstance(items, list):
-                        items = [items] if items else []
-                    if items:
-                        place = self.normalizer.from_tour_api(items[0])
-                        logger.info(f"TourAPI 장소명 검색으로 장소 찾음: {place_id}")
-                        return place.to_dict()
-            except Exception as e:
-                logger.warning(f"TourAPI 장소명 검색 실패: {str(e)}")
-        
-        # 방법 3: 직접 상세 정보 조회 시도 (contentid가 숫자인 경우)
-        logger.info(f"[TourAPI] 검색 결과에서 못 찾음, 직접 조회 시도: {place_id}")
-        is_tour_contentid = place_id.isdigit()
-        
-        if is_tour_contentid:
-            try:
-                tour_result = await asyncio.to_thread(
-                    self.tour_api.get_place_detail, place_id
-                )
-                items = tour_result.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+                items = self._extract_tour_items(tour_search_result)
                 if items:
-                    item = items[0] if isinstance(items, list) else items
-                    place = self.normalizer.from_tour_api(item)
-                    logger.info(f"TourAPI 직접 조회 성공: {place_id}")
+                    place = self.normalizer.from_tour_api(items[0])
+                    logger.info(f"TourAPI 장소명 검색으로 장소 찾음: {place_id}")
                     return place.to_dict()
             except Exception as e:
-                logger.warning(f"TourAPI 직접 조회 실패: {str(e)}")
-        
+                logger.warning(f"TourAPI 장소명 검색 실패: {str(e)}")
+
         logger.warning(f"TourAPI로 장소 상세 정보를 찾을 수 없음: {place_id}")
         return None
-    
-    async def _get_place_detail_kakao(self, place_id: str, logger) -> Optional[Dict[str, Any]]:
-        """KakaoAPI를 사용한 장소 상세 정보 조회"""
-        import asyncio
-        
-        # KakaoAPI는 place_id로 직접 조회하는 API가 없으므로
-        # place_id를 키워드로 검색하여 찾아야 함
+
+    async def _get_place_detail_kakao(
+        self, place_id: str, logger, hint: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        KakaoAPI를 사용한 장소 상세 정보 조회.
+        - KakaoAPI는 place_id로 직접 조회하는 API가 없으므로 검색 결과에서 ID가 일치하는 장소를 찾음
+        - hint(place_id_router 기록)에 이름/좌표가 있으면 좌표 주변 rect + 이름 키워드 검색 1회
+        """
+        hint = hint or {}
+        lat, lng = to_float(hint.get("latitude")), to_float(hint.get("longitude"))
+        if hint.get("title") and lat is not None and lng is not None:
+            logger.info(f"[KakaoAPI] 이름/좌표로 검색: {place_id}")
+            rect = (
+                f"{lng - KAKAO_DETAIL_RECT_DEG},{lat - KAKAO_DETAIL_RECT_DEG},"
+                f"{lng + KAKAO_DETAIL_RECT_DEG},{lat + KAKAO_DETAIL_RECT_DEG}"
+            )
+            try:
+                kakao_result = await asyncio.to_thread(
+                    self.kakao_api.search_places, hint["title"], 1, KAKAO_MAX_PAGE_SIZE, None, None, rect
+                )
+                for doc in (kakao_result or {}).get("documents", []):
+                    if str(doc.get("id", "")) == place_id:
+                        logger.info(f"KakaoAPI 이름/좌표 검색으로 장소 찾음: {place_id}")
+                        return self.normalizer.from_kakao_api(doc).to_dict()
+            except Exception as e:
+                logger.warning(f"KakaoAPI 이름/좌표 검색 실패: {str(e)}")
+            logger.warning(f"KakaoAPI로 장소 상세 정보를 찾을 수 없음: {place_id}")
+            return None
+
+        # 이름/좌표를 모르는 경우: place_id를 키워드로 검색 (KakaoAPI의 get_place_detail 사용)
         logger.info(f"[KakaoAPI] place_id로 검색 시도: {place_id}")
-        
         try:
-            # 방법 1: place_id를 키워드로 검색 (KakaoAPI의 get_place_detail 사용)
             kakao_result = await asyncio.to_thread(
                 self.kakao_api.get_place_detail, place_id
             )
-            
             if kakao_result and kakao_result.get("id"):
                 # place_id가 일치하는지 확인
                 if str(kakao_result.get("id", "")) == place_id:
@@ -710,34 +1419,7 @@ class PlaceService:
                     return place.to_dict()
         except Exception as e:
             logger.warning(f"KakaoAPI place_id 검색 실패: {str(e)}")
-        
-        # 방법 2: 넓은 범위로 검색하여 place_id 매칭 시도
-        logger.info(f"[KakaoAPI] 넓은 범위 검색으로 장소 찾기 시도: {place_id}")
-        
-        try:
-            # 여러 키워드로 검색 시도 (서울 지역의 다양한 카테고리)
-            search_keywords = ["서울", "음식점", "카페", "쇼핑", "숙박"]
-            
-            for keyword in search_keywords:
-                try:
-                    kakao_search_result = await asyncio.to_thread(
-                        self.kakao_api.search_places, keyword, 1, 45  # 최대 45개까지 검색
-                    )
-                    
-                    if kakao_search_result:
-                        documents = kakao_search_result.get("documents", [])
-                        for doc in documents:
-                            if str(doc.get("id", "")) == place_id:
-                                place = self.normalizer.from_kakao_api(doc)
-                                logger.info(f"KakaoAPI 넓은 범위 검색으로 장소 찾음: {place_id} (키워드: {keyword})")
-                                return place.to_dict()
-                except Exception as e:
-                    logger.warning(f"KakaoAPI 키워드 검색 실패 (키워드: {keyword}): {str(e)}")
-                    continue
-        except Exception as e:
-            logger.warning(f"KakaoAPI 넓은 범위 검색 실패: {str(e)}")
-        
+
         logger.warning(f"KakaoAPI로 장소 상세 정보를 찾을 수 없음: {place_id}")
-        logger.warning(f"참고: KakaoAPI는 place_id로 직접 조회하는 API가 없어서 검색으로 찾아야 합니다.")
         return None
 
@@ -0,0 +1,317 @@
+"""
+장소 공간 인덱스 (프로세스 메모리)
+- 좌표가 있는 모든 장소를 위도/경도/점수/카테고리 버킷 NumPy 배열로 보관
+- 고정 크기 격자(셀 → 배열 슬롯)로 후보를 좁힌 뒤 배열 연산으로 범위/거리 계산
+- 범위(bbox), 반경(radius), 최근접 k개(nearest) 조회 → place_id와 점수/거리 반환
+- MongoDB는 최종 페이지의 문서 조회(hydrate)에만 사용
+- 앱 시작 시 places에서 로드, 이후 upsert 시점마다 증분 반영
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.geo import EARTH_RADIUS_M, MAX_MERCATOR_LAT, grid_cell, to_float
+from app.core.mongodb import get_database
+from app.services.place_cluster_index import CATEGORY_BUCKETS, category_buckets
+from app.services.ranking import RANKING_PROFILES, score_places
+
+logger = logging.getLogger(__name__)
+
+# 격자 크기 (도 단위, 약 5.5km x 4.4km @ 한국 위도)
+SPATIAL_CELL_DEG = 0.05
+# 범위가 이 셀 수보다 넓으면 격자 대신 전체 배열을 한 번에 검사
+MAX_GRID_CELLS = 400
+# 최근접 검색 시 격자를 넓혀 가는 최대 단계 (넘으면 전체 검사)
+MAX_NEAREST_RINGS = 20
+_INITIAL_CAPACITY = 1024
+
+# 카테고리 버킷 → 비트
+BUCKET_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(CATEGORY_BUCKETS)}
+
+SPATIAL_PROJECTION = {
+    "_id": 0,
+    "place_id": 1,
+    "latitude": 1,
+    "longitude": 1,
+    "category": 1,
+    "description": 1,
+    "google_types": 1,
+    "image": 1,
+    "google_photos": 1,
+    "google_rating": 1,
+    "google_ratings_total": 1,
+}
+_SCORE_FIELDS = ("google_rating", "google_ratings_total", "image", "google_photos")
+_CATEGORY_FIELDS = ("category", "description", "google_types")
+
+
+def _bucket_mask(doc: Dict[str, Any]) -> int:
+    mask = 0
+    for name in category_buckets(doc):
+        mask |= BUCKET_BITS[name]
+    return mask
+
+
+def _distances_m(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """기준점에서 각 좌표까지 거리 (미터, haversine)"""
+    lat0, lng0 = math.radians(lat), math.radians(lng)
+    lat_r, lng_r = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat_r - lat0) / 2) ** 2 + math.cos(lat0) * np.cos(lat_r) * np.sin((lng_r - lng0) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class PlaceSpatialIndex:
+    """격자 + NumPy 배열 기반 공간 인덱스"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._ids: List[Optional[str]] = []
+        self._lat = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._lng = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._score = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._buckets = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
+        self._alive = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ---- 적재/갱신 ----
+
+    def load(self) -> int:
+        """places 컬렉션 중 좌표가 있는 장소 전체 적재 (시작 시 1회)"""
+        try:
+            db = get_database()
+            docs = list(db.places.find({"place_id": {"$ne": None}, "latitude": {"$ne": None}}, SPATIAL_PROJECTION))
+            scores = score_places(docs, RANKING_PROFILES["section"])
+            with self._lock:
+                for doc, score in zip(docs, scores):
+                    lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+                    if lat is None or lng is None:
+                        continue
+                    self._put_locked(str(doc["place_id"]), lat, lng, float(score), _bucket_mask(doc))
+            self.ready = True
+            logger.info(f"장소 공간 인덱스 로드 완료: {len(self._slots)}건")
+            return len(self._slots)
+        except Exception as e:
+            logger.warning(f"장소 공간 인덱스 로드 실패: {e}")
+            return 0
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        """장소 1건 추가/갱신 (일부 필드만 담긴 갱신이면 해당 값만 반영)"""
+        if not isinstance(doc, dict):
+            return
+        place_id = doc.get("place_id") or doc.get("id")
+        if not place_id:
+            return
+        place_id = str(place_id)
+        lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+        with self._lock:
+            slot = self._slots.get(place_id)
+            if slot is None and (lat is None or lng is None):
+                return
+            if slot is not None:
+                if lat is None or lng is None:
+                    lat, lng = float(self._lat[slot]), float(self._lng[slot])
+                score = float(self._score[slot])
+                mask = int(self._buckets[slot])
+            else:
+                score, mask = 0.0, 0
+            if slot is None or any(key in doc for key in _SCORE_FIELDS):
+                score = float(score_places([doc], RANKING_PROFILES["section"])[0])
+            if slot is None or any(key in doc for key in _CATEGORY_FIELDS):
+                mask = _bucket_mask(doc)
+            self._put_locked(place_id, lat, lng, score, mask)
+
+    def remove(self, place_id: str) -> None:
+        with self._lock:
+            self._remove_locked(str(place_id))
+
+    def _grow_locked(self) -> None:
+        capacity = len(self._lat) * 2
+        for name in ("_lat", "_lng", "_score", "_buckets", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _put_locked(self, place_id: str, lat: float, lng: float, score: float, mask: int) -> None:
+        slot = self._slots.get(place_id)
+        if slot is not None:
+            old_cell = grid_cell(self._lat[slot], self._lng[slot], SPATIAL_CELL_DEG)
+            new_cell = grid_cell(lat, lng, SPATIAL_CELL_DEG)
+            if old_cell != new_cell:
+                self._cells.get(old_cell, set()).discard(slot)
+                self._cells.setdefault(new_cell, set()).add(slot)
+        else:
+            if self._free:
+                slot = self._free.pop()
+                self._ids[slot] = place_id
+            else:
+                slot = len(self._ids)
+                if slot >= len(self._lat):
+                    self._grow_locked()
+                self._ids.append(place_id)
+            self._slots[place_id] = slot
+            self._cells.setdefault(grid_cell(lat, lng, SPATIAL_CELL_DEG), set()).add(slot)
+        self._lat[slot] = lat
+        self._lng[slot] = lng
+        self._score[slot] = score
+        self._buckets[slot] = mask
+        self._alive[slot] = True
+
+    def _remove_locked(self, place_id: str) -> None:
+        slot = self._slots.pop(place_id, None)
+        if slot is None:
+            return
+        cell = grid_cell(self._lat[slot], self._lng[slot], SPATIAL_CELL_DEG)
+        self._cells.get(cell, set()).discard(slot)
+        self._alive[slot] = False
+        self._ids[slot] = None
+        self._free.append(slot)
+
+    # ---- 조회 ----
+
+    def _candidates_locked(self, cells: Iterable[Tuple[int, int]]) -> np.ndarray:
+        slots: List[int] = []
+        for cell in cells:
+            members = self._cells.get(cell)
+            if members:
+                slots.extend(members)
+        return np.fromiter(slots, dtype=np.int64, count=len(slots))
+
+    def _bbox_slots_locked(self, sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float) -> np.ndarray:
+        min_row, min_col = grid_cell(sw_lat, sw_lng, SPATIAL_CELL_DEG)
+        max_row, max_col = grid_cell(ne_lat, ne_lng, SPATIAL_CELL_DEG)
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > MAX_GRID_CELLS:
+            slots = np.flatnonzero(self._alive[:len(self._ids)])
+        else:
+            slots = self._candidates_locked(
+                (row, col) for row in range(min_row, max_row + 1) for col in range(min_col, max_col + 1)
+            )
+        lat, lng = self._lat[slots], self._lng[slots]
+        inside = (lat >= sw_lat) & (lat <= ne_lat) & (lng >= sw_lng) & (lng <= ne_lng)
+        return slots[inside]
+
+    def _filter_bucket(self, slots: np.ndarray, bucket: Optional[str]) -> np.ndarray:
+        if not bucket:
+            return slots
+        bit = BUCKET_BITS.get(bucket)
+        if bit is None:
+            return slots[:0]
+        return slots[(self._buckets[slots] & bit) != 0]
+
+    def occupied_tiles(self, zoom: int) -> Set[Tuple[int, int]]:
+        """장소가 1개 이상 있는 웹 메르카토르 타일 (x, y)"""
+        with self._lock:
+            alive = np.flatnonzero(self._alive[:len(self._ids)])
+            lat = np.clip(self._lat[alive], -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT)
+            lng = self._lng[alive]
+        n = 2 ** zoom
+        xs = np.clip(((lng + 180.0) / 360.0 * n).astype(np.int64), 0, n - 1)
+        ys = np.clip(((1.0 - np.arcsinh(np.tan(np.radians(lat))) / np.pi) / 2.0 * n).astype(np.int64), 0, n - 1)
+        return set(zip(xs.tolist(), ys.tolist()))
+
+    def bbox(
+        self,
+        sw_lat: float,
+        sw_lng: float,
+        ne_lat: float,
+        ne_lng: float,
+        limit: Optional[int] = None,
+        bucket: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """범위 안의 장소 (점수 내림차순 place_id, 점수)"""
+        with self._lock:
+            slots = self._filter_bucket(self._bbox_slots_locked(sw_lat, sw_lng, ne_lat, ne_lng), bucket)
+            scores = self._score[slots]
+            if limit is not None and len(slots) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                slots, scores = slots[top], scores[top]
+            order = np.argsort(-scores, kind="stable")
+            return [(self._ids[slots[i]], float(scores[i])) for i in order]
+
+    def radius(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        limit: Optional[int] = None,
+        bucket: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """반경 안의 장소 (가까운 순 place_id, 거리(m))"""
+        d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+        d_lng = d_lat / max(math.cos(math.radians(lat)), 1e-6)
+        with self._lock:
+            slots = self._bbox_slots_locked(lat - d_lat, lng - d_lng, lat + d_lat, lng + d_lng)
+            slots = self._filter_bucket(slots, bucket)
+            distances = _distances_m(lat, lng, self._lat[slots], self._lng[slots])
+            within = distances <= radius_m
+            return self._by_distance_locked(slots[within], distances[within], limit)
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 10,
+        bucket: Optional[str] = None,
+        max_radius_m: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """최근접 k개 (가까운 순 place_id, 거리(m))"""
+        if k <= 0:
+            return []
+        center_row, center_col = grid_cell(lat, lng, SPATIAL_CELL_DEG)
+        # 셀 한 칸의 최소 폭 (경도 방향이 더 짧음)
+        cell_m = math.radians(SPATIAL_CELL_DEG) * EARTH_RADIUS_M * max(math.cos(math.radians(lat)), 1e-6)
+        with self._lock:
+            found = np.empty(0, dtype=np.int64)
+            ring = 0
+            while ring <= MAX_NEAREST_RINGS:
+                if ring == 0:
+                    cells = [(center_row, center_col)]
+                else:
+                    cells = [
+                        (center_row + d_row, center_col + d_col)
+                        for d_row in range(-ring, ring + 1)
+                        for d_col in range(-ring, ring + 1)
+                        if max(abs(d_row), abs(d_col)) == ring
+                    ]
+                found = np.concatenate([found, self._filter_bucket(self._candidates_locked(cells), bucket)])
+                # ring 칸 밖의 장소는 최소 ring * cell_m 이상 떨어져 있음
+                covered_m = ring * cell_m
+                if max_radius_m is not None and covered_m >= max_radius_m:
+                    break
+                if len(found) >= k:
+                    distances = _distances_m(lat, lng, self._lat[found], self._lng[found])
+                    if np.partition(distances, k - 1)[k - 1] <= covered_m:
+                        break
+                ring += 1
+            else:
+                found = self._filter_bucket(np.flatnonzero(self._alive[:len(self._ids)]), bucket)
+
+            distances = _distances_m(lat, lng, self._lat[found], self._lng[found])
+            if max_radius_m is not None:
+                within = distances <= max_radius_m
+                found, distances = found[within], distances[within]
+            return self._by_distance_locked(found, distances, k)
+
+    def _by_distance_locked(
+        self, slots: np.ndarray, distances: np.ndarray, limit: Optional[int]
+    ) -> List[Tuple[str, float]]:
+        if limit is not None and len(slots) > limit:
+            top = np.argpartition(distances, limit - 1)[:limit]
+            slots, distances = slots[top], distances[top]
+        order = np.argsort(distances, kind="stable")
+        return [(self._ids[slots[i]], float(distances[i])) for i in order]
+
+
+place_spatial_index = PlaceSpatialIndex()
@@ -0,0 +1,130 @@
+"""
+places 컬렉션 쓰기 공통 경로
+- 모든 장소 저장은 upsert_place / update_place를 거쳐 표시 필드(app.core.place_display)를 함께 저장
+- 저장 키(place_id)는 storage_place_id 한 곳에서 정함 → 메모리 인덱스/조회(hydrate)는 저장된 place_id를 그대로 사용
+- 저장 후 on_place_upserted로 메모리 인덱스 동기화 (저장 전 좌표도 함께 넘겨 이전 위치의 캐시도 무효화)
+- backfill_display_fields: 표시 필드가 없거나 이전 버전인 기존 문서 일괄 재계산 (앱 시작 시 실행)
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+
+from app.core.mongodb import get_database
+from app.core.place_display import (
+    DISPLAY_FIELDS_VERSION,
+    DISPLAY_SOURCE_FIELDS,
+    DISPLAY_VERSION_FIELD,
+    display_fields,
+    with_display_fields,
+)
+from app.core.place_ids import PROVIDER_FIELDS, place_ref_of, provider_of
+from app.services.place_events import on_place_upserted
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+# $setOnInsert와 겹치거나 저장하면 안 되는 필드
+_IMMUTABLE_FIELDS = ("_id", "created_at")
+
+
+def storage_place_id(place: Dict[str, Any], places_col) -> str:
+    """
+    places에 저장할 place_id.
+    - 기본은 provider가 발급한 ID 그대로 (기존 문서와 호환)
+    - 같은 place_id를 다른 provider 장소가 이미 쓰고 있으면(TourAPI/Kakao ID 충돌) place_ref로 저장
+      (양쪽 provider를 모두 판별할 수 있을 때만)
+    """
+    place_id = str(place.get("place_id") or place.get("id") or "")
+    provider = provider_of(place)
+    if not place_id or not provider:
+        return place_id
+    existing = places_col.find_one(
+        {"place_id": place_id},
+        {"_id": 0, **{name: 1 for name in PROVIDER_FIELDS}},
+    )
+    if not existing:
+        return place_id
+    existing_provider = provider_of(existing)
+    if existing_provider and existing_provider != provider:
+        return place_ref_of(place) or place_id
+    return place_id
+
+
+def upsert_place(place_data: Dict[str, Any], places_col=None, touch: bool = True) -> Dict[str, Any]:
+    """
+    저장 키(storage_place_id) 기준 upsert (표시 필드 포함) 후 메모리 인덱스 반영. 저장한 문서(dict) 반환.
+    - touch: updated_at 기록 여부
+    """
+    places_col = places_col if places_col is not None else get_database().places
+    now = datetime.utcnow()
+    doc = with_display_fields(place_data)
+    doc["place_id"] = storage_place_id(doc, places_col)
+    fields = {key: value for key, value in doc.items() if key not in _IMMUTABLE_FIELDS}
+    if touch:
+        fields["updated_at"] = now
+    # 저장 전 좌표 (새 문서면 None)
+    previous = places_col.find_one_and_update(
+        {"place_id": doc["place_id"]},
+        {"$set": fields, "$setOnInsert": {"created_at": now}},
+        projection={"_id": 0, "latitude": 1, "longitude": 1},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+    on_place_upserted(doc, previous)
+    return doc
+
+
+def update_place(
+    doc: Dict[str, Any],
+    updates: Dict[str, Any],
+    places_col=None,
+    unset: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """
+    기존 문서의 일부 필드 갱신. 바뀐 값으로 표시 필드를 다시 계산해 같은 쓰기에 포함.
+    갱신된 전체 문서(dict) 반환.
+    """
+    places_col = places_col if places_col is not None else get_database().places
+    merged = {**doc, **updates}
+    for key in unset:
+        merged.pop(key, None)
+    display = display_fields(merged)
+    operation: Dict[str, Any] = {"$set": {**updates, **display}}
+    if unset:
+        operation["$unset"] = {key: "" for key in unset}
+    places_col.update_one({"place_id": doc["place_id"]}, operation)
+    merged.update(display)
+    on_place_upserted(merged, doc)
+    return merged
+
+
+def backfill_display_fields(places_col=None, limit: Optional[int] = None) -> int:
+    """표시 필드가 없거나 이전 버전인 문서 재계산. 갱신한 문서 수 반환"""
+    places_col = places_col if places_col is not None else get_database().places
+    query = {DISPLAY_VERSION_FIELD: {"$ne": DISPLAY_FIELDS_VERSION}}
+    projection = {"_id": 1, **{name: 1 for name in DISPLAY_SOURCE_FIELDS}}
+    cursor = places_col.find(query, projection)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    updated = 0
+    operations = []
+    try:
+        for doc in cursor:
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": display_fields(doc)}))
+            if len(operations) >= BACKFILL_BATCH_SIZE:
+                places_col.bulk_write(operations, ordered=False)
+                updated += len(operations)
+                operations = []
+        if operations:
+            places_col.bulk_write(operations, ordered=False)
+            updated += len(operations)
+    except Exception as e:
+        logger.warning(f"장소 표시 필드 일괄 계산 실패 (완료 {updated}건): {e}")
+        return updated
+    if updated:
+        logger.info(f"장소 표시 필드 일괄 계산 완료: {updated}건")
+    return updated
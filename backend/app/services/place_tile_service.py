@@ -0,0 +1,196 @@
+"""
+장소 핀 벡터 타일(MVT)
+- places를 z/x/y 타일 단위 Mapbox Vector Tile(protobuf)로 인코딩
+- 속성은 place_id / category / rating / has_thumbnail 만 포함 (JSON 목록 대비 크기 대폭 감소)
+- 타일 바이트를 메모리(LRU) + place_tiles 컬렉션에 캐시, 자주 보는 줌(MVT_HOT_ZOOMS)은 시작 시 미리 생성
+- 장소 upsert 시 해당 장소가 속한 타일 캐시 무효화
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from bson import Binary
+
+from app.core.geo import latlng_to_tile, tile_bounds, to_float
+from app.core.mongodb import get_database
+from app.core.mvt import encode_point_layer, tile_pixel
+from app.services.place_cluster_index import category_buckets
+from app.services.place_spatial_index import place_spatial_index
+from app.services.viewport_tile_cache import tile_id
+
+logger = logging.getLogger(__name__)
+
+MVT_LAYER_NAME = "places"
+# 캐시하는 줌 범위 (더 확대된 타일은 요청마다 생성, 장소 수가 적어 비용이 작음)
+MVT_CACHE_MIN_ZOOM = 5
+MVT_CACHE_MAX_ZOOM = 16
+MVT_MAX_ZOOM = 22
+# 시작 시 미리 생성하는 줌
+MVT_HOT_ZOOMS = range(7, 13)
+# 타일 하나에 담는 최대 핀 수 (점수 상위)
+MVT_MAX_FEATURES = 1000
+# 캐시 유지 시간: 메모리(다른 워커의 무효화를 반영하기 위해 짧게) / MongoDB
+MVT_MEMORY_TTL_SECONDS = 60
+MVT_MEMORY_MAX_ENTRIES = 5000
+MVT_DB_TTL_HOURS = 24
+# 브라우저/프록시 캐시 시간
+MVT_CACHE_CONTROL = "public, max-age=300"
+
+TILE_PROJECTION = {
+    "_id": 0,
+    "place_id": 1,
+    "latitude": 1,
+    "longitude": 1,
+    "category": 1,
+    "description": 1,
+    "google_types": 1,
+    "google_rating": 1,
+    "image": 1,
+    "google_photos": 1,
+}
+
+
+def _feature_properties(doc: Dict[str, Any]) -> Dict[str, Any]:
+    category = doc.get("category")
+    if not category:
+        buckets = sorted(category_buckets(doc))
+        category = buckets[0] if buckets else None
+    rating = to_float(doc.get("google_rating"))
+    return {
+        "place_id": str(doc.get("place_id")),
+        "category": category,
+        "rating": rating,
+        "has_thumbnail": bool(doc.get("image") or doc.get("google_photos")),
+    }
+
+
+class PlaceTileService:
+    """장소 벡터 타일 생성 + 캐시"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # tile_id -> (만료 시각(monotonic), 타일 바이트)
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def _cacheable(self, z: int) -> bool:
+        return MVT_CACHE_MIN_ZOOM <= z <= MVT_CACHE_MAX_ZOOM
+
+    def _tile_docs(self, z: int, x: int, y: int) -> List[Dict[str, Any]]:
+        sw_lat, sw_lng, ne_lat, ne_lng = tile_bounds(z, x, y)
+        db = get_database()
+        if place_spatial_index.ready:
+            hits = place_spatial_index.bbox(sw_lat, sw_lng, ne_lat, ne_lng, limit=MVT_MAX_FEATURES)
+            if not hits:
+                return []
+            return list(db.places.find({"place_id": {"$in": [pid for pid, _ in hits]}}, TILE_PROJECTION))
+        return list(
+            db.places.find(
+                {
+                    "latitude": {"$gte": sw_lat, "$lte": ne_lat},
+                    "longitude": {"$gte": sw_lng, "$lte": ne_lng},
+                },
+                TILE_PROJECTION,
+            )
+            .sort("google_ratings_total", -1)
+            .limit(MVT_MAX_FEATURES)
+        )
+
+    def build_tile(self, z: int, x: int, y: int) -> bytes:
+        """타일 인코딩 (캐시 미사용)"""
+        features = []
+        for doc in self._tile_docs(z, x, y):
+            lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+            if lat is None or lng is None or not doc.get("place_id"):
+                continue
+            px, py = tile_pixel(lat, lng, z, x, y)
+            features.append((px, py, _feature_properties(doc)))
+        if not features:
+            return b""
+        return encode_point_layer(MVT_LAYER_NAME, features)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._memory[key] = (time.monotonic() + MVT_MEMORY_TTL_SECONDS, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > MVT_MEMORY_MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _store(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        try:
+            get_database().place_tiles.update_one(
+                {"tile": key},
+                {"$set": {
+                    "data": Binary(data),
+                    "expires_at": datetime.utcnow() + timedelta(hours=MVT_DB_TTL_HOURS),
+                }},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"벡터 타일 캐시 저장 실패 ({key}): {e}")
+
+    def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """타일 바이트 (메모리 → place_tiles → 생성 순)"""
+        if not self._cacheable(z):
+            return self.build_tile(z, x, y)
+        key = tile_id((z, x, y))
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] >= time.monotonic():
+                self._memory.move_to_end(key)
+                return entry[1]
+        try:
+            doc = get_database().place_tiles.find_one(
+                {"tile": key, "expires_at": {"$gt": datetime.utcnow()}}, {"_id": 0, "data": 1}
+            )
+        except Exception as e:
+            logger.warning(f"벡터 타일 캐시 조회 실패 ({key}): {e}")
+            doc = None
+        if doc is not None:
+            data = bytes(doc.get("data") or b"")
+            self._remember(key, data)
+            return data
+        data = self.build_tile(z, x, y)
+        self._store(key, data)
+        return data
+
+    def invalidate_place(self, doc: Dict[str, Any]) -> None:
+        """장소가 속한 캐시 타일 삭제 (메모리 + place_tiles)"""
+        lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+        if lat is None or lng is None:
+            return
+        keys = [
+            tile_id((z, *latlng_to_tile(lat, lng, z)))
+            for z in range(MVT_CACHE_MIN_ZOOM, MVT_CACHE_MAX_ZOOM + 1)
+        ]
+        with self._lock:
+            for key in keys:
+                self._memory.pop(key, None)
+        try:
+            get_database().place_tiles.delete_many({"tile": {"$in": keys}})
+        except Exception as e:
+            logger.warning(f"벡터 타일 캐시 무효화 실패: {e}")
+
+    def warm(self) -> int:
+        """자주 보는 줌의 장소가 있는 타일을 미리 생성 (공간 인덱스 로드 후 백그라운드에서 실행)"""
+        if not place_spatial_index.ready:
+            return 0
+        count = 0
+        try:
+            for z in MVT_HOT_ZOOMS:
+                for x, y in sorted(place_spatial_index.occupied_tiles(z)):
+                    self.get_tile(z, x, y)
+                    count += 1
+            logger.info(f"벡터 타일 미리 생성 완료: {count}개")
+        except Exception as e:
+            logger.warning(f"벡터 타일 미리 생성 실패: {e}")
+        return count
+
+
+place_tile_service = PlaceTileService()
@@ -0,0 +1,138 @@
+"""
+장소 후보 랭킹
+- 후보 목록을 NumPy 배열로 변환해 한 번에 점수 계산 (수백 건 기준 1ms 미만)
+- 점수 요소: 베이지안 보정 평점, 리뷰 수(log), 검색어 일치도, 기준점과의 거리, 이미지 유무
+- 엔드포인트별 가중치는 RANKING_PROFILES에서 설정
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.geo import EARTH_RADIUS_M, to_float
+from app.services.place_search_index import normalize_text, tokenize
+
+# 베이지안 평점 보정: 리뷰가 적은 장소는 평균 평점(prior)에 가깝게 끌어당김
+RATING_PRIOR_MEAN = 3.5
+RATING_PRIOR_WEIGHT = 20.0
+# 리뷰 수 점수 정규화 기준 (이 이상이면 1.0)
+REVIEWS_SATURATION = 5000
+# 거리 점수 감쇠 거리 (미터): exp(-d / scale)
+DISTANCE_SCALE_M = 3000.0
+
+
+@dataclass(frozen=True)
+class RankingWeights:
+    rating: float = 1.0
+    reviews: float = 0.5
+    text: float = 0.0
+    distance: float = 0.0
+    image: float = 0.2
+
+
+# 엔드포인트별 가중치
+RANKING_PROFILES: Dict[str, RankingWeights] = {
+    # 메인 섹션: 품질 + 이미지 위주
+    "section": RankingWeights(rating=1.0, reviews=0.6, text=0.0, distance=0.0, image=0.4),
+    # 키워드 검색: 검색어 일치도 우선, 품질은 보조
+    "search": RankingWeights(rating=0.4, reviews=0.3, text=1.5, distance=0.0, image=0.1),
+    # 지도/주변: 거리 우선
+    "nearby": RankingWeights(rating=0.5, reviews=0.3, text=0.0, distance=1.5, image=0.1),
+}
+
+
+def _has_image(place: Dict[str, Any]) -> bool:
+    if place.get("imageUrl") or place.get("image"):
+        return True
+    photos = place.get("google_photos")
+    return isinstance(photos, list) and bool(photos)
+
+
+def _text_scores(places: Sequence[Dict[str, Any]], query: Optional[str]) -> np.ndarray:
+    """검색어 일치도 (제목에 그대로 포함 1.0, 아니면 bigram 겹침 비율)"""
+    scores = np.zeros(len(places), dtype=np.float64)
+    compact = normalize_text(query)
+    if not compact:
+        return scores
+    query_tokens = set(tokenize(compact))
+    for i, place in enumerate(places):
+        title = normalize_text(place.get("title") or place.get("place_name"))
+        if not title:
+            continue
+        if compact in title:
+            scores[i] = 1.0 if title.startswith(compact) else 0.9
+        elif query_tokens:
+            # 제목 bigram 목록을 만들지 않고 부분 문자열 검사로 겹침 계산
+            scores[i] = sum(1 for token in query_tokens if token in title) / len(query_tokens) * 0.8
+    return scores
+
+
+def score_places(
+    places: Sequence[Dict[str, Any]],
+    weights: RankingWeights,
+    query: Optional[str] = None,
+    reference: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """후보 목록 점수 배열 (places와 같은 순서)"""
+    n = len(places)
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    # 후보를 한 번만 순회해 숫자 컬럼 추출, 이후 계산은 모두 배열 연산
+    rows = []
+    for p in places:
+        rating = p.get("googleRating")
+        total = p.get("googleRatingsTotal")
+        rows.append((
+            to_float(rating if rating is not None else p.get("google_rating")) or 0.0,
+            to_float(total if total is not None else p.get("google_ratings_total")) or 0.0,
+            1.0 if weights.image and _has_image(p) else 0.0,
+        ))
+    columns = np.array(rows, dtype=np.float64)
+    ratings, reviews, images = columns[:, 0], columns[:, 1], columns[:, 2]
+    np.clip(ratings, 0.0, 5.0, out=ratings)
+    np.clip(reviews, 0.0, None, out=reviews)
+
+    # 평점이 없는 장소는 리뷰 수 0으로 취급 → prior 평균으로 수렴
+    reviews_for_rating = np.where(ratings > 0, reviews, 0.0)
+    bayes = (RATING_PRIOR_MEAN * RATING_PRIOR_WEIGHT + ratings * reviews_for_rating) / (
+        RATING_PRIOR_WEIGHT + reviews_for_rating
+    )
+    score = weights.rating * (bayes / 5.0)
+    score += weights.reviews * np.minimum(np.log1p(reviews) / np.log1p(REVIEWS_SATURATION), 1.0)
+
+    if weights.image:
+        score += weights.image * images
+
+    if weights.text and query:
+        score += weights.text * _text_scores(places, query)
+
+    if weights.distance and reference is not None:
+        lat = np.array([to_float(p.get("latitude")) for p in places], dtype=np.float64)
+        lng = np.array([to_float(p.get("longitude")) for p in places], dtype=np.float64)
+        ref_lat, ref_lng = np.radians(reference[0]), np.radians(reference[1])
+        lat_r, lng_r = np.radians(lat), np.radians(lng)
+        a = np.sin((lat_r - ref_lat) / 2) ** 2 + np.cos(ref_lat) * np.cos(lat_r) * np.sin((lng_r - ref_lng) / 2) ** 2
+        dist = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        # 좌표가 없는 장소(NaN)는 거리 점수 0
+        score += weights.distance * np.nan_to_num(np.exp(-dist / DISTANCE_SCALE_M), nan=0.0)
+
+    return score
+
+
+def rank_places(
+    places: List[Dict[str, Any]],
+    profile: str = "search",
+    query: Optional[str] = None,
+    reference: Optional[Tuple[float, float]] = None,
+    weights: Optional[RankingWeights] = None,
+) -> List[Dict[str, Any]]:
+    """점수 내림차순 정렬 (동점은 기존 순서 유지)"""
+    if len(places) < 2:
+        return list(places)
+    scores = score_places(places, weights or RANKING_PROFILES[profile], query, reference)
+    order = np.argsort(-scores, kind="stable")
+    return [places[i] for i in order]
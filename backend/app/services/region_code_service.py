@@ -0,0 +1,183 @@
+"""
+지역(시도/구군) 코드 테이블
+- 지역명(서울, 강원, 전라북도 ...)을 TourAPI areaCode/sigunguCode 및 Kakao rect 파라미터로 변환
+- 시도 코드/범위는 고정 테이블, 구군 코드는 TourAPI areaCode2 결과를 region_codes 컬렉션에 저장해 재사용
+- 앱 시작 시 1회 로드, 없는 시도는 처음 사용할 때 TourAPI에서 받아 저장
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.mongodb import get_database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Province:
+    name: str  # 대표 이름 (Place.region 값과 동일한 짧은 이름)
+    area_code: str  # TourAPI areaCode
+    aliases: Tuple[str, ...]  # 주소/입력에서 쓰이는 표기
+    bbox: Tuple[float, float, float, float]  # (min_lng, min_lat, max_lng, max_lat), 대략적인 행정구역 범위
+
+
+PROVINCES: List[Province] = [
+    Province("서울", "1", ("서울특별시", "서울시", "서울"), (126.76, 37.41, 127.19, 37.72)),
+    Province("인천", "2", ("인천광역시", "인천시", "인천"), (124.60, 37.00, 126.80, 37.99)),
+    Province("대전", "3", ("대전광역시", "대전시", "대전"), (127.24, 36.18, 127.56, 36.50)),
+    Province("대구", "4", ("대구광역시", "대구시", "대구"), (128.35, 35.60, 128.80, 36.33)),
+    Province("광주", "5", ("광주광역시", "광주시", "광주"), (126.64, 35.05, 127.02, 35.26)),
+    Province("부산", "6", ("부산광역시", "부산시", "부산"), (128.76, 34.88, 129.31, 35.39)),
+    Province("울산", "7", ("울산광역시", "울산시", "울산"), (129.00, 35.32, 129.46, 35.72)),
+    Province("세종", "8", ("세종특별자치시", "세종시", "세종"), (127.18, 36.40, 127.40, 36.74)),
+    Province("경기", "31", ("경기도", "경기"), (126.37, 36.89, 127.85, 38.30)),
+    Province("강원", "32", ("강원특별자치도", "강원도", "강원"), (127.08, 37.02, 129.36, 38.62)),
+    Province("충북", "33", ("충청북도", "충북"), (127.27, 36.00, 128.65, 37.26)),
+    Province("충남", "34", ("충청남도", "충남"), (125.96, 35.97, 127.64, 37.07)),
+    Province("경북", "35", ("경상북도", "경북"), (127.80, 35.57, 131.00, 37.56)),
+    Province("경남", "36", ("경상남도", "경남"), (127.56, 34.46, 129.23, 35.91)),
+    Province("전북", "37", ("전북특별자치도", "전라북도", "전북"), (126.35, 35.28, 127.90, 36.16)),
+    Province("전남", "38", ("전라남도", "전남"), (125.06, 33.88, 127.90, 35.51)),
+    Province("제주", "39", ("제주특별자치도", "제주도", "제주"), (126.08, 33.11, 126.98, 33.57)),
+]
+
+
+@dataclass
+class RegionFilter:
+    """검색 요청의 지역 조건을 provider 파라미터로 변환한 결과"""
+    province: Optional[Province] = None
+    sigungu_code: Optional[str] = None
+    district: Optional[str] = None
+
+    @property
+    def area_code(self) -> Optional[str]:
+        return self.province.area_code if self.province else None
+
+    @property
+    def kakao_rect(self) -> Optional[str]:
+        """Kakao 로컬 검색 rect 파라미터 (min_x,min_y,max_x,max_y)"""
+        if not self.province:
+            return None
+        return ",".join(str(v) for v in self.province.bbox)
+
+
+def _compact(text: Optional[str]) -> str:
+    return "".join((text or "").split())
+
+
+class RegionCodeService:
+    """지역명 → provider 코드 변환 테이블 (프로세스 메모리)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_alias: Dict[str, Province] = {}
+        for province in PROVINCES:
+            for alias in (province.name, *province.aliases):
+                self._by_alias[_compact(alias)] = province
+            self._by_alias[province.area_code] = province
+        # area_code -> {구군명: sigunguCode}
+        self._sigungu: Dict[str, Dict[str, str]] = {}
+
+    def load(self) -> int:
+        """region_codes 컬렉션에 저장된 구군 코드 로드 (시작 시 1회)"""
+        try:
+            db = get_database()
+            count = 0
+            for doc in db.region_codes.find({}, {"_id": 0, "area_code": 1, "sigungu": 1}):
+                codes = {item["name"]: item["code"] for item in doc.get("sigungu") or [] if item.get("name")}
+                with self._lock:
+                    self._sigungu[doc["area_code"]] = codes
+                count += len(codes)
+            logger.info(f"구군 코드 테이블 로드 완료: {count}건")
+            return count
+        except Exception as e:
+            logger.warning(f"구군 코드 테이블 로드 실패: {e}")
+            return 0
+
+    def _fetch_sigungu(self, area_code: str) -> Dict[str, str]:
+        """TourAPI areaCode2로 구군 코드를 받아 region_codes 컬렉션에 저장"""
+        from app.api.tour_api import TourAPI
+
+        result = TourAPI().get_area_code(area_code)
+        items = (result.get("response", {}).get("body", {}).get("items") or {})
+        if not isinstance(items, dict):
+            items = {}
+        raw = items.get("item") or []
+        if isinstance(raw, dict):
+            raw = [raw]
+        sigungu = [
+            {"code": str(item.get("code")), "name": item.get("name")}
+            for item in raw
+            if isinstance(item, dict) and item.get("code") and item.get("name")
+        ]
+        if sigungu:
+            get_database().region_codes.update_one(
+                {"area_code": area_code},
+                {"$set": {"sigungu": sigungu, "updated_at": datetime.utcnow()}},
+                upsert=True,
+            )
+        return {item["name"]: item["code"] for item in sigungu}
+
+    def _sigungu_codes(self, area_code: str) -> Dict[str, str]:
+        with self._lock:
+            codes = self._sigungu.get(area_code)
+        if codes is not None:
+            return codes
+        try:
+            codes = self._fetch_sigungu(area_code)
+        except Exception as e:
+            logger.warning(f"구군 코드 조회 실패 (areaCode={area_code}): {e}")
+            return {}
+        with self._lock:
+            self._sigungu[area_code] = codes
+        return codes
+
+    def find_province(self, region: Optional[str]) -> Optional[Province]:
+        """지역명/별칭/areaCode → 시도"""
+        key = _compact(region)
+        if not key:
+            return None
+        province = self._by_alias.get(key)
+        if province:
+            return province
+        # "강원특별자치도 강릉시"처럼 뒤에 더 붙은 입력
+        for alias, candidate in self._by_alias.items():
+            if not alias.isdigit() and key.startswith(alias):
+                return candidate
+        return None
+
+    def resolve(self, region: Optional[str], district: Optional[str]) -> RegionFilter:
+        """검색 조건(시도/구군 이름) → provider 파라미터"""
+        province = self.find_province(region)
+        sigungu_code = None
+        if province and district:
+            district_key = _compact(district)
+            codes = self._sigungu_codes(province.area_code)
+            sigungu_code = codes.get(district_key)
+            if not sigungu_code:
+                # "수원" -> "수원시" 처럼 접미사가 빠진 입력
+                for name, code in codes.items():
+                    if name.startswith(district_key) or district_key.startswith(name):
+                        sigungu_code = code
+                        break
+        return RegionFilter(province=province, sigungu_code=sigungu_code, district=district)
+
+    def address_in_region(self, address: Optional[str], region: Optional[str]) -> Optional[bool]:
+        """주소가 해당 시도에 속하는지 (주소에 시도 표기가 없으면 None)"""
+        province = self.find_province(region)
+        compact = _compact(address)
+        if not province or not compact:
+            return None
+        if any(compact.startswith(_compact(alias)) for alias in province.aliases):
+            return True
+        if self.find_province(compact) is not None:
+            return False
+        return None
+
+
+region_code_service = RegionCodeService()
@@ -0,0 +1,349 @@
+"""
+검색어 자동완성(typeahead)
+- 정렬된 배열 + 이진 탐색(bisect) 기반 접두어 검색
+- places 제목 + 인기 검색어(search_queries 컬렉션)로 구성
+- 한글 초성 입력 지원: "ㄱㄹㅈㅇㅅㅈ" -> 강릉중앙시장, "강ㄹ" -> 강릉...
+- 장소 upsert / 검색 발생 시 증분 반영 (전체 재구성 없음)
+- 순위는 접두어 범위 전체의 가중치 기준 (짧은 접두어는 상위 결과를 캐시)
+- 검색어 빈도는 메모리에 바로 반영하고, DB(search_queries)에는 백그라운드 스레드가 모아서 저장
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from app.core.mongodb import get_database
+from app.services.place_search_index import normalize_text
+
+logger = logging.getLogger(__name__)
+
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNG_JONG = 21 * 28
+
+# 이 길이 이하 접두어는 후보가 많으므로 가중치 상위 결과를 캐시 (해당 접두어의 키가 바뀌면 무효화)
+TOP_CACHE_PREFIX_LENGTH = 2
+TOP_CACHE_SIZE = 50
+# 시작 시 불러올 인기 검색어 개수
+POPULAR_QUERY_LOAD_LIMIT = 5000
+# 검색어 빈도 DB 저장 주기 (초)
+QUERY_FLUSH_INTERVAL_SECONDS = 5
+# 저장 대기 검색어가 이 수를 넘으면 주기를 기다리지 않고 저장
+QUERY_FLUSH_MAX_PENDING = 500
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSUNG[(code - _HANGUL_BASE) // _JUNG_JONG])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _is_jamo(ch: str) -> bool:
+    return "ㄱ" <= ch <= "ㅎ"
+
+
+def _matches_jamo_prefix(query: str, key: str) -> bool:
+    """초성이 섞인 입력의 접두어 일치 여부 (초성 자리는 초성만, 나머지는 글자 그대로 비교)"""
+    if len(key) < len(query):
+        return False
+    for q, k in zip(query, key):
+        if _is_jamo(q):
+            if to_chosung(k) != q:
+                return False
+        elif q != k:
+            return False
+    return True
+
+
+@dataclass
+class _Suggestion:
+    text: str
+    kind: str  # place / query
+    place_id: Optional[str]
+    weight: float
+
+
+class _SortedKeys:
+    """(key, entry_key) 정렬 배열. 접두어 범위는 bisect로 탐색"""
+
+    def __init__(self) -> None:
+        self.keys: List[Tuple[str, str]] = []
+
+    def add(self, key: str, entry_key: str, bulk: bool = False) -> None:
+        item = (key, entry_key)
+        if bulk:
+            # 대량 로드 중에는 append 후 finish_bulk에서 한 번에 정렬
+            self.keys.append(item)
+            return
+        pos = bisect.bisect_left(self.keys, item)
+        if pos < len(self.keys) and self.keys[pos] == item:
+            return
+        self.keys.insert(pos, item)
+
+    def finish_bulk(self) -> None:
+        self.keys = sorted(set(self.keys))
+
+    def remove(self, key: str, entry_key: str) -> None:
+        item = (key, entry_key)
+        pos = bisect.bisect_left(self.keys, item)
+        if pos < len(self.keys) and self.keys[pos] == item:
+            del self.keys[pos]
+
+    def prefix(self, prefix: str) -> List[Tuple[str, str]]:
+        start = bisect.bisect_left(self.keys, (prefix, ""))
+        end = bisect.bisect_left(self.keys, (prefix + "\U0010ffff", ""))
+        return self.keys[start:end]
+
+
+class SuggestIndex:
+    """자동완성 인덱스 (프로세스 메모리)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: Dict[str, _Suggestion] = {}
+        self._entry_keys: Dict[str, List[str]] = {}
+        self._text_keys = _SortedKeys()
+        self._chosung_keys = _SortedKeys()
+        # (text|chosung, 접두어) → 가중치 상위 entry_key
+        self._top_cache: Dict[Tuple[str, str], List[str]] = {}
+        # query_key → 검색 횟수 (메모리 가중치 계산용)
+        self._query_counts: Dict[str, float] = {}
+        self._bulk = False
+        self.ready = False
+        # DB 저장 대기 검색어: query_key → (검색어, 증가분)
+        self._flush_cond = threading.Condition()
+        self._pending_queries: Dict[str, Tuple[str, int]] = {}
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> int:
+        """places 제목 + 인기 검색어로 인덱스 구성 (시작 시 1회)"""
+        try:
+            db = get_database()
+            count = 0
+            with self._lock:
+                self._bulk = True
+            projection = {"_id": 0, "place_id": 1, "title": 1, "place_name": 1, "google_ratings_total": 1}
+            for doc in db.places.find({"place_id": {"$ne": None}}, projection):
+                self.add_place(doc)
+                count += 1
+            for doc in db.search_queries.find({}, {"_id": 0, "query": 1, "count": 1}).sort(
+                "count", -1
+            ).limit(POPULAR_QUERY_LOAD_LIMIT):
+                self._put_query(doc.get("query"), doc.get("count") or 1)
+                count += 1
+            self.ready = True
+            logger.info(f"자동완성 인덱스 로드 완료: {count}건")
+            return count
+        except Exception as e:
+            logger.warning(f"자동완성 인덱스 로드 실패: {e}")
+            return 0
+        finally:
+            with self._lock:
+                self._bulk = False
+                self._text_keys.finish_bulk()
+                self._chosung_keys.finish_bulk()
+                self._top_cache.clear()
+
+    def _suffix_keys(self, text: str) -> List[str]:
+        """전체 제목 + 띄어쓰기 이후 단어 시작 위치 키 ("강릉 중앙시장" -> 강릉중앙시장, 중앙시장)"""
+        words = text.split()
+        keys = []
+        for i in range(len(words)):
+            key = normalize_text("".join(words[i:]))
+            if key and key not in keys:
+                keys.append(key)
+        return keys
+
+    def _put(self, entry_key: str, suggestion: _Suggestion) -> None:
+        with self._lock:
+            self._drop(entry_key)
+            keys = self._suffix_keys(suggestion.text)
+            if not keys:
+                return
+            self._entries[entry_key] = suggestion
+            self._entry_keys[entry_key] = keys
+            for key in keys:
+                self._text_keys.add(key, entry_key, bulk=self._bulk)
+                self._chosung_keys.add(to_chosung(key), entry_key, bulk=self._bulk)
+                self._invalidate_top(key)
+
+    def _drop(self, entry_key: str) -> None:
+        keys = self._entry_keys.pop(entry_key, None)
+        self._entries.pop(entry_key, None)
+        for key in keys or []:
+            self._text_keys.remove(key, entry_key)
+            self._chosung_keys.remove(to_chosung(key), entry_key)
+            self._invalidate_top(key)
+
+    def _invalidate_top(self, key: str) -> None:
+        if self._bulk or not self._top_cache:
+            return
+        chosung = to_chosung(key)
+        for n in range(1, TOP_CACHE_PREFIX_LENGTH + 1):
+            self._top_cache.pop(("text", key[:n]), None)
+            self._top_cache.pop(("chosung", chosung[:n]), None)
+
+    def add_place(self, doc: Dict[str, Any]) -> None:
+        """장소 제목 추가/갱신"""
+        if not isinstance(doc, dict):
+            return
+        place_id = doc.get("place_id") or doc.get("id")
+        title = (doc.get("title") or doc.get("place_name") or "").strip()
+        if not place_id or not title:
+            return
+        try:
+            popularity = float(doc.get("google_ratings_total") or 0)
+        except (TypeError, ValueError):
+            popularity = 0.0
+        self._put(
+            f"place:{place_id}",
+            _Suggestion(text=title, kind="place", place_id=str(place_id), weight=1.0 + math.log1p(popularity)),
+        )
+
+    def _put_query(self, query: Optional[str], count: float) -> None:
+        text = (query or "").strip()
+        if not text:
+            return
+        self._query_counts[normalize_text(text)] = count
+        self._put(
+            f"query:{normalize_text(text)}",
+            _Suggestion(text=text, kind="query", place_id=None, weight=1.0 + math.log1p(count)),
+        )
+
+    def record_query(self, query: Optional[str]) -> None:
+        """
+        검색 발생 시 검색어 빈도 반영.
+        메모리 인덱스는 바로 갱신하고, search_queries 컬렉션 저장은 백그라운드 스레드에 맡김 (요청 경로에서 DB 쓰기 없음)
+        """
+        text = (query or "").strip()
+        query_key = normalize_text(text)
+        if len(query_key) < 2:
+            return
+        with self._lock:
+            self._put_query(text, self._query_counts.get(query_key, 0) + 1)
+        with self._flush_cond:
+            _, pending = self._pending_queries.get(query_key, (text, 0))
+            self._pending_queries[query_key] = (text, pending + 1)
+            self._ensure_flusher_locked()
+            # 처음 쌓일 때(주기 대기 시작) / 최대치에 도달했을 때(바로 저장)만 깨움
+            if len(self._pending_queries) in (1, QUERY_FLUSH_MAX_PENDING):
+                self._flush_cond.notify()
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._flush_thread = threading.Thread(target=self._run_flusher, name="suggest-query-flush", daemon=True)
+        self._flush_thread.start()
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._flush_cond:
+                while not self._pending_queries:
+                    self._flush_cond.wait()
+                if len(self._pending_queries) < QUERY_FLUSH_MAX_PENDING:
+                    self._flush_cond.wait(timeout=QUERY_FLUSH_INTERVAL_SECONDS)
+            self.flush_queries()
+
+    def flush_queries(self) -> int:
+        """저장 대기 검색어 빈도를 search_queries에 한 번에 반영. 저장한 검색어 수 반환"""
+        with self._flush_cond:
+            pending, self._pending_queries = self._pending_queries, {}
+        if not pending:
+            return 0
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"query_key": query_key},
+                {"$inc": {"count": inc}, "$set": {"query": text, "updated_at": now}},
+                upsert=True,
+            )
+            for query_key, (text, inc) in pending.items()
+        ]
+        try:
+            get_database().search_queries.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"검색어 기록 실패 ({len(operations)}건): {e}")
+            return 0
+        return len(operations)
+
+    def _top_entries(
+        self, space: str, prefix: str, count: int, entry_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[str]:
+        """접두어 범위 전체에서 가중치 상위 entry_key (짧은 접두어는 캐시 사용)"""
+        cacheable = entry_filter is None and len(prefix) <= TOP_CACHE_PREFIX_LENGTH and count <= TOP_CACHE_SIZE
+        if cacheable and (space, prefix) in self._top_cache:
+            return self._top_cache[(space, prefix)][:count]
+
+        keys = self._text_keys if space == "text" else self._chosung_keys
+        # 한 장소가 같은 범위에 여러 키로 들어 있을 수 있으므로 entry_key 단위로 중복 제거
+        matched = {entry_key for _, entry_key in keys.prefix(prefix)}
+        if entry_filter is not None:
+            matched = {entry_key for entry_key in matched if entry_filter(entry_key)}
+        top = heapq.nlargest(
+            TOP_CACHE_SIZE if cacheable else count,
+            (k for k in matched if k in self._entries),
+            key=lambda k: self._entries[k].weight,
+        )
+        if cacheable:
+            self._top_cache[(space, prefix)] = top
+        return top[:count]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """접두어(또는 초성) 자동완성 → 가중치 내림차순"""
+        compact = normalize_text(query)
+        # 로드 중에는 정렬 배열이 아직 정렬되지 않았으므로 빈 결과 (로드 완료 후 사용)
+        if not compact or not self.ready:
+            return []
+
+        # 장소명과 검색어가 같은 텍스트일 수 있으므로 여유 있게 뽑은 뒤 중복 제거
+        count = limit * 2
+        with self._lock:
+            if all(_is_jamo(ch) for ch in compact):
+                entry_keys = self._top_entries("chosung", compact, count)
+            elif any(_is_jamo(ch) for ch in compact):
+                # 초성 키로 범위 탐색 후, 완성된 음절이 실제 글자와 일치하는지 확인
+                entry_keys = self._top_entries(
+                    "chosung",
+                    to_chosung(compact),
+                    count,
+                    lambda entry_key: any(
+                        _matches_jamo_prefix(compact, key) for key in self._entry_keys.get(entry_key, [])
+                    ),
+                )
+            else:
+                entry_keys = self._top_entries("text", compact, count)
+            top = [self._entries[k] for k in entry_keys]
+
+        results = []
+        seen_texts = set()
+        for s in top:
+            if s.text in seen_texts:
+                continue
+            seen_texts.add(s.text)
+            results.append({"text": s.text, "type": s.kind, "place_id": s.place_id})
+        return results[:limit]
+
+
+suggest_index = SuggestIndex()
@@ -67,7 +67,8 @@ class ThemeService:
                 name_ko=theme.get("name_ko", ""),
                 name_en=theme.get("name_en", ""),
                 places=theme_places,
-                created_at=theme.get("created_at")
+                created_at=theme.get("created_at"),
+                updated_at=theme.get("updated_at"),
             ))
         
         return ThemesResponse(themes=result)
@@ -93,7 +94,8 @@ class ThemeService:
             name_ko=theme.get("name_ko", ""),
             name_en=theme.get("name_en", ""),
             places=theme_places,
-            created_at=theme.get("created_at")
+            created_at=theme.get("created_at"),
+            updated_at=theme.get("updated_at"),
         )
     
     async def update_theme(
@@ -116,6 +118,8 @@ class ThemeService:
         
         if not update_fields:
             raise ValueError("수정할 내용이 없습니다.")
+        # 조건부 GET(Last-Modified) 기준 시각
+        update_fields["updated_at"] = datetime.utcnow()
         
         try:
             result = self.db.themes.update_one(
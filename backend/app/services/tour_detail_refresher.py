@@ -0,0 +1,203 @@
+"""
+TourAPI 상세 정보 백그라운드 보강
+- 목록 API(지역/위치 기반)로만 저장된 TourAPI 장소는 개요/이용시간 등이 비어 있음
+- 상세 조회 요청은 저장된 문서를 바로 반환하고, 상세 정보가 없는 장소는 큐에 넣어 백그라운드에서 보강
+  (detailCommon2 / detailIntro2 조회 후 비어 있는 필드만 채움, place_store.update_place로 저장)
+- 보강하면 detail_fetched_at 기록 (이후 다시 조회하지 않음)
+- 실패(오류/빈 응답)하면 detail_attempted_at 기록 후 TOUR_DETAIL_RETRY_AFTER 동안 다시 큐에 넣지 않음
+- 우선순위: 큐에 있는 동안 조회된 횟수가 많은 장소 먼저
+- 속도 제한: 초당 TOUR_DETAIL_REFRESH_QPS, 실패 시 지수 백오프
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.mongodb import get_database
+from app.core.place_ids import TOUR_CONTENT_TYPE_IDS, parse_place_ref, place_ref_of
+from app.services.place_store import update_place
+
+logger = logging.getLogger(__name__)
+
+# 큐 최대 크기 (넘으면 우선순위가 가장 낮은 장소를 버림)
+TOUR_DETAIL_QUEUE_MAX = 5000
+# 보강 실패(오류/빈 응답) 후 같은 장소를 다시 시도하기까지의 시간
+TOUR_DETAIL_RETRY_AFTER = timedelta(hours=6)
+# 연속 실패 시 최대 대기 (초)
+TOUR_DETAIL_MAX_BACKOFF_SECONDS = 600
+
+
+def tour_ref(doc: Dict[str, Any]) -> Optional[Tuple[str, Optional[str]]]:
+    """places 문서 → (TourAPI contentid, contenttypeid) (TourAPI 장소가 아니면 None, 타입을 모르면 None)"""
+    content_id = (doc.get("provider_ids") or {}).get("tour")
+    if not content_id:
+        provider, raw_id = parse_place_ref(place_ref_of(doc) or "")
+        if provider == "tour" and raw_id.isdigit():
+            content_id = raw_id
+    if not content_id:
+        return None
+    # TourAPI 정규화 시 category에 contenttypeid가 들어감 (Kakao 병합 장소는 Kakao 카테고리)
+    category = str(doc.get("category") or "")
+    content_type_id = category if category in TOUR_CONTENT_TYPE_IDS else None
+    return str(content_id), content_type_id
+
+
+def needs_detail(doc: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """상세 보강이 필요한 TourAPI 장소인지 (이미 보강했거나 재시도 대기 중이면 False)"""
+    if doc.get("detail_fetched_at") or not tour_ref(doc):
+        return False
+    attempted_at = doc.get("detail_attempted_at")
+    now = now or datetime.utcnow()
+    return not (isinstance(attempted_at, datetime) and now - attempted_at < TOUR_DETAIL_RETRY_AFTER)
+
+
+@dataclass
+class _QueueEntry:
+    place_id: str
+    hits: int
+    seq: int
+
+
+class TourDetailRefresher:
+    """TourAPI 상세 보강 큐 + 백그라운드 워커 (프로세스당 스레드 1개)"""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: Dict[str, _QueueEntry] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0
+        # 보강 중인 place_id (그 사이 들어온 조회로 중복 보강하지 않도록)
+        self._inflight: Optional[str] = None
+        # TourAPI 상세 조회(detailCommon2 / detailIntro2)는 PlaceService 것을 그대로 사용 (워커에서 생성)
+        self._place_service = None
+        self.refreshed = 0
+        self.failed = 0
+
+    def schedule(self, doc: Dict[str, Any]) -> bool:
+        """상세 보강이 필요하면 큐에 추가 (이미 있으면 조회 횟수만 증가). 추가/갱신 여부 반환"""
+        place_id = doc.get("place_id")
+        if not place_id or not needs_detail(doc):
+            return False
+        with self._cond:
+            if place_id == self._inflight:
+                return False
+            entry = self._queue.get(place_id)
+            if entry:
+                entry.hits += 1
+            else:
+                if len(self._queue) >= TOUR_DETAIL_QUEUE_MAX:
+                    lowest = min(self._queue.values(), key=lambda e: (e.hits, -e.seq))
+                    del self._queue[lowest.place_id]
+                self._queue[place_id] = _QueueEntry(place_id=str(place_id), hits=1, seq=next(self._seq))
+            self._ensure_worker_locked()
+            self._cond.notify()
+        return True
+
+    def _ensure_worker_locked(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="tour-detail-refresh", daemon=True)
+        self._thread.start()
+
+    def _pop_locked(self) -> Optional[_QueueEntry]:
+        if not self._queue:
+            return None
+        # 조회 횟수 많은 순, 같으면 먼저 들어온 순
+        entry = max(self._queue.values(), key=lambda e: (e.hits, -e.seq))
+        del self._queue[entry.place_id]
+        return entry
+
+    def _run(self) -> None:
+        interval = 1.0 / max(settings.TOUR_DETAIL_REFRESH_QPS, 1e-3)
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                entry = self._pop_locked()
+                self._inflight = entry.place_id
+
+            started = time.monotonic()
+            ok = self.refresh(entry)
+            with self._cond:
+                self._inflight = None
+            if ok is None:
+                # 조회하지 않음 (이미 보강됨 / 문서 없음): 대기 없이 다음 장소
+                continue
+            if ok:
+                self._failures = 0
+                delay = interval
+            else:
+                self._failures += 1
+                delay = max(interval, min(2 ** self._failures, TOUR_DETAIL_MAX_BACKOFF_SECONDS))
+            time.sleep(max(delay - (time.monotonic() - started), 0.0))
+
+    def refresh(self, entry: _QueueEntry) -> Optional[bool]:
+        """
+        장소 1건 상세 보강 (DB 저장 + 메모리 인덱스 반영).
+        - 기존 값은 덮어쓰지 않고 비어 있는 필드만 채움
+        - TourAPI를 호출했으면 성공 여부, 호출하지 않았으면 None 반환
+        """
+        places_col = get_database().places
+        try:
+            doc = places_col.find_one({"place_id": entry.place_id}, {"_id": 0})
+        except Exception as e:
+            logger.warning(f"TourAPI 상세 보강 대상 조회 실패 (place_id={entry.place_id}): {e}")
+            return None
+        if not doc or not needs_detail(doc):
+            return None
+        content_id, content_type_id = tour_ref(doc)
+
+        if self._place_service is None:
+            from app.services.place_service import PlaceService
+
+            self._place_service = PlaceService()
+        service = self._place_service
+        try:
+            item = asyncio.run(service._fetch_tour_detail(content_id, content_type_id))
+        except Exception as e:
+            logger.warning(f"TourAPI 상세 보강 실패 (contentid={content_id}): {e}")
+            item = None
+
+        try:
+            if not item:
+                self.failed += 1
+                # 표시 필드와 무관한 필드라 직접 갱신
+                places_col.update_one(
+                    {"place_id": entry.place_id},
+                    {"$set": {"detail_attempted_at": datetime.utcnow()}},
+                )
+                return False
+
+            detail = service.normalizer.from_tour_api(item).to_dict()
+            updates = {
+                key: value
+                for key, value in detail.items()
+                if key not in ("id", "place_id", "provider_ids") and value not in (None, "") and not doc.get(key)
+            }
+            updates["detail_fetched_at"] = datetime.utcnow()
+            unset = ("detail_attempted_at",) if "detail_attempted_at" in doc else ()
+            update_place(doc, updates, places_col, unset=unset)
+            self.refreshed += 1
+            return True
+        except Exception as e:
+            logger.warning(f"TourAPI 상세 보강 저장 실패 (place_id={entry.place_id}): {e}")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+        }
+
+
+tour_detail_refresher = TourDetailRefresher()
@@ -1,12 +1,19 @@
 import random
 from datetime import datetime
 from typing import Dict, Any, Optional, List
+from bson import ObjectId
+from bson.errors import InvalidId
 from app.api.tour_api import TourAPI
 from app.api.kakao_api import KakaoAPI
 from app.core.mongodb import get_database
 from app.core.config import settings
+from app.core.place_display import DISPLAY_FIELDS_VERSION, DISPLAY_VERSION_FIELD, ensure_display_fields
+from app.core.utils import encode_cursor, decode_cursor
 from app.models.place_models import PlaceNormalizer
 from app.services.google_places_service import google_places_service, normalize_place_name_for_google
+from app.services.place_id_router import place_id_router
+from app.services.place_store import upsert_place
+from app.services.ranking import rank_places
 
 # 메인 화면 카테고리별 장소 조회 시 요청마다 다른 지역 사용 (다양한 결과)
 # TourAPI: 공공데이터 관광 API 지역코드 (1=서울, 6=부산, 31=경기, 32=강원, 39=제주 등)
@@ -23,6 +30,12 @@ FEATURED_PLACE_IDS: Dict[str, List[str]] = {
     "travel_course": [],
 }
 
+# 여행 계획 목록(요약 보기)에서 반환할 필드 (items 배열 대신 items_count 제공)
+PLAN_SUMMARY_FIELDS = ["user_id", "title", "description", "start_date", "end_date", "created_at", "updated_at"]
+
+# 여행 계획 목록 view
+PLAN_LIST_VIEWS = ("full", "summary")
+
 class TourService:
     """여행 서비스 로직"""
     
@@ -48,81 +61,58 @@ class TourService:
         db = get_database()
         places_col = db.places
 
-        docs = list(places_col.find({"place_id": {"$in": ids}}))
-        if not docs:
-            logger.warning(f"No featured places found in DB for section_type={section_type}")
-            return None
-
-        featured: List[Dict[str, Any]] = []
-        for doc in docs:
-            if not isinstance(doc, dict):
-                continue
-            doc.pop("_id", None)
-            item = dict(doc)
-
-            # 이미지 우선순위: Google 사진 > 기존 image > 기존 imageUrl
-            google_thumb = None
-            google_photos = item.get("google_photos") or []
-            if isinstance(google_photos, list) and google_photos:
-                first = google_photos[0]
-                if isinstance(first, dict):
-                    google_thumb = first.get("url") or google_thumb
-            base_image = item.get("image")
-            existing_image_url = item.get("imageUrl")
-            image_url = google_thumb or base_image or existing_image_url
-            if image_url:
-                item["imageUrl"] = image_url
-            else:
-                # 이미지가 전혀 없으면 메인 HOT 섹션에서는 사용하지 않음
-                continue
-
-            if "google_rating" in item and "googleRating" not in item:
-                item["googleRating"] = item.get("google_rating")
-            if "google_ratings_total" in item and "googleRatingsTotal" not in item:
-                item["googleRatingsTotal"] = item.get("google_ratings_total")
-
-            # 품질 필터: 평점 3 이상, 리뷰 10개 이상
-            rating_raw = item.get("googleRating")
-            total_raw = item.get("googleRatingsTotal")
-            try:
-                rating_val = float(rating_raw) if rating_raw is not None else 0.0
-            except (TypeError, ValueError):
-                rating_val = 0.0
-            try:
-                total_val = int(total_raw) if total_raw is not None else 0
-            except (TypeError, ValueError):
-                total_val = 0
-
-            if rating_val < 3.0 or total_val < 10:
-                # 최소 품질 기준 미달 시 Featured에서 제외
-                continue
-
-            featured.append(item)
-
+        # 이미지 URL은 저장된 원본 출처 → 응답용 프록시 URL로 변환
+        featured = [ensure_display_fields(doc) for doc in places_col.aggregate(self._featured_places_pipeline(ids, limit))]
         if not featured:
+            logger.warning(f"No featured places found in DB for section_type={section_type}")
             return None
+        # 품질 필터/샘플링은 aggregation에서, 최종 순서는 섹션 랭킹 가중치로
+        return rank_places(featured, "section")
 
-        def _score(p: Dict[str, Any]) -> tuple[float, int]:
-            rating = p.get("googleRating") or 0.0
-            total = p.get("googleRatingsTotal") or 0
-            try:
-                rating_f = float(rating)
-            except (TypeError, ValueError):
-                rating_f = 0.0
-            try:
-                total_i = int(total)
-            except (TypeError, ValueError):
-                total_i = 0
-            return (rating_f, total_i)
-
-        # 품질 기준으로 정렬한 뒤, 상위 후보들 중에서 섞어서 다양하게 노출
-        featured.sort(key=_score, reverse=True)
-        # 상위 2배 범위 안에서 랜덤 샘플링 (후보가 많을 때만)
-        import random as _random
-        top_n = featured[: max(limit * 2, limit)]
-        if len(top_n) <= limit:
-            return top_n
-        return _random.sample(top_n, k=limit)
+    @staticmethod
+    def _featured_places_pipeline(ids: List[str], limit: int) -> List[Dict[str, Any]]:
+        """
+        Featured 장소 선정 aggregation (places.place_id 인덱스 사용).
+        match → 품질 필터 → 품질순 정렬 → 상위 2배 안에서 $sample
+        - 현재 버전 문서는 저장 시 계산된 imageUrl / googleRating / googleRatingsTotal 그대로 사용
+        - 아직 일괄 재계산 전인 문서(display_version이 다름)는 원본 필드(google_rating 등)로 계산
+        """
+        current = {"$eq": [f"${DISPLAY_VERSION_FIELD}", DISPLAY_FIELDS_VERSION]}
+
+        def present(path: str) -> Dict[str, Any]:
+            return {"$ne": [{"$ifNull": [path, ""]}, ""]}
+
+        def number(path: str) -> Dict[str, Any]:
+            return {"$convert": {"input": path, "to": "double", "onError": None, "onNull": None}}
+
+        return [
+            {"$match": {"place_id": {"$in": ids}}},
+            {"$addFields": {
+                "_featured_image": {"$cond": [
+                    current,
+                    present("$imageUrl"),
+                    {"$or": [
+                        present({"$arrayElemAt": ["$google_photos.url", 0]}),
+                        present("$image"),
+                        present("$imageUrl"),
+                    ]},
+                ]},
+                "_featured_rating": {"$cond": [current, "$googleRating", number("$google_rating")]},
+                "_featured_ratings_total": {"$cond": [current, "$googleRatingsTotal", number("$google_ratings_total")]},
+            }},
+            # 이미지가 없거나 최소 품질 기준(평점 3 이상, 리뷰 10개 이상) 미달 시 제외
+            {"$match": {
+                "_featured_image": True,
+                "_featured_rating": {"$gte": 3.0},
+                "_featured_ratings_total": {"$gte": 10},
+            }},
+            {"$sort": {"_featured_rating": -1, "_featured_ratings_total": -1}},
+            # 품질 상위 후보(limit의 2배) 안에서 섞어서 다양하게 노출
+            {"$limit": max(limit * 2, limit)},
+            {"$sample": {"size": limit}},
+            {"$sort": {"_featured_rating": -1, "_featured_ratings_total": -1}},
+            {"$project": {"_id": 0, "_featured_image": 0, "_featured_rating": 0, "_featured_ratings_total": 0}},
+        ]
     
     async def refresh_section(self, section_type: str, limit: int = 6) -> Dict[str, Any]:
         """섹션 데이터 새로고침 (설정에 따라 TourAPI 또는 KakaoAPI 사용)"""
@@ -242,26 +232,8 @@ class TourService:
         places = []
         for item in raw_places:
             try:
-                place = PlaceNormalizer.from_tour_api(item)
-                place_dict = place.to_dict()
-
-                # 공통 표시 필드 추가 (이미지 우선순위: Google > Tour)
-                google_thumb = None
-                google_photos = place_dict.get("google_photos") or []
-                if isinstance(google_photos, list) and google_photos:
-                    first = google_photos[0]
-                    if isinstance(first, dict):
-                        google_thumb = first.get("url") or google_thumb
-                base_image = place_dict.get("image")
-                image_url = google_thumb or base_image
-                if image_url:
-                    place_dict["imageUrl"] = image_url
-                if "google_rating" in place_dict:
-                    place_dict["googleRating"] = place_dict.get("google_rating")
-                if "google_ratings_total" in place_dict:
-                    place_dict["googleRatingsTotal"] = place_dict.get("google_ratings_total")
-
-                places.append(place_dict)
+                # 공통 표시 필드 포함 (app.core.place_display)
+                places.append(ensure_display_fields(PlaceNormalizer.from_tour_api(item).to_dict()))
             except Exception as e:
                 logger.warning(f"Failed to normalize place: {e}, item: {item}")
                 continue
@@ -271,21 +243,10 @@ class TourService:
         if places_with_image:
             places = places_with_image
 
-        # 평점/리뷰 수 기준 정렬 (내림차순) - 값이 없으면 0으로 간주
-        def _score(p: Dict[str, Any]) -> tuple[float, int]:
-            rating = p.get("googleRating") or 0.0
-            total = p.get("googleRatingsTotal") or 0
-            try:
-                rating_f = float(rating)
-            except (TypeError, ValueError):
-                rating_f = 0.0
-            try:
-                total_i = int(total)
-            except (TypeError, ValueError):
-                total_i = 0
-            return (rating_f, total_i)
-
-        places.sort(key=_score, reverse=True)
+        # 평점(베이지안 보정)/리뷰 수/이미지 기준 정렬 (내림차순)
+        places = rank_places(places, "section")
+        # 상세 조회 시 provider를 바로 찾도록 ID 라우팅 기록
+        place_id_router.register(places)
         logger.info(f"Extracted {len(places)} places (normalized, filtered for image)")
         
         return {
@@ -356,26 +317,8 @@ class TourService:
         places = []
         for item in documents:
             try:
-                place = PlaceNormalizer.from_kakao_api(item)
-                place_dict = place.to_dict()
-
-                # 공통 표시 필드 추가 (이미지 우선순위: Google > Kakao)
-                google_thumb = None
-                google_photos = place_dict.get("google_photos") or []
-                if isinstance(google_photos, list) and google_photos:
-                    first = google_photos[0]
-                    if isinstance(first, dict):
-                        google_thumb = first.get("url") or google_thumb
-                base_image = place_dict.get("image")
-                image_url = google_thumb or base_image
-                if image_url:
-                    place_dict["imageUrl"] = image_url
-                if "google_rating" in place_dict:
-                    place_dict["googleRating"] = place_dict.get("google_rating")
-                if "google_ratings_total" in place_dict:
-                    place_dict["googleRatingsTotal"] = place_dict.get("google_ratings_total")
-
-                places.append(place_dict)
+                # 공통 표시 필드 포함 (app.core.place_display)
+                places.append(ensure_display_fields(PlaceNormalizer.from_kakao_api(item).to_dict()))
             except Exception as e:
                 logger.warning(f"Failed to normalize place: {e}, item: {item}")
                 continue
@@ -385,21 +328,10 @@ class TourService:
         if places_with_image:
             places = places_with_image
 
-        # 평점/리뷰 수 기준 정렬 (내림차순) - 값이 없으면 0으로 간주
-        def _score_kakao(p: Dict[str, Any]) -> tuple[float, int]:
-            rating = p.get("googleRating") or 0.0
-            total = p.get("googleRatingsTotal") or 0
-            try:
-                rating_f = float(rating)
-            except (TypeError, ValueError):
-                rating_f = 0.0
-            try:
-                total_i = int(total)
-            except (TypeError, ValueError):
-                total_i = 0
-            return (rating_f, total_i)
-
-        places.sort(key=_score_kakao, reverse=True)
+        # 평점(베이지안 보정)/리뷰 수/이미지 기준 정렬 (내림차순)
+        places = rank_places(places, "section")
+        # 상세 조회 시 provider를 바로 찾도록 ID 라우팅 기록
+        place_id_router.register(places)
         logger.info(f"Extracted {len(places)} places (normalized, filtered for image)")
         
         return {
@@ -483,25 +415,93 @@ class TourService:
         except Exception as e:
             raise Exception(f"Failed to delete plan: {str(e)}")
     
-    async def get_user_plans(self, user_id: Optional[str], page: int = 1, limit: int = 10) -> Dict[str, Any]:
-        """사용자 여행 계획 목록"""
+    async def get_user_plans(
+        self,
+        user_id: Optional[str],
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        view: str = "full",
+        include_total: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        사용자 여행 계획 목록 (최신순).
+        - cursor가 있으면 (created_at, _id) 기준 keyset 페이지네이션 (skip 없이 인덱스 범위 탐색)
+          - created_at이 없는 기존 계획은 가장 뒤에 정렬되며, 그 구간은 _id만으로 이어감
+        - cursor가 없으면 기존 page 기반 조회 (첫 페이지 또는 하위 호환)
+        - view="summary"이면 items 대신 items_count만 반환 (목록 화면용)
+        - total은 cursor 없는 요청에서만 세고, cursor에 담아 다음 페이지에서 재사용 (워커 간 캐시 불일치 없음)
+        """
+        if view not in PLAN_LIST_VIEWS:
+            raise ValueError(f"view는 {', '.join(PLAN_LIST_VIEWS)} 중 하나여야 합니다")
         db = get_database()
-        query = {}
+        query: Dict[str, Any] = {}
         if user_id:
             query["user_id"] = user_id
-        
-        skip = (page - 1) * limit
-        plans = list(db.plans.find(query).skip(skip).limit(limit))
-        total = db.plans.count_documents(query)
-        
+
+        page_query = dict(query)
+        cursor_data = decode_cursor(cursor)
+        if cursor and not cursor_data:
+            raise ValueError("Invalid cursor")
+        if cursor_data:
+            try:
+                last_created = datetime.fromisoformat(cursor_data["c"]) if cursor_data.get("c") else None
+                last_id = ObjectId(cursor_data["i"])
+            except (KeyError, TypeError, ValueError, InvalidId):
+                raise ValueError("Invalid cursor")
+            if last_created is None:
+                # created_at 없는 구간 (내림차순에서 가장 뒤)
+                page_query["created_at"] = None
+                page_query["_id"] = {"$lt": last_id}
+            else:
+                page_query["$or"] = [
+                    {"created_at": {"$lt": last_created}},
+                    {"created_at": last_created, "_id": {"$lt": last_id}},
+                    {"created_at": None},
+                ]
+
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": page_query},
+            {"$sort": {"created_at": -1, "_id": -1}},
+        ]
+        if not cursor_data:
+            pipeline.append({"$skip": max(page - 1, 0) * limit})
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        pipeline.append({"$limit": limit + 1})
+        if view == "summary":
+            pipeline.append({"$project": {
+                **{field: 1 for field in PLAN_SUMMARY_FIELDS},
+                "items_count": {"$size": {"$ifNull": ["$items", []]}},
+            }})
+
+        plans = list(db.plans.aggregate(pipeline))
+        has_more = len(plans) > limit
+        plans = plans[:limit]
+
+        total = None
+        if include_total:
+            total = cursor_data.get("t") if cursor_data and cursor_data.get("t") is not None else db.plans.count_documents(query)
+
+        next_cursor = None
+        if has_more and plans:
+            last = plans[-1]
+            last_created = last.get("created_at")
+            next_cursor = encode_cursor({
+                "c": last_created.isoformat() if isinstance(last_created, datetime) else None,
+                "i": str(last["_id"]),
+                "t": total,
+            })
+
         for plan in plans:
             plan["_id"] = str(plan["_id"])
-        
+
         return {
             "plans": plans,
             "page": page,
             "limit": limit,
-            "total": total
+            "total": total,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
         }
 
     async def search_keyword_for_logistics(self, keyword: str, region: str = None) -> Optional[Dict[str, Any]]:
@@ -604,14 +604,7 @@ class TourService:
             db = get_database()
             pid = place_dict.get("place_id")
             if pid:
-                db.places.update_one(
-                    {"place_id": pid},
-                    {
-                        "$set": {**place_dict, "updated_at": datetime.utcnow()},
-                        "$setOnInsert": {"created_at": datetime.utcnow()},
-                    },
-                    upsert=True,
-                )
+                place_dict = upsert_place(place_dict, db.places)
         except Exception as e:
             logger.warning(f"Place prefetch upsert failed for {place_dict.get('place_id')}: {e}")
 
@@ -0,0 +1,139 @@
+"""
+지도 뷰포트 타일 캐시
+- 임의의 뷰포트(float bbox)를 표준 z/x/y 타일로 나눠 타일 단위로 DB 조회 결과를 캐시
+- 프로세스 메모리(짧은 TTL, LRU) → viewport_tiles 컬렉션(긴 TTL) 순으로 조회
+- 장소 upsert 시 그 장소가 속한 모든 줌의 타일 캐시를 무효화
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.geo import latlng_to_tile, to_float
+from app.core.mongodb import get_database
+
+logger = logging.getLogger(__name__)
+
+# 뷰포트 타일 줌 범위 / 요청당 최대 타일 수 (넘으면 줌을 낮춤)
+VIEWPORT_TILE_MIN_ZOOM = 6
+VIEWPORT_TILE_MAX_ZOOM = 16
+VIEWPORT_MAX_TILES = 24
+# 타일 하나에 담는 최대 장소 수
+TILE_PLACE_LIMIT = 200
+# 캐시 유지 시간: 메모리(다른 워커의 무효화를 반영하기 위해 짧게) / MongoDB
+TILE_MEMORY_TTL_SECONDS = 60
+TILE_DB_TTL_MINUTES = 60
+TILE_MEMORY_MAX_ENTRIES = 2000
+
+Tile = Tuple[int, int, int]
+
+
+def tile_id(tile: Tile) -> str:
+    return "{}/{}/{}".format(*tile)
+
+
+def tile_cache_key(tile: Tile, category: Optional[str]) -> str:
+    return f"{tile_id(tile)}:{(category or '').strip().lower()}"
+
+
+class ViewportTileCache:
+    """타일 단위 뷰포트 결과 캐시 (메모리 + MongoDB)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # cache_key -> (만료 시각(monotonic), tile_id, places)
+        self._memory: "OrderedDict[str, Tuple[float, str, List[Dict[str, Any]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_memory(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if not entry:
+                return None
+            if entry[0] < time.monotonic():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return entry[2]
+
+    def _put_memory(self, key: str, tile: str, places: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._memory[key] = (time.monotonic() + TILE_MEMORY_TTL_SECONDS, tile, places)
+            self._memory.move_to_end(key)
+            while len(self._memory) > TILE_MEMORY_MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def get_many(self, tiles: List[Tile], category: Optional[str]) -> Dict[Tile, List[Dict[str, Any]]]:
+        """캐시된 타일 결과 (메모리 → MongoDB 순, 없는 타일은 결과에서 빠짐)"""
+        found: Dict[Tile, List[Dict[str, Any]]] = {}
+        pending: Dict[str, Tile] = {}
+        for tile in tiles:
+            key = tile_cache_key(tile, category)
+            places = self._get_memory(key)
+            if places is not None:
+                found[tile] = places
+            else:
+                pending[key] = tile
+
+        if pending:
+            try:
+                for doc in get_database().viewport_tiles.find(
+                    {"cache_key": {"$in": list(pending)}, "expires_at": {"$gt": datetime.utcnow()}},
+                    {"_id": 0, "cache_key": 1, "tile": 1, "places": 1},
+                ):
+                    tile = pending[doc["cache_key"]]
+                    found[tile] = doc.get("places") or []
+                    self._put_memory(doc["cache_key"], doc["tile"], found[tile])
+            except Exception as e:
+                logger.warning(f"뷰포트 타일 캐시 조회 실패: {e}")
+
+        self.hits += len(found)
+        self.misses += len(tiles) - len(found)
+        return found
+
+    def put(self, tile: Tile, category: Optional[str], places: List[Dict[str, Any]]) -> None:
+        key = tile_cache_key(tile, category)
+        self._put_memory(key, tile_id(tile), places)
+        try:
+            get_database().viewport_tiles.update_one(
+                {"cache_key": key},
+                {
+                    "$set": {
+                        "tile": tile_id(tile),
+                        "places": places,
+                        "expires_at": datetime.utcnow() + timedelta(minutes=TILE_DB_TTL_MINUTES),
+                    }
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"뷰포트 타일 캐시 저장 실패: {e}")
+
+    def invalidate_place(self, doc: Dict[str, Any]) -> None:
+        """장소가 속한 모든 줌의 타일 캐시 삭제 (카테고리별 캐시 포함)"""
+        lat, lng = to_float(doc.get("latitude")), to_float(doc.get("longitude"))
+        if lat is None or lng is None:
+            return
+        tiles = {
+            tile_id((zoom, *latlng_to_tile(lat, lng, zoom)))
+            for zoom in range(VIEWPORT_TILE_MIN_ZOOM, VIEWPORT_TILE_MAX_ZOOM + 1)
+        }
+        with self._lock:
+            for key in [k for k, entry in self._memory.items() if entry[1] in tiles]:
+                del self._memory[key]
+        try:
+            get_database().viewport_tiles.delete_many({"tile": {"$in": list(tiles)}})
+        except Exception as e:
+            logger.warning(f"뷰포트 타일 캐시 무효화 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"memory_entries": len(self._memory), "hits": self.hits, "misses": self.misses}
+
+
+viewport_tile_cache = ViewportTileCache()
@@ -45,11 +45,119 @@ def setup_cache_indexes():
         print("   - expires_at 필드 기준으로 24시간 후 자동 삭제")
         print("   - cache_key 인덱스로 빠른 검색 지원")
         
+        # 여행 계획 목록 keyset 페이지네이션용 인덱스 (user_id + 최신순)
+        db.plans.create_index(
+            [("user_id", 1), ("created_at", -1), ("_id", -1)],
+            name="user_created_at_id_index"
+        )
+        print("   - plans: user_id + created_at + _id 인덱스로 목록 페이지네이션 지원")
+        
+        # 장소 place_id 인덱스 (상세 조회 및 Featured aggregation $match 용)
+        db.places.create_index(
+            [("place_id", 1)],
+            name="place_id_index"
+        )
+        print("   - places: place_id 인덱스로 상세 조회 / Featured 섹션 집계 지원")
+        # 병합된 장소를 다른 provider ID로 상세 조회
+        db.places.create_index(
+            [("provider_ids.tour", 1)],
+            name="provider_ids_tour_index",
+            sparse=True
+        )
+        db.places.create_index(
+            [("provider_ids.kakao", 1)],
+            name="provider_ids_kakao_index",
+            sparse=True
+        )
+        print("   - places: provider_ids.tour / provider_ids.kakao 인덱스로 provider별 ID 상세 조회 지원")
+        db.places.create_index(
+            [("place_ref", 1)],
+            name="place_ref_index",
+            sparse=True
+        )
+        # 장소 ID → provider 라우팅 (검색/섹션 결과로 응답한 장소)
+        db.place_id_routes.create_index(
+            [("place_ref", 1)],
+            name="place_ref_index",
+            unique=True
+        )
+        db.place_id_routes.create_index(
+            [("place_id", 1)],
+            name="place_id_index"
+        )
+        db.place_id_routes.create_index(
+            [("expires_at", 1)],
+            name="expires_at_ttl",
+            expireAfterSeconds=0
+        )
+        print("   - places: place_ref 인덱스, place_id_routes: place_ref / place_id / TTL 인덱스로 ID → provider 라우팅")
+        
+        # 인기 검색어 집계 (자동완성)
+        db.search_queries.create_index(
+            [("query_key", 1)],
+            name="query_key_index",
+            unique=True
+        )
+        db.search_queries.create_index(
+            [("count", -1)],
+            name="count_index"
+        )
+        print("   - search_queries: query_key / count 인덱스로 인기 검색어 집계 지원")
+        
+        # 커서 기반 검색 세션 (남은 결과/중복 키, expires_at 이후 자동 삭제)
+        db.search_sessions.create_index(
+            [("expires_at", 1)],
+            name="expires_at_ttl",
+            expireAfterSeconds=0
+        )
+        db.search_sessions.create_index(
+            [("session_id", 1)],
+            name="session_id_index",
+            unique=True
+        )
+        print("   - search_sessions: 커서 검색 세션 TTL / session_id 인덱스")
+        
+        # 뷰포트 타일 캐시 (expires_at 이후 자동 삭제, 장소 변경 시 tile 기준 무효화)
+        db.viewport_tiles.create_index(
+            [("expires_at", 1)],
+            name="expires_at_ttl",
+            expireAfterSeconds=0
+        )
+        db.viewport_tiles.create_index(
+            [("cache_key", 1)],
+            name="cache_key_index",
+            unique=True
+        )
+        db.viewport_tiles.create_index(
+            [("tile", 1)],
+            name="tile_index"
+        )
+        # 타일 범위 조회용 좌표 인덱스
+        db.places.create_index(
+            [("latitude", 1), ("longitude", 1)],
+            name="lat_lng_index"
+        )
+        print("   - viewport_tiles: 타일 캐시 TTL / cache_key / tile 인덱스, places: 위경도 인덱스")
+
+        # 벡터 타일(MVT) 캐시
+        db.place_tiles.create_index(
+            [("expires_at", 1)],
+            name="expires_at_ttl",
+            expireAfterSeconds=0
+        )
+        db.place_tiles.create_index(
+            [("tile", 1)],
+            name="tile_index",
+            unique=True
+        )
+        print("   - place_tiles: 벡터 타일 캐시 TTL / tile 인덱스")
+        
         # 인덱스 확인
-        indexes = list(cache_collection.list_indexes())
-        print(f"\n현재 인덱스 목록:")
-        for idx in indexes:
-            print(f"   - {idx.get('name')}: {idx.get('key')}")
+        for collection in [cache_collection, db.plans, db.places, db.search_queries, db.search_sessions, db.viewport_tiles, db.place_tiles, db.place_id_routes]:
+            indexes = list(collection.list_indexes())
+            print(f"\n현재 인덱스 목록 ({collection.name}):")
+            for idx in indexes:
+                print(f"   - {idx.get('name')}: {idx.get('key')}")
         
     except Exception as e:
         print(f"❌ 오류 발생: {str(e)}")
@@ -28,6 +28,16 @@ export class HkClient extends BaseApiClient {
     });
   }
 
+  /**
+   * 홈 피드 (모든 섹션을 한 번에, 서버에서 미리 만든 스냅샷)
+   * - variant를 지정하지 않으면 랜덤, 응답의 variant를 다시 보내면 같은 구성
+   */
+  async getHomeFeed(variant?: number): Promise<any> {
+    const params: any = {};
+    if (variant !== undefined) params.variant = variant;
+    return this.get('/hk/home', params);
+  }
+
   /**
    * 장소 검색
    */
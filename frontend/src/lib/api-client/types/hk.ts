@@ -86,7 +86,9 @@ export interface PlansResponse {
   plans: Plan[];
   page: number;
   limit: number;
-  total: number;
+  total: number | null;
+  next_cursor?: string | null;
+  has_more?: boolean;
 }
 
 export interface ThemePlace {